@@ -4,12 +4,57 @@ Handles all game server data storage (players, professions, etc.)
 Separate from GenerationEngine - this is for game state only
 """
 
+import queue
 import sqlite3
+import threading
 import json
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; falls back to the stdlib json module
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string, accepting non-string keys like json.dumps."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Per-connection SQLite tuning: NORMAL sync is durable under WAL, temp tables
+# stay in memory, 64 MiB page cache and a 256 MiB memory map
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Idle connections kept open for reuse; extra ones are closed when returned
+SQLITE_POOL_SIZE = 8
+
+# Fields of a recipe dict, as add_recipe's arguments and add_recipes_bulk's keys
+RECIPE_FIELDS = ('recipe_id', 'name', 'profession', 'category', 'required_level', 'difficulty',
+                 'ingredients', 'result_item_name', 'result_item_type', 'result_item_data',
+                 'result_quantity', 'crafting_time', 'experience_gain')
+
+
+def _recipe_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Build a recipe dict from a row, parsing its inline JSON ingredients and result data."""
+    recipe = dict(row)
+    try:
+        recipe['ingredients'] = _loads(recipe['ingredients'])
+        recipe['result_item_data'] = _loads(recipe['result_item_data'])
+    except (ValueError, TypeError):
+        recipe['ingredients'] = []
+        recipe['result_item_data'] = {}
+    return recipe
+
 
 class GameDatabase:
     """Database manager for game server state."""
@@ -17,17 +62,75 @@ class GameDatabase:
     def __init__(self, db_path: str = "game_server.db"):
         """Initialize game database."""
         self.db_path = db_path
+        # journal_mode=WAL is persistent in the database file, so it only
+        # needs to be set on the first connection
+        self._wal_enabled = False
+        self._pool = queue.LifoQueue(maxsize=SQLITE_POOL_SIZE)
+        # Connection of the session() block open on each thread, if any
+        self._local = threading.local()
         self._init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection that can be handed between request threads."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        if not self._wal_enabled:
+            # Readers no longer block on writers, and commits skip the rollback journal
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_enabled = True
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     @contextmanager
     def _get_connection(self):
         """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        session_conn = getattr(self._local, "session_conn", None)
+        if session_conn is not None:
+            try:
+                yield session_conn
+            except BaseException:
+                # Don't leave a failed call's writes for the next commit in the session
+                if session_conn.in_transaction:
+                    session_conn.rollback()
+                raise
+            return
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
         try:
             yield conn
         finally:
-            conn.close()
+            # Methods commit their own writes; anything still open failed
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    @contextmanager
+    def session(self):
+        """Share one pooled connection across every call made inside the block."""
+        if getattr(self._local, "session_conn", None) is not None:
+            yield self
+            return
+
+        with self._get_connection() as conn:
+            self._local.session_conn = conn
+            try:
+                yield self
+            finally:
+                self._local.session_conn = None
+
+    def close(self):
+        """Close every pooled connection."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
 
     def _init_database(self):
         """Initialize database tables."""
@@ -168,6 +271,13 @@ class GameDatabase:
                 )
             """)
 
+            # Indices for the per-player and per-profession lookups; the
+            # UNIQUE constraints already index username and the player_* pairs
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_inventory_player_acquired "
+                           "ON player_inventory(player_id, acquired_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_recipes_profession_level "
+                           "ON recipes(profession, required_level)")
+
             conn.commit()
 
     def _migrate_database(self, cursor):
@@ -326,8 +436,8 @@ class GameDatabase:
             if not set_clauses:
                 return False
 
-            set_clauses.append("updated_at = ?")
-            params.append(datetime.now())
+            # Same UTC format as the column default
+            set_clauses.append("updated_at = CURRENT_TIMESTAMP")
             params.append(player_id)
 
             query = f"UPDATE player_stats SET {', '.join(set_clauses)} WHERE player_id = ?"
@@ -425,7 +535,7 @@ class GameDatabase:
                 cursor.execute("""
                     INSERT INTO player_inventory (player_id, item_name, item_type, quantity, data, weight, durability, max_durability)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (player_id, item_name, item_type, quantity, json.dumps(item_data), weight, durability, max_durability))
+                """, (player_id, item_name, item_type, quantity, _dumps(item_data), weight, durability, max_durability))
 
                 conn.commit()
                 return cursor.lastrowid
@@ -443,18 +553,19 @@ class GameDatabase:
                     WHERE id = ? AND player_id = ?
                 """, (inventory_id, player_id))
             else:
-                # Reduce quantity
-                cursor.execute("""
-                    UPDATE player_inventory
-                    SET quantity = quantity - ?
-                    WHERE id = ? AND player_id = ? AND quantity >= ?
-                """, (quantity, inventory_id, player_id, quantity))
-
-                # Remove if quantity is 0 or less
+                # Taking the whole stack removes it: one statement
                 cursor.execute("""
                     DELETE FROM player_inventory
-                    WHERE id = ? AND player_id = ? AND quantity <= 0
-                """, (inventory_id, player_id))
+                    WHERE id = ? AND player_id = ? AND quantity = ?
+                """, (inventory_id, player_id, quantity))
+
+                if cursor.rowcount == 0:
+                    # Otherwise reduce a stack that holds more than that
+                    cursor.execute("""
+                        UPDATE player_inventory
+                        SET quantity = quantity - ?
+                        WHERE id = ? AND player_id = ? AND quantity > ?
+                    """, (quantity, inventory_id, player_id, quantity))
 
             conn.commit()
             return cursor.rowcount > 0
@@ -523,11 +634,19 @@ class GameDatabase:
                 INSERT INTO player_professions (player_id, profession_id, level, experience)
                 VALUES (?, ?, ?, ?)
                 ON CONFLICT(player_id, profession_id)
-                DO UPDATE SET level = ?, experience = ?, updated_at = ?
-            """, (player_id, profession_id, level, experience, level, experience, datetime.now()))
+                DO UPDATE SET level = ?, experience = ?, updated_at = CURRENT_TIMESTAMP
+            """, (player_id, profession_id, level, experience, level, experience))
+
+            # lastrowid is only this row's on insert; a pooled connection
+            # keeps reporting its previous insert after an update
+            cursor.execute("""
+                SELECT id FROM player_professions
+                WHERE player_id = ? AND profession_id = ?
+            """, (player_id, profession_id))
+            profession_row_id = cursor.fetchone()['id']
 
             conn.commit()
-            return cursor.lastrowid
+            return profession_row_id
 
     def update_player_profession(self, player_id: int, profession_id: str,
                                 level: Optional[int] = None,
@@ -550,8 +669,7 @@ class GameDatabase:
             if not set_clauses:
                 return False
 
-            set_clauses.append("updated_at = ?")
-            params.append(datetime.now())
+            set_clauses.append("updated_at = CURRENT_TIMESTAMP")
             params.extend([player_id, profession_id])
 
             query = f"""
@@ -575,11 +693,32 @@ class GameDatabase:
             cursor.execute("""
                 INSERT INTO generated_items (item_name, item_type, item_data)
                 VALUES (?, ?, ?)
-            """, (item_name, item_type, json.dumps(item_data)))
+            """, (item_name, item_type, _dumps(item_data)))
 
             conn.commit()
             return cursor.lastrowid
 
+    def save_generated_items_bulk(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[int]:
+        """Save (item_name, item_type, item_data) tuples in one transaction; returns IDs in input order."""
+        if not items:
+            return []
+
+        rows = [(item_name, item_type, _dumps(item_data)) for item_name, item_type, item_data in items]
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO generated_items (item_name, item_type, item_data)
+                VALUES (?, ?, ?)
+            """, rows)
+
+            # The transaction holds the write lock, so the new rowids are contiguous
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+
+            conn.commit()
+            return list(range(last_id - len(rows) + 1, last_id + 1))
+
     def get_all_generated_items(self) -> List[Dict[str, Any]]:
         """Get all generated items."""
         with self._get_connection() as conn:
@@ -594,7 +733,7 @@ class GameDatabase:
             for row in cursor.fetchall():
                 item = dict(row)
                 try:
-                    item['data'] = json.loads(item['item_data'])
+                    item['data'] = _loads(item['item_data'])
                 except:
                     item['data'] = {}
                 items.append(item)
@@ -633,10 +772,10 @@ class GameDatabase:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT INTO settings (key, value, updated_at)
-                VALUES (?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = ?, updated_at = ?
-            """, (key, value, datetime.now(), value, datetime.now()))
+                INSERT INTO settings (key, value)
+                VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+            """, (key, value))
             conn.commit()
             return True
 
@@ -665,12 +804,39 @@ class GameDatabase:
                                    result_quantity, crafting_time, experience_gain)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (recipe_id, name, profession, category, required_level, difficulty,
-                  json.dumps(ingredients), result_item_name, result_item_type,
-                  json.dumps(result_item_data), result_quantity, crafting_time, experience_gain))
+                  _dumps(ingredients), result_item_name, result_item_type,
+                  _dumps(result_item_data), result_quantity, crafting_time, experience_gain))
 
             conn.commit()
             return cursor.lastrowid
 
+    def add_recipes_bulk(self, recipes: List[Dict[str, Any]]) -> int:
+        """Add recipe dicts (keyed like add_recipe's arguments) in one transaction; returns how many were new."""
+        if not recipes:
+            return 0
+
+        rows = [
+            (recipe['recipe_id'], recipe['name'], recipe['profession'], recipe['category'],
+             recipe['required_level'], recipe['difficulty'], _dumps(recipe['ingredients']),
+             recipe['result_item_name'], recipe['result_item_type'], _dumps(recipe['result_item_data']),
+             recipe.get('result_quantity', 1), recipe.get('crafting_time', 5),
+             recipe.get('experience_gain', 10))
+            for recipe in recipes
+        ]
+
+        with self._get_connection() as conn:
+            changes = conn.total_changes
+            conn.executemany("""
+                INSERT INTO recipes (recipe_id, name, profession, category, required_level, difficulty,
+                                   ingredients, result_item_name, result_item_type, result_item_data,
+                                   result_quantity, crafting_time, experience_gain)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(recipe_id) DO NOTHING
+            """, rows)
+
+            conn.commit()
+            return conn.total_changes - changes
+
     def get_all_recipes(self) -> List[Dict[str, Any]]:
         """Get all recipes."""
         with self._get_connection() as conn:
@@ -683,18 +849,7 @@ class GameDatabase:
                 ORDER BY profession, required_level
             """)
 
-            recipes = []
-            for row in cursor.fetchall():
-                recipe = dict(row)
-                try:
-                    recipe['ingredients'] = json.loads(recipe['ingredients'])
-                    recipe['result_item_data'] = json.loads(recipe['result_item_data'])
-                except:
-                    recipe['ingredients'] = []
-                    recipe['result_item_data'] = {}
-                recipes.append(recipe)
-
-            return recipes
+            return [_recipe_from_row(row) for row in cursor.fetchall()]
 
     def get_recipes_by_profession(self, profession: str) -> List[Dict[str, Any]]:
         """Get recipes for a specific profession."""
@@ -709,18 +864,7 @@ class GameDatabase:
                 ORDER BY required_level
             """, (profession,))
 
-            recipes = []
-            for row in cursor.fetchall():
-                recipe = dict(row)
-                try:
-                    recipe['ingredients'] = json.loads(recipe['ingredients'])
-                    recipe['result_item_data'] = json.loads(recipe['result_item_data'])
-                except:
-                    recipe['ingredients'] = []
-                    recipe['result_item_data'] = {}
-                recipes.append(recipe)
-
-            return recipes
+            return [_recipe_from_row(row) for row in cursor.fetchall()]
 
     def get_recipe_by_id(self, recipe_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific recipe by ID."""
@@ -736,14 +880,7 @@ class GameDatabase:
 
             row = cursor.fetchone()
             if row:
-                recipe = dict(row)
-                try:
-                    recipe['ingredients'] = json.loads(recipe['ingredients'])
-                    recipe['result_item_data'] = json.loads(recipe['result_item_data'])
-                except:
-                    recipe['ingredients'] = []
-                    recipe['result_item_data'] = {}
-                return recipe
+                return _recipe_from_row(row)
             return None
 
     # ===================================================================
@@ -761,7 +898,8 @@ class GameDatabase:
             """, (player_id, recipe_id))
 
             conn.commit()
-            return cursor.lastrowid
+            # Already known: nothing was inserted, and lastrowid would be stale
+            return cursor.lastrowid if cursor.rowcount > 0 else 0
 
     def get_player_known_recipes(self, player_id: int) -> List[Dict[str, Any]]:
         """Get all recipes known by a player."""
@@ -778,18 +916,7 @@ class GameDatabase:
                 ORDER BY r.profession, r.required_level
             """, (player_id,))
 
-            recipes = []
-            for row in cursor.fetchall():
-                recipe = dict(row)
-                try:
-                    recipe['ingredients'] = json.loads(recipe['ingredients'])
-                    recipe['result_item_data'] = json.loads(recipe['result_item_data'])
-                except:
-                    recipe['ingredients'] = []
-                    recipe['result_item_data'] = {}
-                recipes.append(recipe)
-
-            return recipes
+            return [_recipe_from_row(row) for row in cursor.fetchall()]
 
     def increment_recipe_craft_count(self, player_id: int, recipe_id: str) -> bool:
         """Increment the times_crafted counter for a recipe."""
@@ -23,7 +23,7 @@ project_root = Path(__file__).parent.parent  # Go up one level from Game/ to R-G
 
 # Import all game logic from local src module (fully self-contained)
 from src import ContentGenerator, World, LivingNPC as NPC, LivingLocation as Location
-from game_database import GameDatabase
+from game_database import GameDatabase, RECIPE_FIELDS
 
 # Client folder is in the Game directory
 client_folder = Path(__file__).parent / "Client"
@@ -68,28 +68,26 @@ def initialize_starter_recipes():
         with open(recipes_file, 'r') as f:
             recipes_data = json.load(f)
 
-        total_loaded = 0
-        for profession_key, recipes in recipes_data.items():
+        recipes = []
+        for profession_recipes in recipes_data.values():
+            for recipe in profession_recipes:
+                missing = [field for field in RECIPE_FIELDS if field not in recipe]
+                if missing:
+                    print(f"Failed to load recipe {recipe.get('name', 'unknown')}: missing {', '.join(missing)}")
+                    continue
+                recipes.append({field: recipe[field] for field in RECIPE_FIELDS})
+
+        try:
+            total_loaded = database.add_recipes_bulk(recipes)
+        except Exception:
+            # One bad row rolls back the whole batch; load one at a time to skip just that recipe
+            total_loaded = 0
             for recipe in recipes:
                 try:
-                    database.add_recipe(
-                        recipe_id=recipe['recipe_id'],
-                        name=recipe['name'],
-                        profession=recipe['profession'],
-                        category=recipe['category'],
-                        required_level=recipe['required_level'],
-                        difficulty=recipe['difficulty'],
-                        ingredients=recipe['ingredients'],
-                        result_item_name=recipe['result_item_name'],
-                        result_item_type=recipe['result_item_type'],
-                        result_item_data=recipe['result_item_data'],
-                        result_quantity=recipe['result_quantity'],
-                        crafting_time=recipe['crafting_time'],
-                        experience_gain=recipe['experience_gain']
-                    )
+                    database.add_recipe(**recipe)
                     total_loaded += 1
                 except Exception as e:
-                    print(f"Failed to load recipe {recipe.get('name', 'unknown')}: {str(e)}")
+                    print(f"Failed to load recipe {recipe['name']}: {str(e)}")
 
         print(f"Successfully loaded {total_loaded} starter recipes")
 
@@ -471,8 +469,9 @@ def register_player():
         session['username'] = username
 
         # Get player data to return
-        player = database.get_player_by_id(player_id)
-        stats = database.get_player_stats(player_id)
+        with database.session():
+            player = database.get_player_by_id(player_id)
+            stats = database.get_player_stats(player_id)
 
         return jsonify({
             'success': True,
@@ -556,12 +555,13 @@ def get_current_player():
     database = get_db()
     player_id = session['player_id']
 
-    player = database.get_player_by_id(player_id)
-    if not player:
-        return jsonify({'error': 'Player not found'}), 404
+    with database.session():
+        player = database.get_player_by_id(player_id)
+        if not player:
+            return jsonify({'error': 'Player not found'}), 404
 
-    stats = database.get_player_stats(player_id)
-    inventory = database.get_player_inventory(player_id)
+        stats = database.get_player_stats(player_id)
+        inventory = database.get_player_inventory(player_id)
 
     return jsonify({
         'player': {
@@ -1581,8 +1581,8 @@ def get_master_players():
     """Get all players for admin viewing/editing."""
     database = get_db()
 
-    # Get all players from database
-    with database._get_connection() as conn:
+    # Get all players from database; the per-player lookups reuse the connection
+    with database.session(), database._get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT id, username, character_name, race, class, level,
@@ -1768,18 +1768,13 @@ def save_generated_items():
 
     try:
         database = get_db()
-        saved_count = 0
-        saved_ids = []
 
-        for item in items:
-            # Save to game database
-            item_name = item.get('name', 'Unknown Item')
-            item_type = item.get('type', 'misc')
-            item_data = item  # Store the entire item object as data
-
-            item_id = database.save_generated_item(item_name, item_type, item_data)
-            saved_ids.append(item_id)
-            saved_count += 1
+        # Store the entire item object as data, all in one transaction
+        saved_ids = database.save_generated_items_bulk([
+            (item.get('name', 'Unknown Item'), item.get('type', 'misc'), item)
+            for item in items
+        ])
+        saved_count = len(saved_ids)
 
         return jsonify({
             'success': True,
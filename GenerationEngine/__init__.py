@@ -4,8 +4,17 @@ R-Gen Generation Engine
 A powerful procedural content generation system for fantasy worlds.
 """
 
-from .src.content_generator import ContentGenerator
-from .src.database import DatabaseManager
-
 __version__ = "1.0.0"
 __all__ = ["ContentGenerator", "DatabaseManager"]
+
+
+def __getattr__(name):
+    # Lazy re-exports (PEP 562): the generator and database stacks are only
+    # imported when first used
+    if name == "ContentGenerator":
+        from .src.content_generator import ContentGenerator
+        return ContentGenerator
+    if name == "DatabaseManager":
+        from .src.database import DatabaseManager
+        return DatabaseManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,10 +13,51 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import io
 import json
+import os
+import random
+import shutil
 import sys
 from pathlib import Path
-from src.content_generator import ContentGenerator
+from src import listings
+from src.content_generator import ContentGenerator, ColumnarData
+from src.datafiles import PACKAGE_DATA_DIR
+from src.names import procedural_name
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+# Shared argparse choices
+FORMATS = ('json', 'pretty', 'text')
+EXPORT_FORMATS = ('json', 'xml', 'csv', 'sql', 'markdown', 'parquet')
+TABULAR_EXPORT_FORMATS = ('csv', 'sql', 'parquet')
+EXPORT_EXTENSIONS = {
+    'json': '.json',
+    'xml': '.xml',
+    'csv': '.csv',
+    'sql': '.sql',
+    'markdown': '.md',
+    'parquet': '.parquet',
+}
+BATCH_CONTENT_TYPES = ('item', 'npc', 'location')
+ANIMAL_CATEGORIES = ('wild_fauna', 'pet')
+FLORA_CATEGORIES = ('trees', 'plants', 'mushrooms', 'crops', 'vines')
+ENEMY_TYPES = ('minion', 'standard', 'elite', 'boss')
+QUEST_TYPES = ('fetch', 'kill', 'escort', 'explore', 'craft', 'deliver')
+ENCOUNTER_TYPES = ('combat', 'social', 'puzzle', 'trap')
+TRAP_TYPES = ('mechanical', 'magical', 'puzzle', 'environmental')
+GENDERS = ('male', 'female')
+ORGANIZATION_SIZES = ('small', 'medium', 'large')
+SEASONS = ('spring', 'summer', 'autumn', 'winter')
+TIMES_OF_DAY = ('dawn', 'morning', 'noon', 'afternoon', 'dusk', 'night')
+WEALTH_LEVELS = ('destitute', 'poor', 'modest', 'comfortable', 'wealthy', 'aristocratic')
 
 
 def format_item(item, indent=0):
@@ -326,13 +367,35 @@ def format_world(world):
     return "\n".join(lines)
 
 
+def dump_json(data):
+    """Serialize data to indented UTF-8 JSON bytes with a trailing newline (uses orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    # Same bytes as orjson: raw UTF-8 rather than \u escapes
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
+
+
 def output_data(data, format_type, output_file=None):
     """Output data in the specified format"""
-    if format_type == 'json':
-        output = json.dumps(data, indent=2)
-    elif format_type == 'pretty':
-        output = json.dumps(data, indent=2)
-    elif format_type == 'text':
+    if format_type in ('json', 'pretty'):
+        # JSON is written as bytes to skip a decode/re-encode round trip
+        payload = dump_json(data)
+        if output_file:
+            with open(output_file, 'wb') as f:
+                f.write(payload)
+            print(f"✅ Output saved to: {output_file}")
+        else:
+            stdout_buffer = getattr(sys.stdout, 'buffer', None)
+            if stdout_buffer is None:
+                # stdout replaced by a text-only stream (e.g. redirect_stdout)
+                sys.stdout.write(payload.decode('utf-8'))
+            else:
+                sys.stdout.flush()
+                stdout_buffer.write(payload)
+                stdout_buffer.flush()
+        return
+
+    if format_type == 'text':
         # Human-readable format
         if isinstance(data, list):
             if len(data) > 0:
@@ -385,6 +448,73 @@ def output_data(data, format_type, output_file=None):
         print(output)
 
 
+# Unseeded --count runs at or above this size are split across worker processes
+PARALLEL_MIN_COUNT = 1000
+
+# Per-process generator, built by _init_worker in each pool worker
+_worker_generator = None
+
+
+def _init_worker(data_dir):
+    """Build a private ContentGenerator for a pool worker process."""
+    global _worker_generator
+    _worker_generator = ContentGenerator(data_dir=data_dir)
+
+
+def _worker_generate_items(n, template, constraints):
+    return [_worker_generator.generate_item(template, constraints) for _ in range(n)]
+
+
+def _worker_generate_npcs(n, kwargs):
+    return [_worker_generator.generate_npc(**kwargs) for _ in range(n)]
+
+
+def _use_parallel(args, count):
+    """Whether a --count run should be fanned out to worker processes.
+
+    Seeded runs always stay serial so their output remains reproducible.
+    """
+    return args.seed is None and count >= PARALLEL_MIN_COUNT and (os.cpu_count() or 1) > 1
+
+
+def _generate_parallel(data_dir, worker, count, *worker_args):
+    """
+    Generate ``count`` results across a process pool.
+
+    Each worker process owns an independently seeded ContentGenerator, and
+    work is handed out in chunks to keep per-task overhead low.
+
+    Args:
+        data_dir: Data directory for the worker generators
+        worker: Module-level function taking (n, *worker_args)
+        count: Total number of results
+        *worker_args: Extra arguments passed to every worker call
+
+    Returns:
+        Flat list of generated results
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = os.cpu_count() or 1
+    chunk = max(1, count // (4 * workers))
+    sizes = [chunk] * (count // chunk)
+    if count % chunk:
+        sizes.append(count % chunk)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(data_dir,)) as executor:
+        futures = [executor.submit(worker, n, *worker_args) for n in sizes]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
+def _csv_list(value):
+    """Argparse type for comma-separated lists ("a, b,c" -> ['a', 'b', 'c'])."""
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
 def cmd_generate_item(args, generator):
     """Generate item(s)"""
     count = args.count if args.count else 1
@@ -404,13 +534,17 @@ def cmd_generate_item(args, generator):
     if args.max_value:
         constraints['max_value'] = args.max_value
     if args.exclude_materials:
-        constraints['exclude_materials'] = args.exclude_materials.split(',')
+        constraints['exclude_materials'] = args.exclude_materials
     if args.required_stats:
-        constraints['required_stats'] = args.required_stats.split(',')
+        constraints['required_stats'] = args.required_stats
 
     if count == 1:
         item = generator.generate_item(args.template, constraints if constraints else None)
         output_data(item, args.format, args.output)
+    elif _use_parallel(args, count):
+        items = _generate_parallel(args.data_dir, _worker_generate_items, count,
+                                   args.template, constraints if constraints else None)
+        output_data(items, args.format, args.output)
     else:
         items = []
         for _ in range(count):
@@ -425,7 +559,7 @@ def cmd_generate_npc(args, generator):
     count = args.count if args.count else 1
 
     # Handle professions argument (can be None, empty list, or list of professions)
-    profession_names = args.professions if hasattr(args, 'professions') else None
+    profession_names = args.professions
 
     if count == 1:
         npc = generator.generate_npc(
@@ -434,6 +568,13 @@ def cmd_generate_npc(args, generator):
             faction=args.faction
         )
         output_data(npc, args.format, args.output)
+    elif _use_parallel(args, count):
+        npcs = _generate_parallel(args.data_dir, _worker_generate_npcs, count, {
+            'profession_names': profession_names,
+            'race': args.race,
+            'faction': args.faction
+        })
+        output_data(npcs, args.format, args.output)
     else:
         npcs = []
         for _ in range(count):
@@ -511,64 +652,53 @@ def cmd_generate_world(args, generator):
     output_data(world, args.format, args.output)
 
 
-def cmd_list_templates(args, generator):
+def cmd_list_templates(args, generator=None):
     """List available templates"""
+    templates = listings.list_templates(args.data_dir)
+
     print("📋 Available Templates\n")
 
     print("Item Templates:")
-    if 'templates' in generator.items_config:
-        for template in generator.items_config['templates'].keys():
-            print(f"  • {template}")
-    else:
-        for template in generator.items_config.keys():
-            print(f"  • {template}")
+    for template in templates['item_templates']:
+        print(f"  • {template}")
 
     print("\nItem Sets:")
-    if 'item_sets' in generator.items_config:
-        for item_set in generator.items_config['item_sets'].keys():
-            print(f"  • {item_set}")
+    for item_set in templates['item_sets']:
+        print(f"  • {item_set}")
 
     print("\nNPC Professions:")
-    if 'archetypes' in generator.npcs_config:
-        for archetype in generator.npcs_config['archetypes'].keys():
-            print(f"  • {archetype}")
-    else:
-        for archetype in generator.npcs_config.keys():
-            print(f"  • {archetype}")
+    for profession in templates['professions']:
+        print(f"  • {profession}")
 
     print("\nLocation Templates:")
-    if 'templates' in generator.locations_config:
-        for template in generator.locations_config['templates'].keys():
-            print(f"  • {template}")
-    else:
-        for template in generator.locations_config.keys():
-            print(f"  • {template}")
+    for template in templates['location_templates']:
+        print(f"  • {template}")
 
 
-def cmd_list_races(args, generator):
+def cmd_list_races(args, generator=None):
     """List available races"""
     print("🧬 Available Races\n")
-    for race_id, race_data in generator.races_config['races'].items():
+    for race_id, race_data in listings.list_races(args.data_dir).items():
         print(f"  • {race_data['name']} ({race_id})")
         print(f"    Size: {race_data['size']}, Lifespan: {race_data['lifespan']['min']}-{race_data['lifespan']['max']} years")
         print(f"    Traits: {', '.join(race_data['traits'])}")
         print()
 
 
-def cmd_list_factions(args, generator):
+def cmd_list_factions(args, generator=None):
     """List available factions"""
     print("⚔️  Available Factions\n")
-    for faction_id, faction_data in generator.factions_config['factions'].items():
+    for faction_id, faction_data in listings.list_factions(args.data_dir).items():
         print(f"  • {faction_data['name']} ({faction_id})")
         print(f"    Type: {faction_data['type']}, Alignment: {faction_data['alignment']}")
         print(f"    {faction_data['description']}")
         print()
 
 
-def cmd_list_biomes(args, generator):
+def cmd_list_biomes(args, generator=None):
     """List available biomes"""
     print("🌍 Available Biomes\n")
-    for biome_id, biome_data in generator.biomes_config['biomes'].items():
+    for biome_id, biome_data in listings.list_biomes(args.data_dir).items():
         print(f"  • {biome_data['name']} ({biome_id})")
         print(f"    Climate: {biome_data['climate']}, Terrain: {biome_data['terrain']}")
         print(f"    Danger Level: {biome_data['danger_level']}")
@@ -576,27 +706,28 @@ def cmd_list_biomes(args, generator):
         print()
 
 
-def cmd_list_professions(args, generator):
-    """List available professions (archetypes)"""
+def cmd_list_professions(args, generator=None):
+    """List available professions and profession levels"""
+    profession_levels, professions = listings.list_professions(args.data_dir)
+
     print("👨‍💼 Available Professions\n")
 
     # Show profession levels first
-    if 'profession_levels' in generator.npcs_config:
-        print("📊 Profession Levels:")
-        for level_id, level_data in generator.npcs_config['profession_levels'].items():
-            print(f"  • {level_data['title']} (Rank {level_data['rank']})")
-            print(f"    Stat Multiplier: {level_data['stat_multiplier']}x, Skill Bonus: +{level_data['skill_bonus']}")
-            print(f"    {level_data['description']}")
-            print()
-        print("\n" + "="*60 + "\n")
+    print("📊 Profession Levels:")
+    for level_id, level_data in profession_levels.items():
+        print(f"  • {level_data['title']} (Rank {level_data['rank']})")
+        print(f"    Stat Multiplier: {level_data['stat_multiplier']}x, Skill Bonus: +{level_data['skill_bonus']}")
+        print(f"    {level_data['description']}")
+        print()
+    print("\n" + "="*60 + "\n")
 
     # Show all professions
     print("🎭 All Professions:\n")
-    for archetype_id, archetype_data in generator.npcs_config['archetypes'].items():
-        print(f"  • {archetype_data['title']} ({archetype_id})")
-        print(f"    Skills: {', '.join(archetype_data['skills'])}")
-        print(f"    Races: {', '.join(archetype_data.get('possible_races', ['any']))}")
-        print(f"    Factions: {', '.join(archetype_data.get('possible_factions', ['any']))}")
+    for profession_id, profession_data in professions.items():
+        print(f"  • {profession_data['title']} ({profession_id})")
+        print(f"    Skills: {', '.join(profession_data['skills'])}")
+        print(f"    Races: {', '.join(profession_data.get('possible_races', ['any']))}")
+        print(f"    Factions: {', '.join(profession_data.get('possible_factions', ['any']))}")
         print()
 
 
@@ -664,15 +795,39 @@ def cmd_generate_item_set(args, generator):
     output_data(item_set, args.format, args.output)
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_distribution(spec):
+    """
+    Parse a distribution spec like "Common:0.5,Rare:0.3,Epic:0.2".
+
+    Used as an argparse ``type`` so malformed specs are rejected before the
+    generator is built.
+
+    Args:
+        spec: Comma-separated ``label:weight`` pairs
+
+    Returns:
+        Tuple of (label, weight) pairs in the order given
+    """
+    pairs = []
+    for pair in spec.split(','):
+        key, sep, val = pair.partition(':')
+        key = key.strip()
+        if not sep or not key:
+            raise argparse.ArgumentTypeError(f"invalid distribution entry '{pair.strip()}' (expected LABEL:WEIGHT)")
+        try:
+            weight = float(val)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight for '{key}': '{val.strip()}'")
+        if weight < 0:
+            raise argparse.ArgumentTypeError(f"weight for '{key}' must not be negative")
+        pairs.append((key, weight))
+    return tuple(pairs)
+
+
 def cmd_generate_batch(args, generator):
     """Generate batch content with distribution"""
-    distribution = None
-    if args.distribution:
-        # Parse distribution like "Common:0.5,Rare:0.3,Epic:0.2"
-        distribution = {}
-        for pair in args.distribution.split(','):
-            key, val = pair.split(':')
-            distribution[key.strip()] = float(val.strip())
+    distribution = dict(args.distribution) if args.distribution else None
 
     batch = generator.generate_batch_with_distribution(
         content_type=args.content_type,
@@ -697,9 +852,10 @@ def cmd_generate_trap(args, generator):
     output_data(trap, args.format, args.output)
 
 
-def cmd_generate_procedural_name(args, generator):
+def cmd_generate_procedural_name(args, generator=None):
     """Generate procedural name"""
-    name = generator.generate_procedural_name(
+    name = procedural_name(
+        random.Random(args.seed),
         race=args.race,
         gender=args.gender
     )
@@ -720,23 +876,93 @@ def cmd_validate_thematic(args, generator):
     output_data(validation, args.format, args.output)
 
 
-def cmd_export(args, generator):
-    """Export data to various formats"""
-    # Load data from input file
-    with open(args.input, 'r') as f:
-        data = json.load(f)
-
-    # Export to requested format
-    if args.export_format == 'xml':
-        generator.export_to_xml(data, args.output)
-    elif args.export_format == 'csv':
-        generator.export_to_csv(data, args.output)
-    elif args.export_format == 'sql':
-        generator.export_to_sql(data, args.output, table_name=args.table_name or "game_content")
-    elif args.export_format == 'markdown':
-        generator.export_to_markdown(data, args.output, title=args.title or "Generated Content")
+def _export_formats(value):
+    """Argparse type for --export-format: one format or a comma-separated list."""
+    formats = tuple(dict.fromkeys(_csv_list(value)))
+    if not formats:
+        raise argparse.ArgumentTypeError("no export format given")
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"invalid export format: {', '.join(unknown)} (choose from {', '.join(EXPORT_FORMATS)})")
+    return formats
+
+
+def _export_one(generator, export_format, data, output, args):
+    """Write data to output in a single export format."""
+    if export_format == 'xml':
+        generator.export_to_xml(data, output)
+    elif export_format == 'csv':
+        generator.export_to_csv(data, output)
+    elif export_format == 'sql':
+        generator.export_to_sql(data, output, table_name=args.table_name or "game_content")
+    elif export_format == 'markdown':
+        generator.export_to_markdown(data, output, title=args.title or "Generated Content")
+    elif export_format == 'parquet':
+        generator.export_to_parquet(data, output)
     else:  # json
-        generator.export_to_json(data, args.output)
+        generator.export_to_json(data, output)
+
+
+def _copy_json(src, dst):
+    """Copy a JSON file byte-for-byte (an identity export needs no parse)."""
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+    print(f"Exported to {Path(dst)}")
+
+
+def cmd_export(args, generator):
+    """Export data to one or more formats"""
+    formats = args.export_format
+    output = Path(args.output)
+
+    def output_for(export_format):
+        # Several formats: one output per format named after --output
+        if len(formats) == 1:
+            return args.output
+        return str(output.with_suffix(EXPORT_EXTENSIONS[export_format]))
+
+    # Without --pretty, JSON output is the input unchanged, so copy it
+    # instead of parsing and re-serialising
+    copy_json = 'json' in formats and not args.pretty
+    parse_formats = [fmt for fmt in formats if not (fmt == 'json' and copy_json)]
+
+    tasks = []
+    if copy_json:
+        tasks.append((_copy_json, args.input, output_for('json')))
+
+    if parse_formats:
+        # Load data from input file
+        with open(args.input, 'r') as f:
+            records = json.load(f)
+
+        # Tabular formats share one column-oriented copy; when only tabular
+        # formats need the parsed data the record list is dropped so its
+        # per-row dicts can be freed before writing
+        columns = None
+        if isinstance(records, list) and any(fmt in TABULAR_EXPORT_FORMATS for fmt in parse_formats):
+            columns = ColumnarData.from_records(records)
+            if all(fmt in TABULAR_EXPORT_FORMATS for fmt in parse_formats):
+                records = None
+
+        for fmt in parse_formats:
+            data = columns if fmt in TABULAR_EXPORT_FORMATS and columns is not None else records
+            tasks.append((_export_one, generator, fmt, data, output_for(fmt), args))
+
+    if len(tasks) == 1:
+        func, *func_args = tasks[0]
+        func(*func_args)
+        return
+
+    # Write the formats concurrently
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(func, *func_args) for func, *func_args in tasks]
+        for future in futures:
+            future.result()
 
 
 def cmd_generate_spell(args, generator):
@@ -814,37 +1040,137 @@ def cmd_generate_npc_network(args, generator):
     output_data(network, args.format, args.output)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='R-Gen - Random Game Content Generator CLI',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Basic generation
-  %(prog)s generate-item --template weapon_melee
-  %(prog)s generate-npc --profession blacksmith
+# Generators built by main(), keyed by (data_dir, seed), so repeated calls in
+# one process (batch scripts, a REPL) load the data files once
+_GENERATOR_CACHE = {}
 
-  # With seed for reproducibility
-  %(prog)s generate-item --template weapon_melee --seed 42
 
-  # With constraints
-  %(prog)s generate-item --template weapon_melee --min-quality Excellent --min-rarity Rare --min-value 500
+def _get_generator(data_dir, seed):
+    """Return a ContentGenerator for data_dir/seed, reusing and reseeding a cached one."""
+    key = (data_dir, seed)
+    generator = _GENERATOR_CACHE.get(key)
+    if generator is None:
+        generator = _GENERATOR_CACHE[key] = ContentGenerator(data_dir=data_dir, seed=seed)
+    else:
+        # Back to the state of a freshly built generator
+        generator.reset_seed()
+    return generator
 
-  # Multiple items
-  %(prog)s generate-item --count 10
 
-  # Output to file
-  %(prog)s generate-item --template weapon_melee --output items.json --format json
-        """
-    )
+# Read-only commands whose output is cached on disk, with the data files
+# each one reads
+_CACHEABLE = {
+    'list-templates': ('item_templates.json', 'item_sets.json', 'professions.json', 'locations.json'),
+    'list-races': ('races.json',),
+    'list-factions': ('factions.json',),
+    'list-biomes': ('biomes.json',),
+    'list-professions': ('profession_levels.json', 'professions.json'),
+    'generate-name': (),
+}
 
-    parser.add_argument('--data-dir', default='data',
-                        help='Path to data directory (default: data)')
+# Cacheable commands that are random unless --seed is given
+_CACHE_NEEDS_SEED = frozenset({'generate-name'})
+
+
+def _cache_dir():
+    """Directory for cached command output (~/.cache/rgen by default)."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'rgen'
 
-    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
-    # Generate item command
-    item_parser = subparsers.add_parser('generate-item', help='Generate random item(s)')
+def _cache_path(args):
+    """
+    Cache file for a cacheable command invocation.
+
+    The key covers the command's options plus the size and mtime of every
+    data and source file its output depends on, so edits invalidate it.
+
+    Returns:
+        Path of the cache file, or None if an input file can't be read
+    """
+    files = [Path(args.data_dir) / name for name in _CACHEABLE[args.command]]
+    files += [Path(__file__), Path(listings.__file__), Path(procedural_name.__code__.co_filename)]
+    try:
+        stamps = []
+        for path in files:
+            st = path.stat()
+            stamps.append((str(path.resolve()), st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+
+    options = sorted((key, value) for key, value in vars(args).items() if key != 'no_cache')
+    key = json.dumps([options, stamps], default=str).encode('utf-8')
+    return _cache_dir() / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.txt"
+
+
+def _run_cached(handler, args):
+    """Run a read-only command, replaying its output from the on-disk cache when possible."""
+    cache_path = _cache_path(args)
+    if cache_path is not None:
+        try:
+            sys.stdout.write(cache_path.read_text(encoding='utf-8'))
+            return
+        except OSError:
+            pass
+
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            handler(args, None)
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+    if cache_path is not None:
+        # Write then rename so concurrent runs never see a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(buffer.getvalue(), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+
+# Subcommand name -> (handler, whether it needs a ContentGenerator)
+_DISPATCH = {
+    'generate-item': (cmd_generate_item, True),
+    'generate-npc': (cmd_generate_npc, True),
+    'generate-location': (cmd_generate_location, True),
+    'generate-animal': (cmd_generate_animal, True),
+    'generate-flora': (cmd_generate_flora, True),
+    'generate-world': (cmd_generate_world, True),
+    'list-templates': (cmd_list_templates, False),
+    'list-races': (cmd_list_races, False),
+    'list-factions': (cmd_list_factions, False),
+    'list-biomes': (cmd_list_biomes, False),
+    'list-professions': (cmd_list_professions, False),
+    'generate-loot': (cmd_generate_loot, True),
+    'generate-quest': (cmd_generate_quest, True),
+    'generate-recipe': (cmd_generate_recipe, True),
+    'generate-encounter': (cmd_generate_encounter, True),
+    'generate-item-modifiers': (cmd_generate_item_with_modifiers, True),
+    'generate-item-set': (cmd_generate_item_set, True),
+    'generate-batch': (cmd_generate_batch, True),
+    'generate-weather': (cmd_generate_weather, True),
+    'generate-trap': (cmd_generate_trap, True),
+    'generate-name': (cmd_generate_procedural_name, False),
+    'validate-thematic': (cmd_validate_thematic, True),
+    'generate-spell': (cmd_generate_spell, True),
+    'generate-spellbook': (cmd_generate_spellbook, True),
+    'generate-organization': (cmd_generate_organization, True),
+    'generate-weather-detailed': (cmd_generate_weather_detailed, True),
+    'generate-market': (cmd_generate_market, True),
+    'generate-quest-advanced': (cmd_generate_quest_advanced, True),
+    'generate-npc-network': (cmd_generate_npc_network, True),
+    'export': (cmd_export, True),
+}
+
+# All runnable subcommand names
+_COMMAND_NAMES = frozenset(_DISPATCH)
+
+
+def _add_generate_item_arguments(item_parser):
+    """Add generate-item arguments"""
     item_parser.add_argument('--template', help='Item template name (e.g., weapon_melee, armor, potion)')
     item_parser.add_argument('--count', type=int, help='Number of items to generate')
     item_parser.add_argument('--seed', type=int, help='Random seed for reproducible generation')
@@ -856,15 +1182,16 @@ Examples:
     item_parser.add_argument('--max-rarity', help='Maximum rarity')
     item_parser.add_argument('--min-value', type=int, help='Minimum gold value')
     item_parser.add_argument('--max-value', type=int, help='Maximum gold value')
-    item_parser.add_argument('--exclude-materials', help='Comma-separated list of materials to exclude')
-    item_parser.add_argument('--required-stats', help='Comma-separated list of required stats')
+    item_parser.add_argument('--exclude-materials', type=_csv_list, help='Comma-separated list of materials to exclude')
+    item_parser.add_argument('--required-stats', type=_csv_list, help='Comma-separated list of required stats')
 
-    item_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    item_parser.add_argument('--format', choices=FORMATS, default='text',
                              help='Output format (default: text)')
     item_parser.add_argument('--output', help='Output file path')
 
-    # Generate NPC command
-    npc_parser = subparsers.add_parser('generate-npc', help='Generate random NPC(s)')
+
+def _add_generate_npc_arguments(npc_parser):
+    """Add generate-npc arguments"""
     npc_parser.add_argument('--profession', '--professions', '--archetype', dest='professions',
                             nargs='*',
                             help='NPC profession(s) (e.g., blacksmith, merchant). Can specify multiple. Use empty list for no professions.')
@@ -872,256 +1199,377 @@ Examples:
     npc_parser.add_argument('--faction', help='Specific faction (e.g., kingdom_of_valor, merchants_guild)')
     npc_parser.add_argument('--count', type=int, help='Number of NPCs to generate')
     npc_parser.add_argument('--seed', type=int, help='Random seed for reproducible generation')
-    npc_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    npc_parser.add_argument('--format', choices=FORMATS, default='text',
                             help='Output format (default: text)')
     npc_parser.add_argument('--output', help='Output file path')
 
-    # Generate location command
-    location_parser = subparsers.add_parser('generate-location', help='Generate random location')
+
+def _add_generate_location_arguments(location_parser):
+    """Add generate-location arguments"""
     location_parser.add_argument('--template', help='Location template (e.g., tavern, forge, cave)')
     location_parser.add_argument('--biome', help='Specific biome (e.g., urban, temperate_forest, mountains)')
     location_parser.add_argument('--connections', action='store_true',
                                  help='Generate connected locations')
     location_parser.add_argument('--seed', type=int, help='Random seed for reproducible generation')
-    location_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    location_parser.add_argument('--format', choices=FORMATS, default='text',
                                  help='Output format (default: text)')
     location_parser.add_argument('--output', help='Output file path')
 
-    # Generate animal command
-    animal_parser = subparsers.add_parser('generate-animal', help='Generate random animal(s)')
-    animal_parser.add_argument('--category', choices=['wild_fauna', 'pet'],
+
+def _add_generate_animal_arguments(animal_parser):
+    """Add generate-animal arguments"""
+    animal_parser.add_argument('--category', choices=ANIMAL_CATEGORIES,
                                help='Animal category (wild_fauna or pet)')
     animal_parser.add_argument('--species', help='Specific species (e.g., Wolf, Dog, Cat, Horse)')
     animal_parser.add_argument('--habitat', help='Preferred habitat/biome')
     animal_parser.add_argument('--count', type=int, help='Number of animals to generate')
     animal_parser.add_argument('--seed', type=int, help='Random seed for reproducible generation')
-    animal_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    animal_parser.add_argument('--format', choices=FORMATS, default='text',
                                help='Output format (default: text)')
     animal_parser.add_argument('--output', help='Output file path')
 
-    # Generate flora command
-    flora_parser = subparsers.add_parser('generate-flora', help='Generate random flora')
-    flora_parser.add_argument('--category', choices=['trees', 'plants', 'mushrooms', 'crops', 'vines'],
+
+def _add_generate_flora_arguments(flora_parser):
+    """Add generate-flora arguments"""
+    flora_parser.add_argument('--category', choices=FLORA_CATEGORIES,
                              help='Flora category')
     flora_parser.add_argument('--species', help='Specific species (e.g., Oak, Pine, Moonflower)')
     flora_parser.add_argument('--habitat', help='Preferred habitat/biome')
     flora_parser.add_argument('--count', type=int, help='Number of flora to generate')
     flora_parser.add_argument('--seed', type=int, help='Random seed for reproducible generation')
-    flora_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    flora_parser.add_argument('--format', choices=FORMATS, default='text',
                              help='Output format (default: text)')
     flora_parser.add_argument('--output', help='Output file path')
 
-    # Generate world command
-    world_parser = subparsers.add_parser('generate-world', help='Generate complete world')
+
+def _add_generate_world_arguments(world_parser):
+    """Add generate-world arguments"""
     world_parser.add_argument('--size', type=int, required=True,
                               help='Number of locations in the world')
     world_parser.add_argument('--name', help='Name for the world')
     world_parser.add_argument('--seed', type=int, help='Random seed for reproducible generation')
-    world_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    world_parser.add_argument('--format', choices=FORMATS, default='text',
                               help='Output format (default: text)')
     world_parser.add_argument('--output', help='Output file path')
 
-    # List templates command
-    list_parser = subparsers.add_parser('list-templates', help='List all available templates')
-
-    # List races command
-    races_parser = subparsers.add_parser('list-races', help='List all available races')
-
-    # List factions command
-    factions_parser = subparsers.add_parser('list-factions', help='List all available factions')
-
-    # List biomes command
-    biomes_parser = subparsers.add_parser('list-biomes', help='List all available biomes')
-
-    # List professions command
-    professions_parser = subparsers.add_parser('list-professions', help='List all available professions and profession levels')
 
-    # Generate loot command
-    loot_parser = subparsers.add_parser('generate-loot', help='Generate a loot table')
-    loot_parser.add_argument('--enemy-type', choices=['minion', 'standard', 'elite', 'boss'], default='standard',
+def _add_generate_loot_arguments(loot_parser):
+    """Add generate-loot arguments"""
+    loot_parser.add_argument('--enemy-type', choices=ENEMY_TYPES, default='standard',
                             help='Enemy type (default: standard)')
     loot_parser.add_argument('--difficulty', type=int, default=1, help='Difficulty level 1-10 (default: 1)')
     loot_parser.add_argument('--min-items', type=int, default=1, help='Minimum items (default: 1)')
     loot_parser.add_argument('--max-items', type=int, default=3, help='Maximum items (default: 3)')
     loot_parser.add_argument('--biome', help='Biome type for material filtering')
-    loot_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    loot_parser.add_argument('--format', choices=FORMATS, default='text',
                             help='Output format (default: text)')
     loot_parser.add_argument('--output', help='Output file (default: stdout)')
     loot_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate quest command
-    quest_parser = subparsers.add_parser('generate-quest', help='Generate a quest')
-    quest_parser.add_argument('--quest-type', choices=['fetch', 'kill', 'escort', 'explore', 'craft', 'deliver'],
+
+def _add_generate_quest_arguments(quest_parser):
+    """Add generate-quest arguments"""
+    quest_parser.add_argument('--quest-type', choices=QUEST_TYPES,
                              help='Quest type (default: random)')
     quest_parser.add_argument('--difficulty', type=int, default=1, help='Quest difficulty 1-10 (default: 1)')
     quest_parser.add_argument('--faction', help='Faction offering the quest')
     quest_parser.add_argument('--location', help='Starting location ID')
-    quest_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    quest_parser.add_argument('--format', choices=FORMATS, default='text',
                              help='Output format (default: text)')
     quest_parser.add_argument('--output', help='Output file (default: stdout)')
     quest_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate recipe command
-    recipe_parser = subparsers.add_parser('generate-recipe', help='Generate a crafting recipe')
+
+def _add_generate_recipe_arguments(recipe_parser):
+    """Add generate-recipe arguments"""
     recipe_parser.add_argument('--for-item-template', help='Generate recipe for specific item template')
     recipe_parser.add_argument('--difficulty', type=int, default=1, help='Recipe difficulty 1-10 (default: 1)')
-    recipe_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    recipe_parser.add_argument('--format', choices=FORMATS, default='text',
                               help='Output format (default: text)')
     recipe_parser.add_argument('--output', help='Output file (default: stdout)')
     recipe_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate encounter command
-    encounter_parser = subparsers.add_parser('generate-encounter', help='Generate an encounter')
+
+def _add_generate_encounter_arguments(encounter_parser):
+    """Add generate-encounter arguments"""
     encounter_parser.add_argument('--party-level', type=int, default=1, help='Party level 1-20 (default: 1)')
     encounter_parser.add_argument('--biome', help='Biome where encounter occurs')
     encounter_parser.add_argument('--faction', help='Faction involved')
-    encounter_parser.add_argument('--encounter-type', choices=['combat', 'social', 'puzzle', 'trap'], default='combat',
+    encounter_parser.add_argument('--encounter-type', choices=ENCOUNTER_TYPES, default='combat',
                                   help='Encounter type (default: combat)')
-    encounter_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    encounter_parser.add_argument('--format', choices=FORMATS, default='text',
                                   help='Output format (default: text)')
     encounter_parser.add_argument('--output', help='Output file (default: stdout)')
     encounter_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate item with modifiers command
-    item_mod_parser = subparsers.add_parser('generate-item-modifiers', help='Generate item with prefix/suffix modifiers')
+
+def _add_generate_item_modifiers_arguments(item_mod_parser):
+    """Add generate-item-modifiers arguments"""
     item_mod_parser.add_argument('--template', help='Item template to use')
     item_mod_parser.add_argument('--num-modifiers', type=int, default=1, help='Number of modifiers 0-2 (default: 1)')
-    item_mod_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    item_mod_parser.add_argument('--format', choices=FORMATS, default='text',
                                 help='Output format (default: text)')
     item_mod_parser.add_argument('--output', help='Output file (default: stdout)')
     item_mod_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate item set command
-    itemset_parser = subparsers.add_parser('generate-item-set', help='Generate a themed item set')
+
+def _add_generate_item_set_arguments(itemset_parser):
+    """Add generate-item-set arguments"""
     itemset_parser.add_argument('--set-name', help='Name of the item set')
     itemset_parser.add_argument('--set-size', type=int, default=5, help='Number of items in set (default: 5)')
-    itemset_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    itemset_parser.add_argument('--format', choices=FORMATS, default='text',
                                help='Output format (default: text)')
     itemset_parser.add_argument('--output', help='Output file (default: stdout)')
     itemset_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate batch command
-    batch_parser = subparsers.add_parser('generate-batch', help='Generate batch content with distribution')
-    batch_parser.add_argument('--content-type', choices=['item', 'npc', 'location'], default='item',
+
+def _add_generate_batch_arguments(batch_parser):
+    """Add generate-batch arguments"""
+    batch_parser.add_argument('--content-type', choices=BATCH_CONTENT_TYPES, default='item',
                              help='Content type (default: item)')
     batch_parser.add_argument('--count', type=int, default=100, help='Number to generate (default: 100)')
-    batch_parser.add_argument('--distribution', help='Rarity distribution (e.g., "Common:0.5,Rare:0.3,Epic:0.2")')
-    batch_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='json',
+    batch_parser.add_argument('--distribution', type=_parse_distribution, help='Rarity distribution (e.g., "Common:0.5,Rare:0.3,Epic:0.2")')
+    batch_parser.add_argument('--format', choices=FORMATS, default='json',
                              help='Output format (default: json)')
     batch_parser.add_argument('--output', help='Output file (default: stdout)')
     batch_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate weather command
-    weather_parser = subparsers.add_parser('generate-weather', help='Generate weather and time conditions')
+
+def _add_generate_weather_arguments(weather_parser):
+    """Add generate-weather arguments"""
     weather_parser.add_argument('--biome', help='Biome type')
-    weather_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    weather_parser.add_argument('--format', choices=FORMATS, default='text',
                                help='Output format (default: text)')
     weather_parser.add_argument('--output', help='Output file (default: stdout)')
     weather_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate trap command
-    trap_parser = subparsers.add_parser('generate-trap', help='Generate a trap or puzzle')
+
+def _add_generate_trap_arguments(trap_parser):
+    """Add generate-trap arguments"""
     trap_parser.add_argument('--difficulty', type=int, default=1, help='Difficulty level 1-10 (default: 1)')
-    trap_parser.add_argument('--trap-type', choices=['mechanical', 'magical', 'puzzle', 'environmental'],
+    trap_parser.add_argument('--trap-type', choices=TRAP_TYPES,
                             help='Trap type (default: random)')
-    trap_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    trap_parser.add_argument('--format', choices=FORMATS, default='text',
                             help='Output format (default: text)')
     trap_parser.add_argument('--output', help='Output file (default: stdout)')
     trap_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate procedural name command
-    procname_parser = subparsers.add_parser('generate-name', help='Generate a procedural name')
+
+def _add_generate_name_arguments(procname_parser):
+    """Add generate-name arguments"""
     procname_parser.add_argument('--race', default='human', help='Race type (default: human)')
-    procname_parser.add_argument('--gender', choices=['male', 'female'], default='male',
+    procname_parser.add_argument('--gender', choices=GENDERS, default='male',
                                 help='Gender (default: male)')
     procname_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Validate thematic consistency command
-    validate_parser = subparsers.add_parser('validate-thematic', help='Validate item thematic consistency')
+
+def _add_validate_thematic_arguments(validate_parser):
+    """Add validate-thematic arguments"""
     validate_parser.add_argument('--item-json', help='Path to item JSON file (default: generates random item)')
     validate_parser.add_argument('--biome', required=True, help='Biome to validate against')
-    validate_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    validate_parser.add_argument('--format', choices=FORMATS, default='text',
                                 help='Output format (default: text)')
     validate_parser.add_argument('--output', help='Output file (default: stdout)')
     validate_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate spell command
-    spell_parser = subparsers.add_parser('generate-spell', help='Generate a spell')
+
+def _add_generate_spell_arguments(spell_parser):
+    """Add generate-spell arguments"""
     spell_parser.add_argument('--spell-level', type=int, help='Spell level 0-9 (0 is cantrip)')
     spell_parser.add_argument('--school', help='Magic school (Evocation, Necromancy, Illusion, etc.)')
     spell_parser.add_argument('--spell-template', help='Spell template (damage_single, damage_area, healing, buff, debuff, summon, utility)')
-    spell_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    spell_parser.add_argument('--format', choices=FORMATS, default='text',
                              help='Output format (default: text)')
     spell_parser.add_argument('--output', help='Output file (default: stdout)')
     spell_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate spellbook command
-    spellbook_parser = subparsers.add_parser('generate-spellbook', help='Generate a spellbook')
+
+def _add_generate_spellbook_arguments(spellbook_parser):
+    """Add generate-spellbook arguments"""
     spellbook_parser.add_argument('--caster-level', type=int, default=1, help='Caster level 1-20 (default: 1)')
     spellbook_parser.add_argument('--school-preference', help='Preferred magic school')
-    spellbook_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    spellbook_parser.add_argument('--format', choices=FORMATS, default='text',
                                   help='Output format (default: text)')
     spellbook_parser.add_argument('--output', help='Output file (default: stdout)')
     spellbook_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate organization command
-    org_parser = subparsers.add_parser('generate-organization', help='Generate an organization or guild')
+
+def _add_generate_organization_arguments(org_parser):
+    """Add generate-organization arguments"""
     org_parser.add_argument('--org-type', help='Organization type (guild, thieves_guild, mages_circle, religious_order, etc.)')
     org_parser.add_argument('--faction', help='Associated faction')
-    org_parser.add_argument('--size', choices=['small', 'medium', 'large'], help='Organization size')
-    org_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    org_parser.add_argument('--size', choices=ORGANIZATION_SIZES, help='Organization size')
+    org_parser.add_argument('--format', choices=FORMATS, default='text',
                            help='Output format (default: text)')
     org_parser.add_argument('--output', help='Output file (default: stdout)')
     org_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate detailed weather command
-    weather_detail_parser = subparsers.add_parser('generate-weather-detailed', help='Generate detailed weather with seasons and disasters')
+
+def _add_generate_weather_detailed_arguments(weather_detail_parser):
+    """Add generate-weather-detailed arguments"""
     weather_detail_parser.add_argument('--biome', help='Biome type')
-    weather_detail_parser.add_argument('--season', choices=['spring', 'summer', 'autumn', 'winter'], help='Season')
-    weather_detail_parser.add_argument('--time-of-day', choices=['dawn', 'morning', 'noon', 'afternoon', 'dusk', 'night'], help='Time of day')
-    weather_detail_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    weather_detail_parser.add_argument('--season', choices=SEASONS, help='Season')
+    weather_detail_parser.add_argument('--time-of-day', choices=TIMES_OF_DAY, help='Time of day')
+    weather_detail_parser.add_argument('--format', choices=FORMATS, default='text',
                                        help='Output format (default: text)')
     weather_detail_parser.add_argument('--output', help='Output file (default: stdout)')
     weather_detail_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate market command
-    market_parser = subparsers.add_parser('generate-market', help='Generate a market with goods and services')
+
+def _add_generate_market_arguments(market_parser):
+    """Add generate-market arguments"""
     market_parser.add_argument('--location-id', help='Location ID for the market')
-    market_parser.add_argument('--wealth-level', choices=['destitute', 'poor', 'modest', 'comfortable', 'wealthy', 'aristocratic'],
+    market_parser.add_argument('--wealth-level', choices=WEALTH_LEVELS,
                               default='modest', help='Wealth level (default: modest)')
-    market_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    market_parser.add_argument('--format', choices=FORMATS, default='text',
                               help='Output format (default: text)')
     market_parser.add_argument('--output', help='Output file (default: stdout)')
     market_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate advanced quest command
-    quest_adv_parser = subparsers.add_parser('generate-quest-advanced', help='Generate advanced quest with branching objectives')
+
+def _add_generate_quest_advanced_arguments(quest_adv_parser):
+    """Add generate-quest-advanced arguments"""
     quest_adv_parser.add_argument('--quest-type', help='Quest type (fetch, kill, escort, rescue, investigate, diplomacy, craft, exploration, defense, heist)')
     quest_adv_parser.add_argument('--difficulty', type=int, default=1, help='Quest difficulty 1-10 (default: 1)')
     quest_adv_parser.add_argument('--faction', help='Faction offering the quest')
     quest_adv_parser.add_argument('--create-chain', action='store_true', help='Create a quest chain')
-    quest_adv_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    quest_adv_parser.add_argument('--format', choices=FORMATS, default='text',
                                   help='Output format (default: text)')
     quest_adv_parser.add_argument('--output', help='Output file (default: stdout)')
     quest_adv_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Generate NPC network command
-    npc_network_parser = subparsers.add_parser('generate-npc-network', help='Generate NPC social network')
+
+def _add_generate_npc_network_arguments(npc_network_parser):
+    """Add generate-npc-network arguments"""
     npc_network_parser.add_argument('--network-size', type=int, default=5, help='Number of connected NPCs (default: 5)')
     npc_network_parser.add_argument('--faction', help='Faction for NPCs')
-    npc_network_parser.add_argument('--format', choices=['json', 'pretty', 'text'], default='text',
+    npc_network_parser.add_argument('--format', choices=FORMATS, default='text',
                                     help='Output format (default: text)')
     npc_network_parser.add_argument('--output', help='Output file (default: stdout)')
     npc_network_parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
 
-    # Export command
-    export_parser = subparsers.add_parser('export', help='Export data to various formats')
+
+def _add_export_arguments(export_parser):
+    """Add export arguments"""
     export_parser.add_argument('--input', required=True, help='Input JSON file')
-    export_parser.add_argument('--output', required=True, help='Output file')
-    export_parser.add_argument('--export-format', choices=['json', 'xml', 'csv', 'sql', 'markdown'], required=True,
-                              help='Export format')
+    export_parser.add_argument('--output', required=True,
+                              help='Output file (with several formats, its extension is replaced per format)')
+    export_parser.add_argument('--export-format', type=_export_formats, required=True,
+                              help=f"Export format, or a comma-separated list ({', '.join(EXPORT_FORMATS)})")
     export_parser.add_argument('--table-name', help='SQL table name (for SQL export)')
     export_parser.add_argument('--title', help='Document title (for Markdown export)')
+    export_parser.add_argument('--pretty', action='store_true',
+                              help='Re-indent JSON output (default: copy the input unchanged)')
+
+
+# Subcommand name -> (help text, function adding its arguments)
+_SUBCOMMANDS = {
+    'generate-item': ('Generate random item(s)', _add_generate_item_arguments),
+    'generate-npc': ('Generate random NPC(s)', _add_generate_npc_arguments),
+    'generate-location': ('Generate random location', _add_generate_location_arguments),
+    'generate-animal': ('Generate random animal(s)', _add_generate_animal_arguments),
+    'generate-flora': ('Generate random flora', _add_generate_flora_arguments),
+    'generate-world': ('Generate complete world', _add_generate_world_arguments),
+    'list-templates': ('List all available templates', None),
+    'list-races': ('List all available races', None),
+    'list-factions': ('List all available factions', None),
+    'list-biomes': ('List all available biomes', None),
+    'list-professions': ('List all available professions and profession levels', None),
+    'generate-loot': ('Generate a loot table', _add_generate_loot_arguments),
+    'generate-quest': ('Generate a quest', _add_generate_quest_arguments),
+    'generate-recipe': ('Generate a crafting recipe', _add_generate_recipe_arguments),
+    'generate-encounter': ('Generate an encounter', _add_generate_encounter_arguments),
+    'generate-item-modifiers': ('Generate item with prefix/suffix modifiers', _add_generate_item_modifiers_arguments),
+    'generate-item-set': ('Generate a themed item set', _add_generate_item_set_arguments),
+    'generate-batch': ('Generate batch content with distribution', _add_generate_batch_arguments),
+    'generate-weather': ('Generate weather and time conditions', _add_generate_weather_arguments),
+    'generate-trap': ('Generate a trap or puzzle', _add_generate_trap_arguments),
+    'generate-name': ('Generate a procedural name', _add_generate_name_arguments),
+    'validate-thematic': ('Validate item thematic consistency', _add_validate_thematic_arguments),
+    'generate-spell': ('Generate a spell', _add_generate_spell_arguments),
+    'generate-spellbook': ('Generate a spellbook', _add_generate_spellbook_arguments),
+    'generate-organization': ('Generate an organization or guild', _add_generate_organization_arguments),
+    'generate-weather-detailed': ('Generate detailed weather with seasons and disasters', _add_generate_weather_detailed_arguments),
+    'generate-market': ('Generate a market with goods and services', _add_generate_market_arguments),
+    'generate-quest-advanced': ('Generate advanced quest with branching objectives', _add_generate_quest_advanced_arguments),
+    'generate-npc-network': ('Generate NPC social network', _add_generate_npc_network_arguments),
+    'export': ('Export data to various formats', _add_export_arguments),
+}
+
+
+def build_parser(command=None):
+    """
+    Build the CLI argument parser.
+
+    Args:
+        command: If given, only this subcommand's parser is built; setting up
+            all of them is most of the parser construction cost
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description='R-Gen - Random Game Content Generator CLI',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Basic generation
+  %(prog)s generate-item --template weapon_melee
+  %(prog)s generate-npc --profession blacksmith
+
+  # With seed for reproducibility
+  %(prog)s generate-item --template weapon_melee --seed 42
+
+  # With constraints
+  %(prog)s generate-item --template weapon_melee --min-quality Excellent --min-rarity Rare --min-value 500
+
+  # Multiple items
+  %(prog)s generate-item --count 10
+
+  # Output to file
+  %(prog)s generate-item --template weapon_melee --output items.json --format json
+
+Set RGEN_DEBUG=1 to print a full traceback when a command fails.
+        """
+    )
+
+    parser.add_argument('--data-dir', default=PACKAGE_DATA_DIR,
+                        help="Path to data directory (default: the package's own data directory)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the output cache for list-* and seeded generate-name')
+
+    # Flags shared by most subcommands; defaulting them here means every
+    # Namespace carries them, whichever subcommand was invoked.
+    parser.set_defaults(seed=None, output=None)
+
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        if command is not None and name != command:
+            continue
+        subparser = subparsers.add_parser(name, help=help_text)
+        if add_arguments is not None:
+            add_arguments(subparser)
+
+    return parser
+
+
+def _peek_command(argv):
+    """Return the subcommand named in argv, or None if there isn't a known one."""
+    tokens = iter(argv)
+    for token in tokens:
+        if token.startswith('--') and '=' not in token and len(token) > 2 and '--data-dir'.startswith(token):
+            # Skip the --data-dir value (argparse accepts abbreviations)
+            next(tokens, None)
+        elif not token.startswith('-'):
+            return token if token in _COMMAND_NAMES else None
+    return None
+
+
+def main():
+    # Unknown or missing commands fall back to the full parser so help and
+    # error messages still list every command
+    parser = build_parser(_peek_command(sys.argv[1:]))
 
     args = parser.parse_args()
 
@@ -1129,81 +1577,43 @@ Examples:
         parser.print_help()
         return 1
 
+    # argv strings aren't interned; interning lets the table lookups below
+    # match the literal keys by identity
+    args.command = sys.intern(args.command)
+
+    # Every subparser must have a handler
+    if args.command not in _COMMAND_NAMES:
+        parser.error(f"no handler for command '{args.command}'")
+
     try:
         # Initialize generator with seed if provided
-        seed = getattr(args, 'seed', None)
+        seed = args.seed
         if seed:
             print(f"🌱 Using seed: {seed}")
-        generator = ContentGenerator(data_dir=args.data_dir, seed=seed)
 
-        # Execute command
-        if args.command == 'generate-item':
-            cmd_generate_item(args, generator)
-        elif args.command == 'generate-npc':
-            cmd_generate_npc(args, generator)
-        elif args.command == 'generate-location':
-            cmd_generate_location(args, generator)
-        elif args.command == 'generate-animal':
-            cmd_generate_animal(args, generator)
-        elif args.command == 'generate-flora':
-            cmd_generate_flora(args, generator)
-        elif args.command == 'generate-world':
-            cmd_generate_world(args, generator)
-        elif args.command == 'list-templates':
-            cmd_list_templates(args, generator)
-        elif args.command == 'list-races':
-            cmd_list_races(args, generator)
-        elif args.command == 'list-factions':
-            cmd_list_factions(args, generator)
-        elif args.command == 'list-biomes':
-            cmd_list_biomes(args, generator)
-        elif args.command == 'list-professions':
-            cmd_list_professions(args, generator)
-        elif args.command == 'generate-loot':
-            cmd_generate_loot(args, generator)
-        elif args.command == 'generate-quest':
-            cmd_generate_quest(args, generator)
-        elif args.command == 'generate-recipe':
-            cmd_generate_recipe(args, generator)
-        elif args.command == 'generate-encounter':
-            cmd_generate_encounter(args, generator)
-        elif args.command == 'generate-item-modifiers':
-            cmd_generate_item_with_modifiers(args, generator)
-        elif args.command == 'generate-item-set':
-            cmd_generate_item_set(args, generator)
-        elif args.command == 'generate-batch':
-            cmd_generate_batch(args, generator)
-        elif args.command == 'generate-weather':
-            cmd_generate_weather(args, generator)
-        elif args.command == 'generate-trap':
-            cmd_generate_trap(args, generator)
-        elif args.command == 'generate-name':
-            cmd_generate_procedural_name(args, generator)
-        elif args.command == 'validate-thematic':
-            cmd_validate_thematic(args, generator)
-        elif args.command == 'export':
-            cmd_export(args, generator)
-        elif args.command == 'generate-spell':
-            cmd_generate_spell(args, generator)
-        elif args.command == 'generate-spellbook':
-            cmd_generate_spellbook(args, generator)
-        elif args.command == 'generate-organization':
-            cmd_generate_organization(args, generator)
-        elif args.command == 'generate-weather-detailed':
-            cmd_generate_weather_detailed(args, generator)
-        elif args.command == 'generate-market':
-            cmd_generate_market(args, generator)
-        elif args.command == 'generate-quest-advanced':
-            cmd_generate_quest_advanced(args, generator)
-        elif args.command == 'generate-npc-network':
-            cmd_generate_npc_network(args, generator)
+        handler, needs_generator = _DISPATCH[args.command]
 
+        # Metadata commands only read the data files they need
+        if not needs_generator:
+            if (args.command in _CACHEABLE and not args.no_cache
+                    and (args.seed is not None or args.command not in _CACHE_NEEDS_SEED)):
+                _run_cached(handler, args)
+            else:
+                handler(args, None)
+            return 0
+
+        generator = _get_generator(args.data_dir, seed)
+
+        # Execute command
+        handler(args, generator)
         return 0
 
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        # Full traceback only when debugging (RGEN_DEBUG=1)
+        if os.environ.get('RGEN_DEBUG'):
+            import traceback
+            traceback.print_exc()
         return 1
 
 
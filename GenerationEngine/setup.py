@@ -2,51 +2,79 @@
 Setup configuration for R-Gen Generation Engine
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
+from setuptools.command.build_py import build_py
 import os
+import sys
 
-# Read README for long description
-readme_path = os.path.join(os.path.dirname(__file__), '..', 'README.md')
-if os.path.exists(readme_path):
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        long_description = f.read()
-else:
-    long_description = "Procedural content generation for fantasy worlds"
-
-setup(
-    name="rgen-generation-engine",
-    version="1.0.0",
-    author="R-Gen Team",
-    description="Procedural content generation for fantasy worlds",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    packages=find_packages(),
-    include_package_data=True,
-    package_data={
-        '': ['data/*.json'],
-    },
-    install_requires=[
-        "numpy>=1.19.0",
-    ],
-    extras_require={
-        'database': ['psycopg2-binary>=2.8.0'],
-        'web': ['flask>=2.0.0', 'flask-cors>=3.0.10'],
-        'all': ['psycopg2-binary>=2.8.0', 'flask>=2.0.0', 'flask-cors>=3.0.10'],
-    },
-    python_requires='>=3.7',
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Topic :: Games/Entertainment",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-    ],
-    entry_points={
-        'console_scripts': [
-            'rgen-generate=cli:main',
+def _long_description():
+    """Read the top-level README, falling back to a one-line summary."""
+    readme_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'README.md')
+    try:
+        with open(readme_path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except OSError:
+        return "Procedural content generation for fantasy worlds"
+
+
+class BuildPyWithData(build_py):
+    """build_py that also ships the data files precompiled (see src/datafiles.py)."""
+
+    def run(self):
+        # Copies data/*.json to src/data (package_data keeps their mtimes,
+        # which the blob index is checked against)
+        super().run()
+
+        here = os.path.dirname(os.path.abspath(__file__))
+        sys.path.insert(0, here)
+        from src.datafiles import compile_data_files
+
+        # The built package's PACKAGE_DATA_DIR
+        if not self.dry_run:
+            compile_data_files(os.path.join(self.build_lib, 'src', 'data'))
+
+
+if __name__ == '__main__':
+    setup(
+        name="rgen-generation-engine",
+        version="1.0.0",
+        author="R-Gen Team",
+        description="Procedural content generation for fantasy worlds",
+        long_description=_long_description(),
+        long_description_content_type="text/markdown",
+        # The data files ship inside the src package, as src/data
+        packages=['src', 'src.data'],
+        package_dir={'src.data': 'data'},
+        # The CLI is a top-level module next to the src package
+        py_modules=['cli'],
+        include_package_data=True,
+        package_data={
+            'src.data': ['*.json'],
+        },
+        install_requires=[],
+        extras_require={
+            'database': ['psycopg2-binary>=2.8.0'],
+            'web': ['flask>=2.0.0', 'flask-cors>=3.0.10'],
+            'fast': ['orjson>=3.6'],
+            'parquet': ['pyarrow>=8.0.0'],
+            'all': ['psycopg2-binary>=2.8.0', 'flask>=2.0.0', 'flask-cors>=3.0.10', 'orjson>=3.6',
+                    'pyarrow>=8.0.0'],
+        },
+        cmdclass={'build_py': BuildPyWithData},
+        python_requires='>=3.7',
+        classifiers=[
+            "Development Status :: 4 - Beta",
+            "Intended Audience :: Developers",
+            "Topic :: Games/Entertainment",
+            "Programming Language :: Python :: 3",
+            "Programming Language :: Python :: 3.7",
+            "Programming Language :: Python :: 3.8",
+            "Programming Language :: Python :: 3.9",
+            "Programming Language :: Python :: 3.10",
         ],
-    },
-)
+        entry_points={
+            'console_scripts': [
+                'rgen-generate=cli:main',
+            ],
+        },
+    )
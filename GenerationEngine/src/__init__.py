@@ -4,7 +4,14 @@ R-Gen Generation Engine
 Procedural content generation for fantasy worlds.
 """
 
-from .content_generator import ContentGenerator
-
 __version__ = "1.0.0"
-__all__ = ["ContentGenerator"]
+__all__ = ["ContentGenerator", "ColumnarData"]
+
+
+def __getattr__(name):
+    # Lazy re-exports (PEP 562): importing the package or a light submodule
+    # such as src.listings doesn't load the generator module
+    if name in __all__:
+        from . import content_generator
+        return getattr(content_generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
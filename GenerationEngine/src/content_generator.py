@@ -6,11 +6,114 @@ configuration files and generates game elements like Items, NPCs, and Locations
 with randomized properties and dynamic descriptions.
 """
 
+import functools
 import json
 import random
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; exports fall back to the stdlib encoder
+    orjson = None
+
+try:
+    from .datafiles import PACKAGE_DATA_DIR, open_data_blob
+    from .names import procedural_name
+except ImportError:  # loaded as a top-level module with src/ on sys.path
+    from datafiles import PACKAGE_DATA_DIR, open_data_blob
+    from names import procedural_name
+
+
+# Write buffer used by the file exporters (flushed once when the file closes)
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Number of rows folded into each multi-row INSERT by export_to_sql
+SQL_INSERT_BATCH_SIZE = 1000
+
+# Weighted profession level selection for NPCs (favours middle levels)
+NPC_LEVEL_NAMES = ("novice", "apprentice", "journeyman", "expert", "master", "grandmaster")
+NPC_LEVEL_WEIGHTS = (0.15, 0.25, 0.30, 0.20, 0.08, 0.02)
+
+# Profession level used for NPCs generated in a given rarity bucket
+RARITY_TO_PROFESSION_LEVEL = {
+    "Common": "novice",
+    "Uncommon": "apprentice",
+    "Rare": "journeyman",
+    "Epic": "expert",
+    "Legendary": "master",
+    "Mythic": "grandmaster"
+}
+
+# Chance of an NPC carrying equipment, by profession level
+EQUIPMENT_CHANCE_BY_LEVEL = {
+    "novice": 0.3,
+    "apprentice": 0.5,
+    "journeyman": 0.6,
+    "expert": 0.7,
+    "master": 0.8,
+    "grandmaster": 0.9
+}
+
+# Relationship types used when building NPC networks
+NPC_RELATIONSHIP_TYPES = ("friend", "rival", "acquaintance", "family", "colleague")
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_data_file(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a JSON configuration file once per (path, mtime, size).
+
+    The stat fields are part of the cache key so an edited file is re-read.
+    Parsed configs are shared between ContentGenerator instances and are
+    treated as read-only.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class ColumnarData(dict):
+    """
+    Column-oriented view of a list of records (column name -> list of values).
+
+    Built once by from_records() so the tabular exporters (CSV, SQL, Parquet)
+    can share a single pivot instead of each walking the record dicts.
+    Columns are kept in sorted key order and nested dicts/lists are
+    JSON-encoded.
+    """
+
+    def __init__(self, columns: Optional[Dict[str, List[Any]]] = None, num_rows: int = 0):
+        super().__init__(columns or {})
+        self.num_rows = num_rows
+
+    @classmethod
+    def from_records(cls, data: List[Any]) -> "ColumnarData":
+        """
+        Pivot a list of records into columns in a single pass.
+
+        Non-dict entries are skipped; keys missing from a record become None.
+
+        Args:
+            data: List of record dicts
+
+        Returns:
+            ColumnarData with one list per key
+        """
+        rows = [item for item in data if isinstance(item, dict)]
+        all_keys = set()
+        for item in rows:
+            all_keys.update(item.keys())
+
+        columns = {}
+        for key in sorted(all_keys):
+            values = [item.get(key) for item in rows]
+            for idx, val in enumerate(values):
+                if isinstance(val, (dict, list)):
+                    values[idx] = json.dumps(val)
+            columns[key] = values
+
+        return cls(columns, num_rows=len(rows))
 
 
 class ContentGenerator:
@@ -21,18 +124,23 @@ class ContentGenerator:
     Items, NPCs, and Locations with cross-referencing support.
     """
 
-    def __init__(self, data_dir: str = "data", seed: Optional[int] = None):
+    def __init__(self, data_dir: Optional[str] = None, seed: Optional[int] = None):
         """
         Initialize the ContentGenerator.
 
         Args:
-            data_dir: Path to directory containing JSON configuration files
+            data_dir: Path to directory containing JSON configuration files.
+                If None, uses the package's own data directory.
             seed: Random seed for reproducible generation. If None, uses system random.
         """
-        self.data_dir = Path(data_dir)
+        self.data_dir = Path(data_dir if data_dir is not None else PACKAGE_DATA_DIR)
         self.seed = seed
         self.rng = random.Random(seed)  # Dedicated random number generator
 
+        # Tables precompiled at build time are pickles, so open_data_blob only
+        # trusts them in the package's own data directory
+        self._data_blob = open_data_blob(str(self.data_dir))
+
         # Load separated attribute configuration files
         self.quality = self._load_json("quality.json")
         self.rarity = self._load_json("rarity.json")
@@ -89,13 +197,30 @@ class ContentGenerator:
             self.seed = seed
         self.rng = random.Random(self.seed)
         self.generated_locations = {}
+        self.generated_npcs = []
+        self.generated_organizations = []
 
     def _load_json(self, filename: str) -> Dict:
-        """Load and parse a JSON file."""
+        """
+        Load and parse a JSON file.
+
+        Tables precompiled by the build into the memory-mapped tables.bin
+        blob are used instead when available and data_dir is the package's
+        own data directory.
+        """
         file_path = self.data_dir / filename
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            st = file_path.stat()
+
+            if self._data_blob is not None:
+                try:
+                    data = self._data_blob.load(filename, st)
+                except Exception:
+                    data = None  # Corrupt blob entry; fall through to the JSON source
+                if data is not None:
+                    return data
+
+            return _parse_data_file(str(file_path.resolve()), st.st_mtime_ns, st.st_size)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
         except json.JSONDecodeError as e:
@@ -541,17 +666,9 @@ class ContentGenerator:
         # Select profession level
         if profession_level is None:
             # Weighted selection favoring middle levels
-            level_weights = {
-                "novice": 0.15,
-                "apprentice": 0.25,
-                "journeyman": 0.30,
-                "expert": 0.20,
-                "master": 0.08,
-                "grandmaster": 0.02
-            }
             profession_level = self.rng.choices(
-                list(level_weights.keys()),
-                weights=list(level_weights.values()),
+                NPC_LEVEL_NAMES,
+                weights=NPC_LEVEL_WEIGHTS,
                 k=1
             )[0]
 
@@ -626,15 +743,7 @@ class ContentGenerator:
 
         # Generate equipment based on profession level
         # Higher level NPCs have better chance of having equipment
-        equipment_chance_by_level = {
-            "novice": 0.3,
-            "apprentice": 0.5,
-            "journeyman": 0.6,
-            "expert": 0.7,
-            "master": 0.8,
-            "grandmaster": 0.9
-        }
-        equipment_chance = equipment_chance_by_level.get(profession_level, 0.5)
+        equipment_chance = EQUIPMENT_CHANCE_BY_LEVEL.get(profession_level, 0.5)
         equipment = self.generate_equipment(equipment_chance=equipment_chance)
 
         # Calculate challenge rating (power level)
@@ -1308,34 +1417,7 @@ class ContentGenerator:
         Returns:
             Procedurally generated name
         """
-        syllables = {
-            "human": {
-                "first": ["Al", "Bren", "Ced", "Da", "El", "Finn", "Gar", "Har", "Iv", "Jas"],
-                "middle": ["dri", "nan", "ric", "mi", "en", "na", "eth", "ugh", "an", "per"],
-                "last": ["c", "n", "k", "en", "a", "s", "th", "on", "or", "er"]
-            },
-            "elf": {
-                "first": ["Ae", "Cal", "El", "Fae", "Gal", "Il", "Lor", "Nae", "Syl", "Vae"],
-                "middle": ["la", "ad", "io", "la", "a", "li", "e", "ri", "va", "li"],
-                "last": ["r", "n", "rel", "lyn", "don", "an", "ei", "s", "ra", "s"]
-            },
-            "dwarf": {
-                "first": ["Thor", "Brom", "Grim", "Dur", "Bal", "Krag", "Mor", "Thar", "Gor", "Bor"],
-                "middle": ["in", "on", "ak", "ek", "ik", "im", "um", "ar", "or", "an"],
-                "last": ["", "", "n", "d", "k", "r", "m", "g", "t", "s"]
-            }
-        }
-
-        # Default to human if race not found
-        race_syllables = syllables.get(race, syllables["human"])
-
-        first_name = (
-            self.rng.choice(race_syllables["first"]) +
-            self.rng.choice(race_syllables["middle"]) +
-            self.rng.choice(race_syllables["last"])
-        )
-
-        return first_name
+        return procedural_name(self.rng, race, gender)
 
     def generate_item_with_modifiers(self, template_name: Optional[str] = None,
                                     num_modifiers: int = 0) -> Dict[str, Any]:
@@ -1435,8 +1517,16 @@ class ContentGenerator:
             filename: Output filename
         """
         output_path = Path(filename)
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                   | orjson.OPT_APPEND_NEWLINE)
+            with open(output_path, 'wb') as f:
+                f.write(payload)
+        else:
+            # Same bytes as the orjson path: raw UTF-8 and a trailing newline
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write("\n")
         print(f"Exported to {output_path}")
 
     def export_to_xml(self, data: Any, filename: str) -> None:
@@ -1469,38 +1559,36 @@ class ContentGenerator:
         tree.write(output_path, encoding='utf-8', xml_declaration=True)
         print(f"Exported to {output_path}")
 
+    def _tabular(self, data: Any) -> Optional[ColumnarData]:
+        """Return data as ColumnarData for the tabular exporters, or None if it isn't tabular."""
+        if isinstance(data, ColumnarData):
+            columns = data
+        elif isinstance(data, list) and len(data) > 0:
+            columns = ColumnarData.from_records(data)
+        else:
+            return None
+        return columns if columns.num_rows > 0 else None
+
     def export_to_csv(self, data: Any, filename: str) -> None:
         """
         Export generated content to CSV format (works best for lists of items/NPCs).
 
         Args:
-            data: Data to export (should be list of dicts)
+            data: Data to export (list of dicts or ColumnarData)
             filename: Output filename
         """
         import csv
 
         output_path = Path(filename)
+        columns = self._tabular(data)
 
-        if isinstance(data, list) and len(data) > 0:
-            # Get all possible keys
-            all_keys = set()
-            for item in data:
-                if isinstance(item, dict):
-                    all_keys.update(item.keys())
-
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=sorted(all_keys))
-                writer.writeheader()
-                for item in data:
-                    if isinstance(item, dict):
-                        # Convert nested structures to strings
-                        row = {}
-                        for k, v in item.items():
-                            if isinstance(v, (dict, list)):
-                                row[k] = json.dumps(v)
-                            else:
-                                row[k] = v
-                        writer.writerow(row)
+        if columns is not None:
+            keys = list(columns)
+
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(keys)
+                writer.writerows(zip(*(columns[key] for key in keys)))
             print(f"Exported to {output_path}")
         else:
             print("CSV export requires a list of dictionaries")
@@ -1510,44 +1598,89 @@ class ContentGenerator:
         Export generated content to SQL INSERT statements.
 
         Args:
-            data: Data to export (should be list of dicts)
+            data: Data to export (list of dicts or ColumnarData)
             filename: Output filename
             table_name: SQL table name
         """
         output_path = Path(filename)
+        columns = self._tabular(data)
+
+        if columns is not None:
+            keys = list(columns)
+            insert_prefix = f"INSERT INTO {table_name} ({', '.join(keys)}) VALUES\n"
+
+            # Convert each column to SQL literals once; enum-like columns
+            # (rarity, quality, type) reuse the cached literal for repeats
+            literal_columns = []
+            for key in keys:
+                cache = {}
+                literals = []
+                for val in columns[key]:
+                    # Key on the type too so True, 1 and 1.0 don't share a literal
+                    cache_key = (val.__class__, val)
+                    try:
+                        literal = cache[cache_key]
+                    except KeyError:
+                        if val is None:
+                            literal = "NULL"
+                        elif isinstance(val, str):
+                            escaped_str = val.replace("'", "''")
+                            literal = f"'{escaped_str}'"
+                        else:
+                            literal = str(val)
+                        cache[cache_key] = literal
+                    literals.append(literal)
+                literal_columns.append(literals)
+
+            rows = [f"({', '.join(values)})" for values in zip(*literal_columns)]
+
+            with open(output_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                # Fold rows into multi-row INSERTs, encoding each batch once
+                for start in range(0, len(rows), SQL_INSERT_BATCH_SIZE):
+                    batch = rows[start:start + SQL_INSERT_BATCH_SIZE]
+                    f.write((insert_prefix + ",\n".join(batch) + ";\n").encode('utf-8'))
 
-        if isinstance(data, list) and len(data) > 0:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                # Get all possible columns
-                all_keys = set()
-                for item in data:
-                    if isinstance(item, dict):
-                        all_keys.update(item.keys())
+            print(f"Exported to {output_path}")
+        else:
+            print("SQL export requires a list of dictionaries")
 
-                columns = sorted(all_keys)
+    def export_to_parquet(self, data: Any, filename: str) -> None:
+        """
+        Export generated content to a columnar Parquet file.
 
-                for item in data:
-                    if isinstance(item, dict):
-                        values = []
-                        for col in columns:
-                            val = item.get(col, None)
-                            if val is None:
-                                values.append("NULL")
-                            elif isinstance(val, (dict, list)):
-                                escaped_json = json.dumps(val).replace("'", "''")
-                                values.append(f"'{escaped_json}'")
-                            elif isinstance(val, str):
-                                escaped_str = val.replace("'", "''")
-                                values.append(f"'{escaped_str}'")
-                            else:
-                                values.append(str(val))
-
-                        sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(values)});\n"
-                        f.write(sql)
+        Low-cardinality columns such as rarity and quality are dictionary
+        encoded, which keeps large batches far smaller than CSV or JSON.
+        Requires the optional pyarrow package.
 
+        Args:
+            data: Data to export (list of dicts or ColumnarData)
+            filename: Output filename
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow package required for Parquet export. Install with: pip install pyarrow")
+
+        output_path = Path(filename)
+        columns = self._tabular(data)
+
+        if columns is not None:
+            arrays = {}
+            for key, values in columns.items():
+                try:
+                    arrays[key] = pa.array(values)
+                except pa.ArrowInvalid:
+                    # Mixed types (e.g. [True, 1] or [1, 'a']) have no common Arrow
+                    # type; store the column as text, the way CSV writes it
+                    arrays[key] = pa.array([None if value is None else str(value) for value in values],
+                                           type=pa.string())
+            table = pa.table(arrays)
+            pq.write_table(table, output_path, compression='zstd', use_dictionary=True,
+                           row_group_size=65536)
             print(f"Exported to {output_path}")
         else:
-            print("SQL export requires a list of dictionaries")
+            print("Parquet export requires a list of dictionaries")
 
     def generate_item_set_collection(self, set_name: Optional[str] = None,
                                      set_size: int = 5) -> Dict[str, Any]:
@@ -1635,72 +1768,64 @@ class ContentGenerator:
                 distribution = {"default": 1.0}
 
         results = []
-        generated_count = 0
 
-        # Calculate counts per rarity
-        for rarity, percentage in distribution.items():
-            rarity_count = int(count * percentage)
+        # Resolve integer counts per rarity up front
+        quotas = [(rarity, int(count * percentage))
+                  for rarity, percentage in distribution.items()]
 
-            for _ in range(rarity_count):
-                if content_type == "item":
-                    constraints = kwargs.get("constraints", {})
-                    constraints["min_rarity"] = rarity
-                    constraints["max_rarity"] = rarity
+        template_name = kwargs.get("template_name")
+
+        # Per-rarity setup happens once per bucket, not once per record
+        for rarity, rarity_count in quotas:
+            if content_type == "item":
+                constraints = kwargs.get("constraints", {})
+                constraints["min_rarity"] = rarity
+                constraints["max_rarity"] = rarity
+                for _ in range(rarity_count):
                     try:
-                        item = self.generate_item(
-                            template_name=kwargs.get("template_name"),
+                        results.append(self.generate_item(
+                            template_name=template_name,
                             constraints=constraints
-                        )
-                        results.append(item)
+                        ))
                     except ValueError:
                         # If constraints too strict, skip
                         pass
 
-                elif content_type == "npc":
-                    # Map rarity to profession level
-                    rarity_to_level = {
-                        "Common": "novice",
-                        "Uncommon": "apprentice",
-                        "Rare": "journeyman",
-                        "Epic": "expert",
-                        "Legendary": "master",
-                        "Mythic": "grandmaster"
-                    }
-                    npc = self.generate_npc(
-                        profession_level=rarity_to_level.get(rarity, "journeyman"),
-                        **kwargs
-                    )
-                    results.append(npc)
-
-                elif content_type == "location":
-                    location = self.generate_location(**kwargs)
-                    results.append(location)
+            elif content_type == "npc":
+                # Map rarity to profession level
+                profession_level = RARITY_TO_PROFESSION_LEVEL.get(rarity, "journeyman")
+                results.extend(
+                    self.generate_npc(profession_level=profession_level, **kwargs)
+                    for _ in range(rarity_count)
+                )
+
+            elif content_type == "location":
+                results.extend(self.generate_location(**kwargs) for _ in range(rarity_count))
 
         # Fill up any remaining items due to rounding
-        while len(results) < count:
+        remaining = count - len(results)
+        if remaining > 0:
             if content_type == "item":
                 # Use most common rarity for remainder
-                common_rarity = list(distribution.keys())[0]
+                common_rarity = next(iter(distribution))
                 constraints = kwargs.get("constraints", {})
                 constraints["min_rarity"] = common_rarity
                 constraints["max_rarity"] = common_rarity
-                try:
-                    item = self.generate_item(
-                        template_name=kwargs.get("template_name"),
-                        constraints=constraints
-                    )
-                    results.append(item)
-                except ValueError:
-                    # If constraints too strict, generate without constraints
-                    results.append(self.generate_item())
+                for _ in range(remaining):
+                    try:
+                        results.append(self.generate_item(
+                            template_name=template_name,
+                            constraints=constraints
+                        ))
+                    except ValueError:
+                        # If constraints too strict, generate without constraints
+                        results.append(self.generate_item())
 
             elif content_type == "npc":
-                npc = self.generate_npc(**kwargs)
-                results.append(npc)
+                results.extend(self.generate_npc(**kwargs) for _ in range(remaining))
 
             elif content_type == "location":
-                location = self.generate_location(**kwargs)
-                results.append(location)
+                results.extend(self.generate_location(**kwargs) for _ in range(remaining))
 
         return results
 
@@ -2454,13 +2579,13 @@ class ContentGenerator:
             List of NPCs with relationships
         """
         network = [central_npc]
+        faction = central_npc.get("faction")
 
         for _ in range(network_size):
-            new_npc = self.generate_npc(faction=central_npc.get("faction"))
+            new_npc = self.generate_npc(faction=faction)
 
             # Determine relationship
-            rel_types = ["friend", "rival", "acquaintance", "family", "colleague"]
-            rel_type = self.rng.choice(rel_types)
+            rel_type = self.rng.choice(NPC_RELATIONSHIP_TYPES)
 
             self.add_relationship(central_npc, new_npc, rel_type)
             network.append(new_npc)
@@ -2535,7 +2660,7 @@ class ContentGenerator:
         """
         output_path = Path(filename)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             f.write(f"# {title}\n\n")
 
             if isinstance(data, dict):
@@ -0,0 +1,167 @@
+"""
+Precompiled data files.
+
+The build (``setup.py build_py``) pickles each ``data/*.json`` and packs
+all of them into a single ``tables.bin`` blob in the build output. ContentGenerator memory-maps the blob, so every table comes
+from one file whose pages the OS shares between CLI runs. Entries are only
+used while their JSON source is unchanged since the build.
+
+Unpickling can run arbitrary code, so precompiled tables are only read from
+the package's own data directory, never from a user-supplied ``--data-dir``.
+"""
+
+import functools
+import glob
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+from typing import Any, Dict, Optional
+
+# Name of the packed blob inside the data directory
+BLOB_NAME = "tables.bin"
+
+# The package's own data directory, the only one precompiled tables are read from,
+# and the default data directory: src/data once installed, data/ in a source checkout
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_DATA_DIR = os.path.join(_PACKAGE_DIR, 'data')
+if not os.path.isdir(PACKAGE_DATA_DIR):
+    PACKAGE_DATA_DIR = os.path.join(os.path.dirname(_PACKAGE_DIR), 'data')
+
+# Pickle protocol 4 keeps the output loadable on Python 3.7
+PICKLE_PROTOCOL = 4
+
+# Blob layout: magic, index length, JSON index, then the pickled tables
+_MAGIC = b"RGENTBL2"
+_HEADER = struct.Struct("<8sI")
+
+
+def is_package_data_dir(data_dir: str) -> bool:
+    """
+    Check whether data_dir is the package's own data directory.
+
+    Args:
+        data_dir: Path to directory containing JSON configuration files
+
+    Returns:
+        True if precompiled tables in data_dir may be loaded
+    """
+    return os.path.realpath(data_dir) == os.path.realpath(PACKAGE_DATA_DIR)
+
+
+def compile_data_files(data_dir: str) -> None:
+    """
+    Precompile every JSON file in data_dir.
+
+    Packs every table, pickled, into ``tables.bin``. The blob index records each source's mtime, size and
+    content digest so stale entries are ignored at load time. The build
+    runs this on the copy of the data directory in its output, not on the
+    source tree.
+
+    Args:
+        data_dir: Path to directory containing JSON configuration files
+    """
+    index = {}
+    payloads = []
+    offset = 0
+    for json_path in sorted(glob.glob(os.path.join(data_dir, '*.json'))):
+        with open(json_path, 'rb') as f:
+            source = f.read()
+        payload = pickle.dumps(json.loads(source), protocol=PICKLE_PROTOCOL)
+
+        st = os.stat(json_path)
+        index[os.path.basename(json_path)] = [offset, len(payload), st.st_mtime_ns, st.st_size,
+                                              _digest(source)]
+        payloads.append(payload)
+        offset += len(payload)
+
+    index_bytes = json.dumps(index).encode('utf-8')
+    with open(os.path.join(data_dir, BLOB_NAME), 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        for payload in payloads:
+            f.write(payload)
+
+
+def _digest(source: bytes) -> str:
+    """Content digest of a JSON source, for sources whose mtime changed."""
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+class DataBlob:
+    """Read-only, memory-mapped view of a ``tables.bin`` blob."""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a data blob: {path}")
+
+        start = _HEADER.size
+        self._dir = os.path.dirname(path)
+        self._index = json.loads(self._map[start:start + index_length])
+        self._base = start + index_length
+        self._tables: Dict[str, Any] = {}
+
+    def load(self, filename: str, source_stat: os.stat_result) -> Optional[Any]:
+        """
+        Load a table from the blob.
+
+        Args:
+            filename: JSON file name the table was compiled from
+            source_stat: Current stat of that JSON file
+
+        Returns:
+            Parsed table, or None if it isn't in the blob or its source has
+            changed since the blob was built
+        """
+        entry = self._index.get(filename)
+        if entry is None:
+            return None
+
+        offset, length, mtime_ns, size, digest = entry
+        if source_stat.st_size != size:
+            return None
+        if source_stat.st_mtime_ns != mtime_ns:
+            # Installers don't keep mtimes, so compare the contents instead
+            with open(os.path.join(self._dir, filename), 'rb') as f:
+                if _digest(f.read()) != digest:
+                    return None
+
+        # Parsed tables are shared like other loaded configs (read-only)
+        if filename not in self._tables:
+            start = self._base + offset
+            with memoryview(self._map)[start:start + length] as view:
+                self._tables[filename] = pickle.loads(view)
+        return self._tables[filename]
+
+
+@functools.lru_cache(maxsize=8)
+def _open_blob(path: str, mtime_ns: int, size: int) -> DataBlob:
+    return DataBlob(path)
+
+
+def open_data_blob(data_dir: str) -> Optional[DataBlob]:
+    """
+    Open the precompiled blob in data_dir.
+
+    Args:
+        data_dir: Path to directory containing JSON configuration files
+
+    Returns:
+        DataBlob, or None if there is no usable blob or data_dir isn't the
+        package's own data directory
+    """
+    if not is_package_data_dir(data_dir):
+        return None
+
+    path = os.path.join(data_dir, BLOB_NAME)
+    try:
+        st = os.stat(path)
+        return _open_blob(os.path.realpath(path), st.st_mtime_ns, st.st_size)
+    except (OSError, ValueError, struct.error):
+        return None
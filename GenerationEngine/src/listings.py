@@ -0,0 +1,80 @@
+"""
+Lightweight metadata lookups for the R-Gen CLI.
+
+The list-* commands only need one or two configuration files each, so these
+helpers read just those files instead of building a full ContentGenerator
+(which loads every data file up front).
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+
+def load_data_file(data_dir: str, filename: str) -> Dict[str, Any]:
+    """
+    Load and parse a single JSON configuration file.
+
+    Args:
+        data_dir: Path to directory containing JSON configuration files
+        filename: Name of the file within data_dir
+
+    Returns:
+        Parsed JSON content
+    """
+    file_path = Path(data_dir) / filename
+    try:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {file_path}: {e}")
+
+
+def list_templates(data_dir: str) -> Dict[str, List[str]]:
+    """
+    Collect the names of all generation templates.
+
+    Args:
+        data_dir: Path to directory containing JSON configuration files
+
+    Returns:
+        Dictionary with item_templates, item_sets, professions and
+        location_templates name lists
+    """
+    return {
+        "item_templates": list(load_data_file(data_dir, "item_templates.json")),
+        "item_sets": list(load_data_file(data_dir, "item_sets.json")),
+        "professions": list(load_data_file(data_dir, "professions.json")),
+        "location_templates": list(load_data_file(data_dir, "locations.json").get("templates", {}))
+    }
+
+
+def list_races(data_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Return race definitions keyed by race id."""
+    return load_data_file(data_dir, "races.json")["races"]
+
+
+def list_factions(data_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Return faction definitions keyed by faction id."""
+    return load_data_file(data_dir, "factions.json")["factions"]
+
+
+def list_biomes(data_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Return biome definitions keyed by biome id."""
+    return load_data_file(data_dir, "biomes.json")["biomes"]
+
+
+def list_professions(data_dir: str) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Load profession levels and professions.
+
+    Args:
+        data_dir: Path to directory containing JSON configuration files
+
+    Returns:
+        Tuple of (profession_levels, professions), both keyed by id
+    """
+    return (load_data_file(data_dir, "profession_levels.json"),
+            load_data_file(data_dir, "professions.json"))
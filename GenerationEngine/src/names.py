@@ -0,0 +1,48 @@
+"""
+Procedural name generation.
+
+Kept separate from ContentGenerator so name generation needs no data files.
+"""
+
+import random
+
+# Syllable pools used to assemble procedural names, by race
+NAME_SYLLABLES = {
+    "human": {
+        "first": ["Al", "Bren", "Ced", "Da", "El", "Finn", "Gar", "Har", "Iv", "Jas"],
+        "middle": ["dri", "nan", "ric", "mi", "en", "na", "eth", "ugh", "an", "per"],
+        "last": ["c", "n", "k", "en", "a", "s", "th", "on", "or", "er"]
+    },
+    "elf": {
+        "first": ["Ae", "Cal", "El", "Fae", "Gal", "Il", "Lor", "Nae", "Syl", "Vae"],
+        "middle": ["la", "ad", "io", "la", "a", "li", "e", "ri", "va", "li"],
+        "last": ["r", "n", "rel", "lyn", "don", "an", "ei", "s", "ra", "s"]
+    },
+    "dwarf": {
+        "first": ["Thor", "Brom", "Grim", "Dur", "Bal", "Krag", "Mor", "Thar", "Gor", "Bor"],
+        "middle": ["in", "on", "ak", "ek", "ik", "im", "um", "ar", "or", "an"],
+        "last": ["", "", "n", "d", "k", "r", "m", "g", "t", "s"]
+    }
+}
+
+
+def procedural_name(rng: random.Random, race: str = "human", gender: str = "male") -> str:
+    """
+    Generate a procedural name using syllable combination.
+
+    Args:
+        rng: Random number generator to draw syllables from
+        race: Race type for name generation
+        gender: Gender for name generation
+
+    Returns:
+        Procedurally generated name
+    """
+    # Default to human if race not found
+    race_syllables = NAME_SYLLABLES.get(race, NAME_SYLLABLES["human"])
+
+    return (
+        rng.choice(race_syllables["first"]) +
+        rng.choice(race_syllables["middle"]) +
+        rng.choice(race_syllables["last"])
+    )
@@ -0,0 +1,205 @@
+"""
+Tests for the command-line interface (cli.py).
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the GenerationEngine directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cli
+from src.content_generator import ContentGenerator
+from src.datafiles import PACKAGE_DATA_DIR
+
+
+def run_cli(monkeypatch, *argv):
+    """Run cli.main() with the given arguments and return its exit code."""
+    monkeypatch.setattr(sys, "argv", ["cli.py", *argv])
+    return cli.main()
+
+
+@pytest.fixture
+def records_file(tmp_path):
+    """A JSON input file, laid out differently from what export_to_json writes."""
+    generator = ContentGenerator(seed=3)
+    records = [generator.generate_item() for _ in range(5)] + [{"name": "Épée", "value": 1}]
+    path = tmp_path / "records.json"
+    path.write_text(json.dumps(records, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class TestExport:
+    """export copies JSON through unchanged and writes several formats in one run."""
+
+    def test_json_copied_unchanged(self, monkeypatch, records_file, tmp_path):
+        output = tmp_path / "out.json"
+
+        assert run_cli(monkeypatch, "export", "--input", str(records_file), "--output", str(output),
+                       "--export-format", "json") == 0
+        assert output.read_bytes() == records_file.read_bytes()
+
+    def test_pretty_json_round_trip(self, monkeypatch, records_file, tmp_path):
+        output = tmp_path / "out.json"
+
+        assert run_cli(monkeypatch, "export", "--input", str(records_file), "--output", str(output),
+                       "--export-format", "json", "--pretty") == 0
+        text = output.read_text(encoding="utf-8")
+        assert json.loads(text) == json.loads(records_file.read_text(encoding="utf-8"))
+        assert "Épée" in text and text.endswith("}\n]\n")
+
+    def test_several_formats(self, monkeypatch, records_file, tmp_path):
+        records = json.loads(records_file.read_text(encoding="utf-8"))
+        generator = ContentGenerator()
+        generator.export_to_csv(records, str(tmp_path / "expected.csv"))
+        generator.export_to_sql(records, str(tmp_path / "expected.sql"), table_name="loot")
+        generator.export_to_markdown(records, str(tmp_path / "expected.md"), title="Loot")
+
+        assert run_cli(monkeypatch, "export", "--input", str(records_file), "--output", str(tmp_path / "out"),
+                       "--export-format", "csv,json,sql,markdown,csv",
+                       "--table-name", "loot", "--title", "Loot") == 0
+        assert (tmp_path / "out.json").read_bytes() == records_file.read_bytes()
+        for expected, output in (("expected.csv", "out.csv"), ("expected.sql", "out.sql"),
+                                 ("expected.md", "out.md")):
+            assert (tmp_path / output).read_bytes() == (tmp_path / expected).read_bytes()
+
+    def test_unknown_format_rejected(self, monkeypatch, records_file, tmp_path):
+        with pytest.raises(SystemExit):
+            run_cli(monkeypatch, "export", "--input", str(records_file), "--output", str(tmp_path / "out"),
+                    "--export-format", "json,yaml")
+
+
+class TestDispatch:
+    """main() looks the command up in _DISPATCH and only builds a generator when it needs one."""
+
+    def test_every_subcommand_has_handler(self):
+        assert set(cli._SUBCOMMANDS) == set(cli._DISPATCH) == cli._COMMAND_NAMES
+
+    def test_generator_command(self, monkeypatch, tmp_path):
+        output = tmp_path / "item.json"
+
+        assert run_cli(monkeypatch, "generate-item", "--seed", "7", "--format", "json",
+                       "--output", str(output)) == 0
+        assert json.loads(output.read_text(encoding="utf-8")) == ContentGenerator(seed=7).generate_item()
+
+    def test_metadata_command_skips_generator(self, monkeypatch, capsys):
+        def no_generator(*args, **kwargs):
+            raise AssertionError("list-races built a ContentGenerator")
+
+        monkeypatch.setattr(cli, "ContentGenerator", no_generator)
+        monkeypatch.setattr(cli, "_GENERATOR_CACHE", {})
+
+        assert run_cli(monkeypatch, "--no-cache", "list-races") == 0
+        assert "Available Races" in capsys.readouterr().out
+
+    def test_handler_error(self, monkeypatch, capsys):
+        assert run_cli(monkeypatch, "generate-item", "--template", "no_such_template") == 1
+        assert "❌ Error" in capsys.readouterr().err
+
+    def test_no_command(self, monkeypatch, capsys):
+        assert run_cli(monkeypatch) == 1
+        assert "generate-item" in capsys.readouterr().out
+
+
+def subcommand_names(parser):
+    """Names of the subcommands a parser was built with."""
+    return {name for action in parser._actions if isinstance(action, argparse._SubParsersAction)
+            for name in action.choices}
+
+
+class TestLazyParser:
+    """main() builds only the invoked subcommand's parser, found by _peek_command."""
+
+    @pytest.mark.parametrize("argv, command", [
+        (["list-races"], "list-races"),
+        (["--no-cache", "generate-name", "--seed", "1"], "generate-name"),
+        (["--data-dir", "list-races", "generate-item"], "generate-item"),
+        (["--data", "some/dir", "export"], "export"),
+        (["--data-dir=list-races", "list-biomes"], "list-biomes"),
+        (["no-such-command"], None),
+        (["--help"], None),
+        ([], None),
+    ])
+    def test_peek_command(self, argv, command):
+        assert cli._peek_command(argv) == command
+
+    def test_builds_one_subparser(self):
+        assert subcommand_names(cli.build_parser("list-races")) == {"list-races"}
+        assert subcommand_names(cli.build_parser()) == set(cli._SUBCOMMANDS)
+
+    @pytest.mark.parametrize("argv", [
+        ["generate-item", "--template", "weapon_melee", "--count", "3", "--seed", "5"],
+        ["--data-dir", "elsewhere", "generate-npc", "--format", "json"],
+        ["export", "--input", "in.json", "--output", "out", "--export-format", "csv,sql"],
+        ["--no-cache", "list-professions"],
+    ])
+    def test_same_arguments_as_full_parser(self, argv):
+        lazy = cli.build_parser(cli._peek_command(argv)).parse_args(argv)
+        assert lazy == cli.build_parser().parse_args(argv)
+
+
+class TestOutputCache:
+    """list-* and seeded generate-name output is replayed from the on-disk cache."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        return tmp_path / "cache" / "rgen"
+
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        data_dir = tmp_path / "data"
+        shutil.copytree(PACKAGE_DATA_DIR, data_dir)
+        return data_dir
+
+    @staticmethod
+    def break_listings(monkeypatch):
+        def fail(data_dir):
+            raise RuntimeError("data files read")
+
+        monkeypatch.setattr(cli.listings, "list_races", fail)
+
+    def test_replayed(self, monkeypatch, capsys, cache_dir):
+        assert run_cli(monkeypatch, "list-races") == 0
+        first = capsys.readouterr().out
+        assert len(list(cache_dir.iterdir())) == 1
+
+        self.break_listings(monkeypatch)
+        assert run_cli(monkeypatch, "list-races") == 0
+        assert capsys.readouterr().out == first
+
+    def test_no_cache(self, monkeypatch, capsys, cache_dir):
+        assert run_cli(monkeypatch, "list-races") == 0
+        self.break_listings(monkeypatch)
+
+        assert run_cli(monkeypatch, "--no-cache", "list-races") == 1
+        assert "data files read" in capsys.readouterr().err
+
+    def test_edited_data_file_invalidates(self, monkeypatch, capsys, cache_dir, data_dir):
+        assert run_cli(monkeypatch, "--data-dir", str(data_dir), "list-races") == 0
+        assert "Dwarf" in capsys.readouterr().out
+
+        races_path = data_dir / "races.json"
+        races = json.loads(races_path.read_text(encoding="utf-8"))
+        races["races"] = {"gnome": dict(next(iter(races["races"].values())), name="Gnome")}
+        races_path.write_text(json.dumps(races), encoding="utf-8")
+
+        assert run_cli(monkeypatch, "--data-dir", str(data_dir), "list-races") == 0
+        out = capsys.readouterr().out
+        assert "Gnome" in out and "Dwarf" not in out
+
+    def test_seeded_names_only(self, monkeypatch, capsys, cache_dir):
+        assert run_cli(monkeypatch, "generate-name") == 0
+        assert not cache_dir.exists()
+        capsys.readouterr()
+
+        assert run_cli(monkeypatch, "generate-name", "--seed", "3") == 0
+        first = capsys.readouterr().out
+        assert run_cli(monkeypatch, "generate-name", "--seed", "3") == 0
+        assert capsys.readouterr().out == first
+        assert len(list(cache_dir.iterdir())) == 1
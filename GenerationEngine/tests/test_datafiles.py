@@ -0,0 +1,77 @@
+"""
+Tests for the precompiled data blob (src/datafiles.py).
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the GenerationEngine directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.datafiles import (BLOB_NAME, PACKAGE_DATA_DIR, DataBlob, compile_data_files,
+                           is_package_data_dir, open_data_blob)
+from src.content_generator import ContentGenerator
+
+
+@pytest.fixture
+def compiled_dir(tmp_path):
+    """A copy of the package data directory with its blob built."""
+    data_dir = tmp_path / "data"
+    shutil.copytree(PACKAGE_DATA_DIR, data_dir)
+    compile_data_files(str(data_dir))
+    return data_dir
+
+
+def load(data_dir, filename):
+    blob = DataBlob(str(data_dir / BLOB_NAME))
+    return blob.load(filename, os.stat(data_dir / filename))
+
+
+def test_blob_matches_json(compiled_dir):
+    for path in compiled_dir.glob("*.json"):
+        assert load(compiled_dir, path.name) == json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_touched_source_still_matches(compiled_dir):
+    # Installers don't keep mtimes; unchanged contents keep the entry valid
+    path = compiled_dir / "races.json"
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert load(compiled_dir, "races.json") is not None
+
+
+def test_edited_source_is_stale(compiled_dir):
+    path = compiled_dir / "races.json"
+    races = json.loads(path.read_text(encoding="utf-8"))
+    races["races"].pop(next(iter(races["races"])))
+    path.write_text(json.dumps(races), encoding="utf-8")
+
+    assert load(compiled_dir, "races.json") is None
+
+
+def test_same_size_edit_is_stale(compiled_dir):
+    path = compiled_dir / "quality.json"
+    source = path.read_bytes()
+    path.write_bytes(source[:-1] + bytes([source[-1] ^ 1]))
+
+    assert load(compiled_dir, "quality.json") is None
+
+
+def test_only_package_data_dir_is_trusted(compiled_dir):
+    assert is_package_data_dir(PACKAGE_DATA_DIR)
+    assert not is_package_data_dir(str(compiled_dir))
+    assert open_data_blob(str(compiled_dir)) is None
+
+    generator = ContentGenerator(data_dir=str(compiled_dir), seed=1)
+    assert generator._data_blob is None
+    assert generator.generate_item()["name"]
+
+
+def test_default_data_dir():
+    assert ContentGenerator(seed=1).data_dir == Path(PACKAGE_DATA_DIR)
@@ -0,0 +1,142 @@
+"""
+Tests for the ContentGenerator file exporters (export_to_*).
+"""
+
+import csv
+import io
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the GenerationEngine directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.content_generator as content_generator
+from src.content_generator import ColumnarData, ContentGenerator
+
+
+@pytest.fixture(scope="module")
+def generator():
+    return ContentGenerator(seed=42)
+
+
+@pytest.fixture(scope="module")
+def records(generator):
+    """Generated items plus hand-written rows covering the awkward cases."""
+    return [generator.generate_item() for _ in range(20)] + [
+        {"name": "Smith's Hammer", "value": 3, "notes": None},
+        {"name": "Épée, \"fine\"", "tags": ["a", "b"], "stats": {"damage": 1.5}},
+        {"name": "Line\nbreak", "value": -2},
+    ]
+
+
+def baseline_csv(data):
+    """CSV as the original row-by-row DictWriter exporter wrote it."""
+    all_keys = set()
+    for item in data:
+        all_keys.update(item.keys())
+    f = io.StringIO(newline='')
+    writer = csv.DictWriter(f, fieldnames=sorted(all_keys))
+    writer.writeheader()
+    for item in data:
+        writer.writerow({k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in item.items()})
+    return f.getvalue().encode('utf-8')
+
+
+def sql_value(value):
+    """The value a column holds once an exported INSERT has been run by SQLite."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def test_csv_matches_baseline(generator, records, tmp_path):
+    path = tmp_path / "out.csv"
+    generator.export_to_csv(records, str(path))
+
+    assert path.read_bytes() == baseline_csv(records)
+
+
+@pytest.mark.parametrize("batch_size", [3, content_generator.SQL_INSERT_BATCH_SIZE])
+def test_sql_loads_back(generator, records, tmp_path, monkeypatch, batch_size):
+    monkeypatch.setattr(content_generator, "SQL_INSERT_BATCH_SIZE", batch_size)
+    path = tmp_path / "out.sql"
+    generator.export_to_sql(records, str(path), table_name="loot")
+
+    keys = sorted({key for item in records for key in item})
+    script = path.read_text(encoding="utf-8")
+    assert script.count("INSERT INTO loot") == -(-len(records) // batch_size)
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute(f"CREATE TABLE loot ({', '.join(keys)})")
+    conn.executescript(script)
+    rows = conn.execute(f"SELECT {', '.join(keys)} FROM loot ORDER BY rowid").fetchall()
+
+    assert rows == [tuple(sql_value(item.get(key)) for key in keys) for item in records]
+
+
+def test_non_tabular_data_skipped(generator, tmp_path, capsys):
+    generator.export_to_csv({"name": "not a list"}, str(tmp_path / "out.csv"))
+    generator.export_to_sql([], str(tmp_path / "out.sql"))
+
+    assert not (tmp_path / "out.csv").exists()
+    assert not (tmp_path / "out.sql").exists()
+    assert "requires a list of dictionaries" in capsys.readouterr().out
+
+
+def test_parquet_round_trip(generator, records, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    generator.export_to_parquet(records, str(path))
+
+    assert pq.read_table(path).to_pydict() == dict(ColumnarData.from_records(records))
+
+
+def test_parquet_mixed_type_column_as_text(generator, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    generator.export_to_parquet([{"value": 1}, {"value": "many"}, {"value": True}, {}], str(path))
+
+    assert pq.read_table(path).to_pydict() == {"value": ["1", "many", "True", None]}
+
+
+class TestColumnarData:
+    """ColumnarData.from_records pivots records into sorted, JSON-flattened columns."""
+
+    def test_from_records(self):
+        columns = ColumnarData.from_records([
+            {"name": "Axe", "stats": {"damage": 4}},
+            "not a record",
+            {"value": 7, "name": "Bow", "tags": ["ranged"]},
+        ])
+
+        assert list(columns) == ["name", "stats", "tags", "value"]
+        assert columns == {
+            "name": ["Axe", "Bow"],
+            "stats": ['{"damage": 4}', None],
+            "tags": [None, '["ranged"]'],
+            "value": [None, 7],
+        }
+        assert columns.num_rows == 2
+
+    def test_exporters_accept_columns(self, generator, records, tmp_path):
+        columns = ColumnarData.from_records(records)
+        generator.export_to_csv(records, str(tmp_path / "records.csv"))
+        generator.export_to_csv(columns, str(tmp_path / "columns.csv"))
+        generator.export_to_sql(records, str(tmp_path / "records.sql"))
+        generator.export_to_sql(columns, str(tmp_path / "columns.sql"))
+
+        assert (tmp_path / "columns.csv").read_bytes() == (tmp_path / "records.csv").read_bytes()
+        assert (tmp_path / "columns.sql").read_bytes() == (tmp_path / "records.sql").read_bytes()
+
+    def test_no_records(self, generator, tmp_path):
+        columns = ColumnarData.from_records(["a", 1])
+
+        assert columns == {} and columns.num_rows == 0
+        generator.export_to_csv(columns, str(tmp_path / "out.csv"))
+        assert not (tmp_path / "out.csv").exists()
@@ -5,13 +5,689 @@ Supports SQLite and PostgreSQL for storing and retrieving generated content.
 Includes history tracking for all generated items, NPCs, locations, and worlds.
 """
 
+import functools
+import hashlib
+import io
+import itertools
 import json
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+import weakref
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+from collections import OrderedDict
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; iter_world_locations then loads the whole world
+    ijson = None
+
+# Per-connection SQLite tuning: NORMAL sync is durable under WAL, temp tables
+# stay in memory, 64 MiB page cache and a 256 MiB memory map
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Compiled statements kept per SQLite connection. Room for every fixed
+# statement plus all 64 search_items filter combinations.
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+# Read-only SQLite connections kept for get_*/search_items/get_history
+SQLITE_READER_POOL_SIZE = 4
+
+# PostgreSQL connection pool bounds
+PG_POOL_MIN_CONNECTIONS = 2
+PG_POOL_MAX_CONNECTIONS = 16
+
+# PostgreSQL bulk saves switch from INSERT to COPY at this many rows
+PG_COPY_MIN_ROWS = 1024
+
+# Rows per multi-row INSERT statement for smaller PostgreSQL bulk saves
+PG_INSERT_PAGE_SIZE = 500
+
+# Rows fetched per round trip by iter_search_items' server-side cursor
+PG_SEARCH_ITERSIZE = 1000
+
+# Rows per table kept by the get_item/get_npc/get_location/get_world cache
+GET_CACHE_SIZE = 4096
+
+# SQLite 3.45+ stores `data` as binary JSONB: it's smaller and json_extract()
+# doesn't re-tokenize it. json() turns both JSONB and older text rows back
+# into text, so existing databases keep working without a migration.
+SQLITE_HAS_GENERATED_COLUMNS = sqlite3.sqlite_version_info >= (3, 31, 0)
+SQLITE_HAS_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+SQLITE_JSON_PARAM = "jsonb(?)" if SQLITE_HAS_JSONB else "?"
+SQLITE_JSON_COLUMN = "json(data)" if SQLITE_HAS_JSONB else "data"
+
+# The -> operator (3.38+) returns any value at a path as JSON text. The older
+# json_extract() returns scalars as SQL values, so JSON booleans come back as 0/1.
+SQLITE_JSON_FIELD = "data -> ?" if sqlite3.sqlite_version_info >= (3, 38, 0) else "json_quote(json_extract(data, ?))"
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string, accepting non-string keys like json.dumps."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# items table where generated columns are available: searchable fields are
+# projections of data, so saves bind only data and seed; filtered columns are
+# STORED for the indices
+SQLITE_GENERATED_ITEMS_TABLE = """
+    CREATE TABLE IF NOT EXISTS items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT GENERATED ALWAYS AS (json_extract(data, '$.name')) VIRTUAL NOT NULL,
+        type TEXT GENERATED ALWAYS AS (json_extract(data, '$.type')) STORED NOT NULL,
+        subtype TEXT GENERATED ALWAYS AS (json_extract(data, '$.subtype')) VIRTUAL,
+        quality TEXT GENERATED ALWAYS AS (json_extract(data, '$.quality')) STORED,
+        rarity TEXT GENERATED ALWAYS AS (json_extract(data, '$.rarity')) STORED,
+        value INTEGER GENERATED ALWAYS AS (json_extract(data, '$.value')) STORED,
+        material TEXT GENERATED ALWAYS AS (json_extract(data, '$.material')) STORED,
+        data TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        seed INTEGER
+    )
+"""
+
+# items table for SQLite builds without generated columns
+SQLITE_PLAIN_ITEMS_TABLE = """
+    CREATE TABLE IF NOT EXISTS items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL,
+        subtype TEXT,
+        quality TEXT,
+        rarity TEXT,
+        value INTEGER,
+        material TEXT,
+        data TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        seed INTEGER
+    )
+"""
+
+# SQLite tables, in creation order
+SQLITE_TABLES = (
+    SQLITE_GENERATED_ITEMS_TABLE if SQLITE_HAS_GENERATED_COLUMNS else SQLITE_PLAIN_ITEMS_TABLE,
+    """
+        CREATE TABLE IF NOT EXISTS npcs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            title TEXT NOT NULL,
+            archetype TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS locations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            location_id TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS worlds (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            num_locations INTEGER,
+            data TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS animals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            species TEXT NOT NULL,
+            category TEXT NOT NULL,
+            size TEXT,
+            danger_level TEXT,
+            data TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS flora (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            species TEXT NOT NULL,
+            category TEXT NOT NULL,
+            rarity TEXT,
+            magical INTEGER,
+            data TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS generation_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content_type TEXT NOT NULL,
+            content_id INTEGER NOT NULL,
+            template_name TEXT,
+            constraints TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+)
+
+# Tables POSTGRESQL_TABLES creates that get a prepared single-row save
+POSTGRESQL_SAVE_TABLES = ("items", "npcs", "locations", "worlds")
+
+# PostgreSQL tables, in creation order
+POSTGRESQL_TABLES = (
+    """
+        CREATE TABLE IF NOT EXISTS items (
+            id SERIAL PRIMARY KEY,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            subtype TEXT,
+            quality TEXT,
+            rarity TEXT,
+            value INTEGER,
+            material TEXT,
+            data JSONB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS npcs (
+            id SERIAL PRIMARY KEY,
+            name TEXT NOT NULL,
+            title TEXT NOT NULL,
+            archetype TEXT NOT NULL,
+            data JSONB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS locations (
+            id SERIAL PRIMARY KEY,
+            location_id TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            data JSONB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS worlds (
+            id SERIAL PRIMARY KEY,
+            name TEXT,
+            num_locations INTEGER,
+            data JSONB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS generation_history (
+            id SERIAL PRIMARY KEY,
+            content_type TEXT NOT NULL,
+            content_id INTEGER NOT NULL,
+            template_name TEXT,
+            constraints JSONB,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed INTEGER
+        )
+    """,
+)
+
+# Secondary indices by name. The composites match common search_items and
+# get_history filter shapes.
+SQLITE_INDICES = {
+    "idx_items_quality": "CREATE INDEX IF NOT EXISTS idx_items_quality ON items(quality)",
+    "idx_items_rarity": "CREATE INDEX IF NOT EXISTS idx_items_rarity ON items(rarity)",
+    "idx_npcs_archetype": "CREATE INDEX IF NOT EXISTS idx_npcs_archetype ON npcs(archetype)",
+    "idx_locations_type": "CREATE INDEX IF NOT EXISTS idx_locations_type ON locations(type)",
+    "idx_animals_species": "CREATE INDEX IF NOT EXISTS idx_animals_species ON animals(species)",
+    "idx_animals_category": "CREATE INDEX IF NOT EXISTS idx_animals_category ON animals(category)",
+    "idx_flora_species": "CREATE INDEX IF NOT EXISTS idx_flora_species ON flora(species)",
+    "idx_flora_category": "CREATE INDEX IF NOT EXISTS idx_flora_category ON flora(category)",
+    "idx_history_created": "CREATE INDEX IF NOT EXISTS idx_history_created ON generation_history(created_at)",
+    "idx_items_type_quality_rarity": ("CREATE INDEX IF NOT EXISTS idx_items_type_quality_rarity "
+                                      "ON items(type, quality, rarity)"),
+    "idx_items_type_value": "CREATE INDEX IF NOT EXISTS idx_items_type_value ON items(type, value)",
+    "idx_history_type_created": ("CREATE INDEX IF NOT EXISTS idx_history_type_created "
+                                 "ON generation_history(content_type, created_at DESC)"),
+}
+POSTGRESQL_INDICES = {
+    "idx_items_quality": "CREATE INDEX IF NOT EXISTS idx_items_quality ON items(quality)",
+    "idx_items_rarity": "CREATE INDEX IF NOT EXISTS idx_items_rarity ON items(rarity)",
+    "idx_npcs_archetype": "CREATE INDEX IF NOT EXISTS idx_npcs_archetype ON npcs(archetype)",
+    "idx_locations_type": "CREATE INDEX IF NOT EXISTS idx_locations_type ON locations(type)",
+    "idx_history_created": "CREATE INDEX IF NOT EXISTS idx_history_created ON generation_history(created_at)",
+    "idx_items_type_quality_rarity": ("CREATE INDEX IF NOT EXISTS idx_items_type_quality_rarity "
+                                      "ON items(type, quality, rarity) INCLUDE (id)"),
+    "idx_items_type_value": "CREATE INDEX IF NOT EXISTS idx_items_type_value ON items(type, value) INCLUDE (id)",
+    "idx_history_type_created": ("CREATE INDEX IF NOT EXISTS idx_history_type_created "
+                                 "ON generation_history(content_type, created_at DESC)"),
+}
+
+# Single-column indices that are prefixes of a composite index; they only
+# added write cost, so migrate() drops them from existing databases
+SUPERSEDED_INDICES = ("idx_items_type", "idx_history_type")
+
+
+def _schema_script(tables: Tuple[str, ...], indices: Dict[str, str]) -> str:
+    """Join table and index DDL, plus drops of superseded indices, into one script."""
+    statements = [sql.strip() for sql in tables]
+    statements += indices.values()
+    statements += [f"DROP INDEX IF EXISTS {index}" for index in SUPERSEDED_INDICES]
+    return ";\n".join(statements) + ";\n"
+
+
+# Whole schema as one script, so setup is a single call instead of one
+# execute per statement. The SQLite script runs as one transaction.
+SQLITE_SCHEMA = "BEGIN IMMEDIATE;\n" + _schema_script(SQLITE_TABLES, SQLITE_INDICES) + "COMMIT;\n"
+POSTGRESQL_SCHEMA = _schema_script(POSTGRESQL_TABLES, POSTGRESQL_INDICES)
+
+
+# Columns written by each save method, in bind order
+ITEM_COLUMNS = ("name", "type", "subtype", "quality", "rarity", "value", "material", "data", "seed")
+NPC_COLUMNS = ("name", "title", "archetype", "data", "seed")
+LOCATION_COLUMNS = ("location_id", "name", "type", "data", "seed")
+WORLD_COLUMNS = ("name", "num_locations", "data", "seed")
+ANIMAL_COLUMNS = ("name", "species", "category", "size", "danger_level", "data", "seed")
+FLORA_COLUMNS = ("name", "species", "category", "rarity", "magical", "data", "seed")
+HISTORY_COLUMNS = ("content_type", "content_id", "template_name", "constraints", "seed")
+
+# Columns written to an items table whose other columns are generated from data
+GENERATED_ITEM_COLUMNS = ("data", "seed")
+
+
+# Tables with an INSERT path, keyed to their bind-order columns
+TABLE_COLUMNS = {
+    "items": ITEM_COLUMNS,
+    "npcs": NPC_COLUMNS,
+    "locations": LOCATION_COLUMNS,
+    "worlds": WORLD_COLUMNS,
+    "animals": ANIMAL_COLUMNS,
+    "flora": FLORA_COLUMNS,
+    "generation_history": HISTORY_COLUMNS,
+}
+
+# Columns returned by get_history, in result order
+HISTORY_SELECT_COLUMNS = "id, content_type, content_id, template_name, constraints, created_at, seed"
+
+# search_items filters and their conditions, in the order clauses are emitted
+ITEM_SEARCH_FILTERS = (
+    ("type", "type = {}"),
+    ("quality", "quality = {}"),
+    ("rarity", "rarity = {}"),
+    ("min_value", "value >= {}"),
+    ("max_value", "value <= {}"),
+    ("material", "material = {}"),
+)
+
+
+# search_items data_filters key suffixes and their comparison operators
+DATA_FILTER_OPERATORS = (
+    ("__gte", ">="),
+    ("__lte", "<="),
+)
+
+
+def _data_filter(key: str) -> Tuple[str, str]:
+    """Split a data_filters key ("stats.damage__gte") into its dotted path and operator."""
+    for suffix, operator in DATA_FILTER_OPERATORS:
+        if key.endswith(suffix):
+            return key[:-len(suffix)], operator
+    return key, "="
+
+
+@functools.lru_cache(maxsize=64)
+def _item_search_sql(keys: Tuple[str, ...], placeholder: str, data_column: str,
+                     data_operators: Tuple[str, ...] = (), data_condition: str = "") -> str:
+    """
+    Build the search_items query for one combination of filters.
+
+    Args:
+        keys: Filter names present, in ITEM_SEARCH_FILTERS order
+        placeholder: Parameter placeholder of the backend
+        data_column: Expression selecting the item JSON
+        data_operators: Comparison operator of each data filter, in order
+        data_condition: Backend condition comparing a JSON path to a value,
+            with {} for the operator
+
+    Returns:
+        SELECT with a placeholder for each filter value, each data filter's
+        path and value, and LIMIT
+    """
+    conditions = dict(ITEM_SEARCH_FILTERS)
+    clauses = [conditions[key].format(placeholder) for key in keys]
+    clauses += [data_condition.format(operator) for operator in data_operators]
+    where_sql = " AND ".join(clauses) or "1=1"
+    return f"SELECT {data_column} FROM items WHERE {where_sql} LIMIT {placeholder}"
+
+
+def _sqlite_insert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build a SQLite INSERT for columns, binding `data` through SQLITE_JSON_PARAM."""
+    placeholders = ", ".join(SQLITE_JSON_PARAM if column == "data" else "?" for column in columns)
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def _postgresql_insert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build a single-row PostgreSQL INSERT for columns."""
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+
+def _postgresql_prepare_save_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """
+    Build a PREPARE for inserting one row plus its generation_history record.
+
+    The data-modifying CTE feeds the new id to the history insert, so a
+    save is one round trip. The history parameters are cast explicitly: in a SELECT list PostgreSQL
+    can't infer their types from the target columns.
+    """
+    count = len(columns)
+    values = ", ".join(f"${i}" for i in range(1, count + 1))
+    return f"""
+        PREPARE rg_save_{table} AS
+        WITH ins AS (INSERT INTO {table} ({', '.join(columns)}) VALUES ({values}) RETURNING id)
+        INSERT INTO generation_history (content_type, content_id, template_name, constraints, seed)
+        SELECT ${count + 1}::text, id, ${count + 2}::text, ${count + 3}::jsonb, ${count + 4}::integer FROM ins
+        RETURNING content_id
+    """
+
+
+def _sqlite_raw_item_sql() -> str:
+    """
+    Build a SQLite INSERT that fills the items columns from one JSON text
+    parameter (?1), with the seed as ?2.
+    """
+    fields = ", ".join(f"json_extract(j, '$.{column}')" for column in ITEM_COLUMNS[:-2])
+    data = SQLITE_JSON_PARAM.replace("?", "j")
+    return f"INSERT INTO items ({', '.join(ITEM_COLUMNS)}) SELECT {fields}, {data}, ?2 FROM (SELECT ?1 AS j)"
+
+
+def _postgresql_raw_item_sql() -> str:
+    """Build a PostgreSQL INSERT that fills the items columns from one JSONB parameter."""
+    # value goes through numeric so fractional values round like a bound float
+    fields = ", ".join(f"(j->>'{column}')::numeric" if column == "value" else f"j->>'{column}'"
+                       for column in ITEM_COLUMNS[:-2])
+    return (f"INSERT INTO items ({', '.join(ITEM_COLUMNS)}) "
+            f"SELECT {fields}, j, %s FROM (SELECT %s::jsonb AS j) src RETURNING id")
+
+
+def _copy_csv_field(value: Any) -> str:
+    """Format a value for COPY ... (FORMAT csv): unquoted empty is NULL, strings are always quoted."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
+
+
+class _SQLiteDialect:
+    """SQL text and insert mechanics for SQLite."""
+
+    placeholder = "?"
+    data_column = SQLITE_JSON_COLUMN
+    index_sql = SQLITE_INDICES
+
+    insert_sql = {table: _sqlite_insert_sql(table, columns) for table, columns in TABLE_COLUMNS.items()}
+    # Binds (json_text, seed); the items columns are extracted by SQLite
+    insert_raw_item_sql = _sqlite_raw_item_sql()
+    select_data_sql = {table: f"SELECT {SQLITE_JSON_COLUMN} FROM {table} WHERE id = ?" for table in TABLE_COLUMNS}
+    select_field_sql = {table: f"SELECT {SQLITE_JSON_FIELD} FROM {table} WHERE id = ?" for table in TABLE_COLUMNS}
+    # json_extract() returns SQL values, which compare with the bound value directly
+    data_filter_sql = "json_extract(data, ?) {} ?"
+    select_history_sql = f"""
+        SELECT {HISTORY_SELECT_COLUMNS}
+        FROM generation_history
+        ORDER BY created_at DESC
+        LIMIT ?
+    """
+    select_history_by_type_sql = f"""
+        SELECT {HISTORY_SELECT_COLUMNS}
+        FROM generation_history
+        WHERE content_type = ?
+        ORDER BY created_at DESC
+        LIMIT ?
+    """
+    delete_history_sql = "DELETE FROM generation_history WHERE created_at < ?"
+
+    @staticmethod
+    def history_cutoff(days: int) -> str:
+        """CURRENT_TIMESTAMP stores UTC text, so compare against the same format."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        return cutoff.strftime("%Y-%m-%d %H:%M:%S")
+
+    def use_generated_item_columns(self):
+        """Insert items as (data, seed); the other columns are generated from data."""
+        self.insert_sql = dict(self.insert_sql, items=_sqlite_insert_sql("items", GENERATED_ITEM_COLUMNS))
+        self.insert_raw_item_sql = self.insert_sql["items"]
+
+    @staticmethod
+    def field_path(json_path: str) -> str:
+        """Convert a dotted path ("stats.damage", "locations.0") to a JSON path."""
+        path = "$"
+        for key in json_path.split("."):
+            path += f"[{key}]" if key.isdigit() else f'."{key}"'
+        return path
+
+    @staticmethod
+    def json_value(value: Any) -> Any:
+        """Bind a data filter value as-is."""
+        return value
+
+    @staticmethod
+    def load_data(value: str) -> Any:
+        """Decode a stored JSON column."""
+        return _loads(value)
+
+    @staticmethod
+    def flag(value: Any) -> int:
+        """SQLite has no boolean type; store flags as 0/1."""
+        return 1 if value else 0
+
+    def insert(self, cursor, table: str, row: tuple) -> int:
+        """Insert one row and return its ID."""
+        cursor.execute(self.insert_sql[table], row)
+        return cursor.lastrowid
+
+    def insert_with_history(self, cursor, table: str, row: tuple, history: tuple) -> int:
+        """Insert one row plus its generation_history record and return the row's ID."""
+        content_id = self.insert(cursor, table, row)
+        content_type, template_name, constraints, seed = history
+        cursor.execute(self.insert_sql["generation_history"],
+                       (content_type, content_id, template_name, constraints, seed))
+        return content_id
+
+    def insert_raw_item(self, cursor, data_json: str, seed: Optional[int]) -> int:
+        """Insert an item from its JSON text and return its ID."""
+        cursor.execute(self.insert_raw_item_sql, (data_json, seed))
+        return cursor.lastrowid
+
+    def insert_many(self, cursor, table: str, rows: List[tuple]) -> List[int]:
+        """Insert rows with one executemany and return their IDs in input order."""
+        cursor.executemany(self.insert_sql[table], rows)
+        # The transaction holds the write lock, so the new rowids are contiguous
+        cursor.execute("SELECT last_insert_rowid()")
+        last_id = cursor.fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def execute_many(self, cursor, table: str, rows: List[tuple]):
+        """Insert rows without collecting their IDs."""
+        cursor.executemany(self.insert_sql[table], rows)
+
+
+class _PostgreSQLDialect:
+    """SQL text and insert mechanics for PostgreSQL."""
+
+    placeholder = "%s"
+    data_column = "data"
+    index_sql = POSTGRESQL_INDICES
+
+    insert_sql = {table: _postgresql_insert_sql(table, columns) for table, columns in TABLE_COLUMNS.items()}
+    insert_returning_sql = {table: sql + " RETURNING id" for table, sql in insert_sql.items()}
+    # Binds (seed, json_text); the items columns are extracted by the server
+    insert_raw_item_sql = _postgresql_raw_item_sql()
+    # Prepared per connection on first use, so single-row saves skip parsing and planning
+    prepare_save_sql = {
+        table: _postgresql_prepare_save_sql(table, TABLE_COLUMNS[table]) for table in POSTGRESQL_SAVE_TABLES
+    }
+    execute_save_sql = {
+        table: f"EXECUTE rg_save_{table} "
+               f"({', '.join(['%s'] * (len(TABLE_COLUMNS[table]) + len(HISTORY_COLUMNS) - 1))})"
+        for table in POSTGRESQL_SAVE_TABLES
+    }
+    values_sql = {table: f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s"
+                  for table, columns in TABLE_COLUMNS.items()}
+    # As text, so the getters decode (and cache) it the same way as on SQLite
+    select_data_sql = {table: f"SELECT data::text FROM {table} WHERE id = %s" for table in TABLE_COLUMNS}
+    select_field_sql = {table: f"SELECT data #> %s FROM {table} WHERE id = %s" for table in TABLE_COLUMNS}
+    # Compared as jsonb, so numbers order numerically and strings as text
+    data_filter_sql = "data #> %s {} %s::jsonb"
+    select_history_sql = f"""
+        SELECT {HISTORY_SELECT_COLUMNS}
+        FROM generation_history
+        ORDER BY created_at DESC
+        LIMIT %s
+    """
+    select_history_by_type_sql = f"""
+        SELECT {HISTORY_SELECT_COLUMNS}
+        FROM generation_history
+        WHERE content_type = %s
+        ORDER BY created_at DESC
+        LIMIT %s
+    """
+    delete_history_sql = "DELETE FROM generation_history WHERE created_at < NOW() - make_interval(days => %s)"
+
+    def __init__(self):
+        # Pool connection -> tables whose rg_save_* statement it already holds
+        self._prepared_tables = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def history_cutoff(days: int) -> int:
+        """The server computes the cutoff: created_at is in its local time zone."""
+        return days
+
+    @staticmethod
+    def field_path(json_path: str) -> List[str]:
+        """Convert a dotted path ("stats.damage", "locations.0") to a #> path array."""
+        return json_path.split(".")
+
+    @staticmethod
+    def json_value(value: Any) -> str:
+        """Bind a data filter value as JSON text for the ::jsonb cast."""
+        return _dumps(value)
+
+    @staticmethod
+    def load_data(value: Any) -> Any:
+        """The pool's connections already decode JSONB columns."""
+        return value
+
+    @staticmethod
+    def flag(value: Any) -> bool:
+        """Store flags as native booleans."""
+        return bool(value)
+
+    def insert(self, cursor, table: str, row: tuple) -> int:
+        """Insert one row and return its ID."""
+        cursor.execute(self.insert_returning_sql[table], row)
+        return cursor.fetchone()[0]
+
+    def insert_with_history(self, cursor, table: str, row: tuple, history: tuple) -> int:
+        """Insert one row plus its generation_history record in a single statement."""
+        if table not in self.prepare_save_sql:
+            content_id = self.insert(cursor, table, row)
+            content_type, template_name, constraints, seed = history
+            cursor.execute(self.insert_sql["generation_history"],
+                           (content_type, content_id, template_name, constraints, seed))
+            return content_id
+        self._ensure_prepared(cursor, table)
+        cursor.execute(self.execute_save_sql[table], row + history)
+        return cursor.fetchone()[0]
+
+    def _ensure_prepared(self, cursor, table: str):
+        """PREPARE a table's save statement the first time a connection saves to it."""
+        prepared = self._prepared_tables.setdefault(cursor.connection, set())
+        if table in prepared:
+            return
+        cursor.execute(self.prepare_save_sql[table])
+        # Prepared statements live for the session and survive a rollback
+        prepared.add(table)
+
+    def insert_raw_item(self, cursor, data_json: str, seed: Optional[int]) -> int:
+        """Insert an item from its JSON text and return its ID."""
+        cursor.execute(self.insert_raw_item_sql, (seed, data_json))
+        return cursor.fetchone()[0]
+
+    def insert_many(self, cursor, table: str, rows: List[tuple]) -> List[int]:
+        """Insert rows and return their IDs in input order."""
+        if len(rows) >= PG_COPY_MIN_ROWS:
+            return self._copy_rows(cursor, table, rows)
+
+        from psycopg2.extras import execute_values
+
+        # Multi-row VALUES: one round trip per page instead of one per row
+        returned = execute_values(cursor, self.values_sql[table] + " RETURNING id", rows,
+                                  page_size=PG_INSERT_PAGE_SIZE, fetch=True)
+        return [row[0] for row in returned]
+
+    def execute_many(self, cursor, table: str, rows: List[tuple]):
+        """Insert rows without collecting their IDs."""
+        from psycopg2.extras import execute_values
+
+        execute_values(cursor, self.values_sql[table], rows, page_size=PG_INSERT_PAGE_SIZE)
+
+    def _copy_rows(self, cursor, table: str, rows: List[tuple]) -> List[int]:
+        """
+        Load rows with COPY FROM STDIN.
+
+        COPY can't return generated keys, so the IDs are reserved from the
+        table's sequence up front and written along with the rows.
+        """
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+            (table, len(rows))
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+
+        buffer = io.StringIO()
+        for row_id, row in zip(ids, rows):
+            buffer.write(str(row_id))
+            for value in row:
+                buffer.write(",")
+                buffer.write(_copy_csv_field(value))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        cursor.copy_expert(
+            f"COPY {table} (id, {', '.join(TABLE_COLUMNS[table])}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+        return ids
+
 
 class DatabaseManager:
     """
@@ -20,16 +696,51 @@ class DatabaseManager:
     Supports both SQLite and PostgreSQL backends.
     """
 
-    def __init__(self, db_path: str = "r_gen.db", db_type: str = "sqlite"):
+    def __init__(self, db_path: str = "r_gen.db", db_type: str = "sqlite",
+                 dedupe_cache_size: Optional[int] = None):
         """
         Initialize the database manager.
 
         Args:
             db_path: Path to SQLite database file or PostgreSQL connection string
             db_type: Database type ('sqlite' or 'postgresql')
+            dedupe_cache_size: Remember this many recent save_item/save_npc
+                calls; saving an identical payload again returns the earlier
+                ID instead of inserting a duplicate row. Only safe while no
+                other writer deletes rows. None (the default) disables it.
         """
         self.db_path = db_path
         self.db_type = db_type
+        self._is_sqlite = db_type == "sqlite"
+        self._dialect = _SQLiteDialect() if self._is_sqlite else _PostgreSQLDialect()
+        # Set by _init_sqlite when the items table derives its columns from data
+        self._generated_item_columns = False
+        # journal_mode=WAL is persistent in the database file, so it only
+        # needs to be set on the first connection (in-memory databases have no WAL)
+        self._wal_enabled = db_path == ":memory:"
+
+        # Writes share one long-lived connection; reads use a pool
+        self._writer_conn = None
+        self._writer_lock = threading.Lock()
+        self._readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._pg_pool = None
+
+        # Connection of the transaction() block open on each thread, if any
+        self._local = threading.local()
+
+        # Numbers iter_search_items' server-side cursors, which need unique names
+        self._search_cursor_ids = itertools.count()
+
+        # Recently read JSON text for get_item/get_npc/get_location/get_world
+        self._get_cache = {table: OrderedDict() for table in ("items", "npcs", "locations", "worlds")}
+        self._get_cache_lock = threading.RLock()
+
+        # Recent save_item/save_npc payload digests and the IDs they were saved as
+        self._dedupe_cache_size = dedupe_cache_size
+        self._dedupe_cache = OrderedDict()
+        self._dedupe_lock = threading.Lock()
 
         if db_type == "sqlite":
             self._init_sqlite()
@@ -41,120 +752,16 @@ class DatabaseManager:
     def _init_sqlite(self):
         """Initialize SQLite database and create tables."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
+            # executescript commits the writer's open transaction first;
+            # the script then runs in a transaction of its own
+            conn.executescript(SQLITE_SCHEMA)
 
-            # Create items table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    subtype TEXT,
-                    quality TEXT,
-                    rarity TEXT,
-                    value INTEGER,
-                    material TEXT,
-                    data TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create NPCs table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS npcs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    archetype TEXT NOT NULL,
-                    data TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create locations table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS locations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    location_id TEXT UNIQUE NOT NULL,
-                    name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    data TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create worlds table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS worlds (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT,
-                    num_locations INTEGER,
-                    data TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create animals table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS animals (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    species TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    size TEXT,
-                    danger_level TEXT,
-                    data TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create flora table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS flora (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    species TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    rarity TEXT,
-                    magical INTEGER,
-                    data TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create generation history table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS generation_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    content_type TEXT NOT NULL,
-                    content_id INTEGER NOT NULL,
-                    template_name TEXT,
-                    constraints TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create indices
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_type ON items(type)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_quality ON items(quality)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_rarity ON items(rarity)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_npcs_archetype ON npcs(archetype)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_locations_type ON locations(type)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_animals_species ON animals(species)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_animals_category ON animals(category)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_flora_species ON flora(species)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_flora_category ON flora(category)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_type ON generation_history(content_type)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_created ON generation_history(created_at)")
-
-            conn.commit()
+            # Databases created before generated columns keep the plain schema
+            cursor = conn.execute("PRAGMA table_xinfo(items)")
+            # table_xinfo rows: cid, name, type, notnull, dflt_value, pk, hidden
+            if any(row[1] == "type" and row[6] in (2, 3) for row in cursor.fetchall()):
+                self._generated_item_columns = True
+                self._dialect.use_generated_item_columns()
 
     def _init_postgresql(self):
         """Initialize PostgreSQL database and create tables."""
@@ -162,107 +769,226 @@ class DatabaseManager:
             import psycopg2
         except ImportError:
             raise ImportError("psycopg2 package required for PostgreSQL support. Install with: pip install psycopg2-binary")
+        import psycopg2.extensions
+        import psycopg2.extras
+        import psycopg2.pool
+
+        class _Connection(psycopg2.extensions.connection):
+            """Connection that decodes JSONB results with _loads (orjson when installed)."""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                psycopg2.extras.register_default_jsonb(self, loads=_loads)
+
+        self._pg_pool = psycopg2.pool.ThreadedConnectionPool(
+            minconn=PG_POOL_MIN_CONNECTIONS, maxconn=PG_POOL_MAX_CONNECTIONS, dsn=self.db_path,
+            connection_factory=_Connection
+        )
+
+        with self._get_connection() as conn:
+            # psycopg2 sends a multi-statement string as one simple query
+            conn.cursor().execute(POSTGRESQL_SCHEMA)
+            conn.commit()
+
+    def migrate(self):
+        """Bring an existing database's indices up to date with the current schema."""
+        with self._get_connection() as conn:
+            self._drop_superseded_indices(conn.cursor())
+            self._commit(conn)
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Defer secondary index maintenance during a large import.
+
+        Drops the secondary indices, runs the block, then recreates them
+        and runs ANALYZE so the planner sees the new data. Building an
+        index once over the loaded rows is much cheaper than updating it
+        on every insert. Indices are recreated even if the block raises.
+
+        Example:
+            with db.bulk_load():
+                for batch in batches:
+                    db.save_items_bulk(batch)
 
+        Yields:
+            This DatabaseManager
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            for index in self._dialect.index_sql:
+                cursor.execute(f"DROP INDEX IF EXISTS {index}")
+            self._commit(conn)
 
-            # Create items table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS items (
-                    id SERIAL PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    subtype TEXT,
-                    quality TEXT,
-                    rarity TEXT,
-                    value INTEGER,
-                    material TEXT,
-                    data JSONB NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create NPCs table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS npcs (
-                    id SERIAL PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    archetype TEXT NOT NULL,
-                    data JSONB NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create locations table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS locations (
-                    id SERIAL PRIMARY KEY,
-                    location_id TEXT UNIQUE NOT NULL,
-                    name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    data JSONB NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create worlds table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS worlds (
-                    id SERIAL PRIMARY KEY,
-                    name TEXT,
-                    num_locations INTEGER,
-                    data JSONB NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create generation history table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS generation_history (
-                    id SERIAL PRIMARY KEY,
-                    content_type TEXT NOT NULL,
-                    content_id INTEGER NOT NULL,
-                    template_name TEXT,
-                    constraints JSONB,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    seed INTEGER
-                )
-            """)
-
-            # Create indices
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_type ON items(type)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_quality ON items(quality)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_rarity ON items(rarity)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_npcs_archetype ON npcs(archetype)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_locations_type ON locations(type)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_type ON generation_history(content_type)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_created ON generation_history(created_at)")
+        try:
+            yield self
+        finally:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for sql in self._dialect.index_sql.values():
+                    cursor.execute(sql)
+                cursor.execute("ANALYZE")
+                self._commit(conn)
+
+    @staticmethod
+    def _drop_superseded_indices(cursor):
+        """Drop indices whose columns are covered by a composite index."""
+        for index in SUPERSEDED_INDICES:
+            cursor.execute(f"DROP INDEX IF EXISTS {index}")
+
+    def _configure_sqlite(self, conn: sqlite3.Connection):
+        """Apply WAL mode (once per database) and per-connection PRAGMAs."""
+        if not self._wal_enabled:
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_enabled = True
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+
+    def _connect_sqlite(self, readonly: bool = False) -> sqlite3.Connection:
+        """Open a SQLite connection that may be shared between threads."""
+        if readonly:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, check_same_thread=False, uri=True, isolation_level=None,
+                                   cached_statements=SQLITE_STATEMENT_CACHE_SIZE)
+        else:
+            # Autocommit mode: the writer path issues BEGIN IMMEDIATE itself
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                   cached_statements=SQLITE_STATEMENT_CACHE_SIZE)
+        self._configure_sqlite(conn)
+        return conn
 
-            conn.commit()
+    def _acquire_reader(self) -> Tuple[sqlite3.Connection, bool]:
+        """
+        Take a read-only connection from the pool, opening one if there's room.
+
+        Returns:
+            The connection, and whether it belongs to the pool. When every
+            pooled connection is checked out (e.g. by open iter_search_items
+            generators) a temporary one is opened rather than waiting, and
+            the caller closes it instead of returning it to the pool.
+        """
+        try:
+            return self._readers.get_nowait(), True
+        except queue.Empty:
+            pass
+        with self._reader_lock:
+            pooled = self._reader_count < SQLITE_READER_POOL_SIZE
+            if pooled:
+                self._reader_count += 1
+        return self._connect_sqlite(readonly=True), pooled
 
     @contextmanager
-    def _get_connection(self):
-        """Get database connection context manager."""
-        if self.db_type == "sqlite":
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+    def _get_connection(self, readonly: bool = False):
+        """
+        Get database connection context manager.
+
+        Args:
+            readonly: Use a pooled read connection instead of the writer
+        """
+        txn_conn = getattr(self._local, "txn_conn", None)
+        if txn_conn is not None:
+            # Inside transaction(): reads and writes share its connection so
+            # reads see the block's uncommitted saves
+            yield txn_conn
+        elif self._is_sqlite:
+            # An in-memory database only exists on the writer connection
+            if readonly and self.db_path != ":memory:":
+                conn, pooled = self._acquire_reader()
+                try:
+                    yield conn
+                finally:
+                    if pooled:
+                        self._readers.put(conn)
+                    else:
+                        conn.close()
+            else:
+                with self._writer_lock:
+                    if self._writer_conn is None:
+                        self._writer_conn = self._connect_sqlite()
+                    conn = self._writer_conn
+                    if not readonly:
+                        # Take the write lock up front rather than upgrading a
+                        # deferred transaction mid-way, which can hit SQLITE_BUSY
+                        conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        yield conn
+                    finally:
+                        # Writes commit explicitly; anything still open failed
+                        if conn.in_transaction:
+                            conn.rollback()
+        else:  # postgresql
+            conn = self._pg_pool.getconn()
             try:
                 yield conn
+            except BaseException:
+                conn.rollback()
+                raise
             finally:
-                conn.close()
-        elif self.db_type == "postgresql":
-            import psycopg2
-            import psycopg2.extras
-            conn = psycopg2.connect(self.db_path)
+                # putconn rolls back any transaction a read left open
+                self._pg_pool.putconn(conn)
+
+    def _commit(self, conn):
+        """Commit, unless a transaction() block will commit for us."""
+        if getattr(self._local, "txn_conn", None) is None:
+            conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group saves into a single transaction.
+
+        Saves inside the block skip their own commit and are committed
+        together when the block exits, or rolled back if it raises. This
+        turns one fsync per save into one per block. Nested blocks join
+        the outer transaction.
+
+        Yields:
+            This DatabaseManager
+        """
+        if getattr(self._local, "txn_conn", None) is not None:
+            yield self
+            return
+
+        with self._get_connection() as conn:
+            self._local.txn_conn = conn
             try:
-                yield conn
+                yield self
             finally:
-                conn.close()
+                self._local.txn_conn = None
+            conn.commit()
+
+    def close(self):
+        """Close the writer connection and every pooled connection."""
+        with self._writer_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
+        with self._reader_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._reader_count = 0
+        if self._pg_pool is not None:
+            self._pg_pool.closeall()
+            self._pg_pool = None
+
+    def _item_row(self, item: Dict[str, Any], seed: Optional[int]) -> tuple:
+        """Build the bind values for one items row."""
+        if self._generated_item_columns:
+            return (_dumps(item), seed)
+        return (
+            item["name"],
+            item["type"],
+            item.get("subtype"),
+            item.get("quality"),
+            item.get("rarity"),
+            item.get("value"),
+            item.get("material"),
+            _dumps(item),
+            seed
+        )
 
     def save_item(self, item: Dict[str, Any], template_name: Optional[str] = None,
                   constraints: Optional[Dict] = None, seed: Optional[int] = None) -> int:
@@ -278,49 +1004,90 @@ class DatabaseManager:
         Returns:
             Database ID of saved item
         """
+        row = self._item_row(item, seed)
+
+        history = self._history_values("item", template_name, constraints, seed)
+        dedupe_key = self._dedupe_key("items", row, history)
+        if dedupe_key is not None:
+            item_id = self._recall_save(dedupe_key)
+            if item_id is not None:
+                return item_id
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            data_str = json.dumps(item)
-
-            if self.db_type == "sqlite":
-                cursor.execute("""
-                    INSERT INTO items (name, type, subtype, quality, rarity, value, material, data, seed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    item["name"],
-                    item["type"],
-                    item.get("subtype"),
-                    item.get("quality"),
-                    item.get("rarity"),
-                    item.get("value"),
-                    item.get("material"),
-                    data_str,
-                    seed
-                ))
-                item_id = cursor.lastrowid
-            else:  # postgresql
-                cursor.execute("""
-                    INSERT INTO items (name, type, subtype, quality, rarity, value, material, data, seed)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                """, (
-                    item["name"],
-                    item["type"],
-                    item.get("subtype"),
-                    item.get("quality"),
-                    item.get("rarity"),
-                    item.get("value"),
-                    item.get("material"),
-                    data_str,
-                    seed
-                ))
-                item_id = cursor.fetchone()[0]
+            # The row and its history record
+            item_id = self._dialect.insert_with_history(cursor, "items", row, history)
+
+            self._commit(conn)
+            self._forget("items", (item_id,))
+            self._remember_save(dedupe_key, item_id)
+            return item_id
+
+    def save_items_bulk(self, items: List[Dict[str, Any]], template_name: Optional[str] = None,
+                        constraints: Optional[Dict] = None, seed: Optional[int] = None) -> List[int]:
+        """
+        Save many items in a single transaction.
+
+        Prefer this over calling save_item() in a loop: all rows (and their
+        history records) are written with one commit instead of one per item.
+
+        Args:
+            items: List of item dictionaries
+            template_name: Template used to generate the items
+            constraints: Constraints applied during generation
+            seed: Random seed used for generation
+
+        Returns:
+            Database IDs of the saved items, in input order
+        """
+        if not items:
+            return []
+
+        item_row = self._item_row
+        rows = [item_row(item, seed) for item in items]
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            item_ids = self._dialect.insert_many(cursor, "items", rows)
 
             # Save to history
-            self._save_history(conn, "item", item_id, template_name, constraints, seed)
+            self._save_history_bulk(conn, "item", item_ids, template_name, constraints, seed)
 
-            conn.commit()
+            self._commit(conn)
+            self._forget("items", item_ids)
+            return item_ids
+
+    def save_item_raw(self, data_json: Union[str, bytes], template_name: Optional[str] = None,
+                      constraints: Optional[Dict] = None, seed: Optional[int] = None) -> int:
+        """
+        Save an item that is already serialized as JSON.
+
+        The text is stored as-is and the searchable columns are extracted
+        by the database, so the item is never decoded in Python.
+
+        Args:
+            data_json: Item as a UTF-8 JSON object, with the same keys save_item reads
+            template_name: Template used to generate the item
+            constraints: Constraints applied during generation
+            seed: Random seed used for generation
+
+        Returns:
+            Database ID of saved item
+        """
+        if isinstance(data_json, bytes):
+            # A bytes parameter would be bound as a BLOB, which SQLite reads as JSONB
+            data_json = data_json.decode("utf-8")
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            item_id = self._dialect.insert_raw_item(cursor, data_json, seed)
+            self._save_history_bulk(conn, "item", [item_id], template_name, constraints, seed)
+
+            self._commit(conn)
+            self._forget("items", (item_id,))
             return item_id
 
     def save_npc(self, npc: Dict[str, Any], archetype: Optional[str] = None, seed: Optional[int] = None) -> int:
@@ -335,42 +1102,55 @@ class DatabaseManager:
         Returns:
             Database ID of saved NPC
         """
+        row = (npc["name"], npc["title"], archetype, _dumps(npc), seed)
+
+        history = self._history_values("npc", archetype, None, seed)
+        dedupe_key = self._dedupe_key("npcs", row, history)
+        if dedupe_key is not None:
+            npc_id = self._recall_save(dedupe_key)
+            if npc_id is not None:
+                return npc_id
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            # The row and its history record
+            npc_id = self._dialect.insert_with_history(cursor, "npcs", row, history)
+
+            self._commit(conn)
+            self._forget("npcs", (npc_id,))
+            self._remember_save(dedupe_key, npc_id)
+            return npc_id
+
+    def save_npcs_bulk(self, npcs: List[Dict[str, Any]], archetype: Optional[str] = None,
+                       seed: Optional[int] = None) -> List[int]:
+        """
+        Save many NPCs in a single transaction.
+
+        Args:
+            npcs: List of NPC dictionaries
+            archetype: Archetype used to generate the NPCs
+            seed: Random seed used for generation
+
+        Returns:
+            Database IDs of the saved NPCs, in input order
+        """
+        if not npcs:
+            return []
+
+        rows = [(npc["name"], npc["title"], archetype, _dumps(npc), seed) for npc in npcs]
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            data_str = json.dumps(npc)
-
-            if self.db_type == "sqlite":
-                cursor.execute("""
-                    INSERT INTO npcs (name, title, archetype, data, seed)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    npc["name"],
-                    npc["title"],
-                    archetype,
-                    data_str,
-                    seed
-                ))
-                npc_id = cursor.lastrowid
-            else:  # postgresql
-                cursor.execute("""
-                    INSERT INTO npcs (name, title, archetype, data, seed)
-                    VALUES (%s, %s, %s, %s, %s)
-                    RETURNING id
-                """, (
-                    npc["name"],
-                    npc["title"],
-                    archetype,
-                    data_str,
-                    seed
-                ))
-                npc_id = cursor.fetchone()[0]
+            npc_ids = self._dialect.insert_many(cursor, "npcs", rows)
 
             # Save to history
-            self._save_history(conn, "npc", npc_id, archetype, None, seed)
+            self._save_history_bulk(conn, "npc", npc_ids, archetype, None, seed)
 
-            conn.commit()
-            return npc_id
+            self._commit(conn)
+            self._forget("npcs", npc_ids)
+            return npc_ids
 
     def save_location(self, location: Dict[str, Any], template_name: Optional[str] = None, seed: Optional[int] = None) -> int:
         """
@@ -384,42 +1164,55 @@ class DatabaseManager:
         Returns:
             Database ID of saved location
         """
+        row = (location["id"], location["name"], location["type"], _dumps(location), seed)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            # The row and its history record
+            loc_id = self._dialect.insert_with_history(
+                cursor, "locations", row, self._history_values("location", template_name, None, seed)
+            )
+
+            self._commit(conn)
+            self._forget("locations", (loc_id,))
+            return loc_id
+
+    def save_locations_bulk(self, locations: List[Dict[str, Any]], template_name: Optional[str] = None,
+                            seed: Optional[int] = None) -> List[int]:
+        """
+        Save many locations in a single transaction.
+
+        Args:
+            locations: List of location dictionaries
+            template_name: Template used to generate the locations
+            seed: Random seed used for generation
+
+        Returns:
+            Database IDs of the saved locations, in input order
+        """
+        if not locations:
+            return []
+
+        rows = [(
+            location["id"],
+            location["name"],
+            location["type"],
+            _dumps(location),
+            seed
+        ) for location in locations]
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            data_str = json.dumps(location)
-
-            if self.db_type == "sqlite":
-                cursor.execute("""
-                    INSERT INTO locations (location_id, name, type, data, seed)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    location["id"],
-                    location["name"],
-                    location["type"],
-                    data_str,
-                    seed
-                ))
-                loc_id = cursor.lastrowid
-            else:  # postgresql
-                cursor.execute("""
-                    INSERT INTO locations (location_id, name, type, data, seed)
-                    VALUES (%s, %s, %s, %s, %s)
-                    RETURNING id
-                """, (
-                    location["id"],
-                    location["name"],
-                    location["type"],
-                    data_str,
-                    seed
-                ))
-                loc_id = cursor.fetchone()[0]
+            loc_ids = self._dialect.insert_many(cursor, "locations", rows)
 
             # Save to history
-            self._save_history(conn, "location", loc_id, template_name, None, seed)
+            self._save_history_bulk(conn, "location", loc_ids, template_name, None, seed)
 
-            conn.commit()
-            return loc_id
+            self._commit(conn)
+            self._forget("locations", loc_ids)
+            return loc_ids
 
     def save_world(self, world: Dict[str, Any], name: Optional[str] = None, seed: Optional[int] = None) -> int:
         """
@@ -433,31 +1226,57 @@ class DatabaseManager:
         Returns:
             Database ID of saved world
         """
+        row = (name, len(world.get("locations", {})), _dumps(world), seed)
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            data_str = json.dumps(world)
-            num_locations = len(world.get("locations", {}))
-
-            if self.db_type == "sqlite":
-                cursor.execute("""
-                    INSERT INTO worlds (name, num_locations, data, seed)
-                    VALUES (?, ?, ?, ?)
-                """, (name, num_locations, data_str, seed))
-                world_id = cursor.lastrowid
-            else:  # postgresql
-                cursor.execute("""
-                    INSERT INTO worlds (name, num_locations, data, seed)
-                    VALUES (%s, %s, %s, %s)
-                    RETURNING id
-                """, (name, num_locations, data_str, seed))
-                world_id = cursor.fetchone()[0]
+            # The row and its history record
+            world_id = self._dialect.insert_with_history(
+                cursor, "worlds", row, self._history_values("world", None, None, seed)
+            )
+
+            self._commit(conn)
+            self._forget("worlds", (world_id,))
+            return world_id
+
+    def save_worlds_bulk(self, worlds: List[Dict[str, Any]], names: Optional[List[Optional[str]]] = None,
+                         seed: Optional[int] = None) -> List[int]:
+        """
+        Save many worlds in a single transaction.
+
+        Args:
+            worlds: List of world dictionaries
+            names: Optional names for the worlds, parallel to worlds
+            seed: Random seed used for generation
+
+        Returns:
+            Database IDs of the saved worlds, in input order
+        """
+        if not worlds:
+            return []
+
+        if names is None:
+            names = [None] * len(worlds)
+
+        rows = [(
+            name,
+            len(world.get("locations", {})),
+            _dumps(world),
+            seed
+        ) for world, name in zip(worlds, names)]
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            world_ids = self._dialect.insert_many(cursor, "worlds", rows)
 
             # Save to history
-            self._save_history(conn, "world", world_id, None, None, seed)
+            self._save_history_bulk(conn, "world", world_ids, None, None, seed)
 
-            conn.commit()
-            return world_id
+            self._commit(conn)
+            self._forget("worlds", world_ids)
+            return world_ids
 
     def save_animal(self, animal: Dict[str, Any], seed: Optional[int] = None) -> int:
         """
@@ -470,46 +1289,61 @@ class DatabaseManager:
         Returns:
             Database ID of saved animal
         """
+        row = (
+            animal["name"],
+            animal["species"],
+            animal["category"],
+            animal.get("size"),
+            animal.get("danger_level"),
+            _dumps(animal),
+            seed
+        )
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            # The row and its history record
+            animal_id = self._dialect.insert_with_history(
+                cursor, "animals", row, self._history_values("animal", None, None, seed)
+            )
+
+            self._commit(conn)
+            return animal_id
+
+    def save_animals_bulk(self, animals: List[Dict[str, Any]], seed: Optional[int] = None) -> List[int]:
+        """
+        Save many animals in a single transaction.
+
+        Args:
+            animals: List of animal dictionaries
+            seed: Random seed used for generation
+
+        Returns:
+            Database IDs of the saved animals, in input order
+        """
+        if not animals:
+            return []
+
+        rows = [(
+            animal["name"],
+            animal["species"],
+            animal["category"],
+            animal.get("size"),
+            animal.get("danger_level"),
+            _dumps(animal),
+            seed
+        ) for animal in animals]
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            data_str = json.dumps(animal)
-
-            if self.db_type == "sqlite":
-                cursor.execute("""
-                    INSERT INTO animals (name, species, category, size, danger_level, data, seed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    animal["name"],
-                    animal["species"],
-                    animal["category"],
-                    animal.get("size"),
-                    animal.get("danger_level"),
-                    data_str,
-                    seed
-                ))
-                animal_id = cursor.lastrowid
-            else:  # postgresql
-                cursor.execute("""
-                    INSERT INTO animals (name, species, category, size, danger_level, data, seed)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                """, (
-                    animal["name"],
-                    animal["species"],
-                    animal["category"],
-                    animal.get("size"),
-                    animal.get("danger_level"),
-                    data_str,
-                    seed
-                ))
-                animal_id = cursor.fetchone()[0]
+            animal_ids = self._dialect.insert_many(cursor, "animals", rows)
 
             # Save to history
-            self._save_history(conn, "animal", animal_id, None, None, seed)
+            self._save_history_bulk(conn, "animal", animal_ids, None, None, seed)
 
-            conn.commit()
-            return animal_id
+            self._commit(conn)
+            return animal_ids
 
     def save_flora(self, flora: Dict[str, Any], seed: Optional[int] = None) -> int:
         """
@@ -522,126 +1356,237 @@ class DatabaseManager:
         Returns:
             Database ID of saved flora
         """
+        row = (
+            flora["name"],
+            flora["species"],
+            flora["category"],
+            flora.get("rarity"),
+            self._dialect.flag(flora.get("magical")),
+            _dumps(flora),
+            seed
+        )
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            data_str = json.dumps(flora)
-
-            if self.db_type == "sqlite":
-                cursor.execute("""
-                    INSERT INTO flora (name, species, category, rarity, magical, data, seed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    flora["name"],
-                    flora["species"],
-                    flora["category"],
-                    flora.get("rarity"),
-                    1 if flora.get("magical") else 0,
-                    data_str,
-                    seed
-                ))
-                flora_id = cursor.lastrowid
-            else:  # postgresql
-                cursor.execute("""
-                    INSERT INTO flora (name, species, category, rarity, magical, data, seed)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                """, (
-                    flora["name"],
-                    flora["species"],
-                    flora["category"],
-                    flora.get("rarity"),
-                    flora.get("magical", False),
-                    data_str,
-                    seed
-                ))
-                flora_id = cursor.fetchone()[0]
+            # The row and its history record
+            flora_id = self._dialect.insert_with_history(
+                cursor, "flora", row, self._history_values("flora", None, None, seed)
+            )
 
-            # Save to history
-            self._save_history(conn, "flora", flora_id, None, None, seed)
-
-            conn.commit()
+            self._commit(conn)
             return flora_id
 
-    def _save_history(self, conn, content_type: str, content_id: int, template_name: Optional[str],
-                     constraints: Optional[Dict], seed: Optional[int]):
-        """Save generation history record."""
-        cursor = conn.cursor()
+    def save_flora_bulk(self, flora_list: List[Dict[str, Any]], seed: Optional[int] = None) -> List[int]:
+        """
+        Save many flora entries in a single transaction.
 
-        constraints_str = json.dumps(constraints) if constraints else None
+        Args:
+            flora_list: List of flora dictionaries
+            seed: Random seed used for generation
 
-        if self.db_type == "sqlite":
-            cursor.execute("""
-                INSERT INTO generation_history (content_type, content_id, template_name, constraints, seed)
-                VALUES (?, ?, ?, ?, ?)
-            """, (content_type, content_id, template_name, constraints_str, seed))
-        else:  # postgresql
-            cursor.execute("""
-                INSERT INTO generation_history (content_type, content_id, template_name, constraints, seed)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (content_type, content_id, template_name, constraints_str, seed))
+        Returns:
+            Database IDs of the saved flora, in input order
+        """
+        if not flora_list:
+            return []
+
+        rows = [(
+            flora["name"],
+            flora["species"],
+            flora["category"],
+            flora.get("rarity"),
+            self._dialect.flag(flora.get("magical")),
+            _dumps(flora),
+            seed
+        ) for flora in flora_list]
 
-    def get_item(self, item_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieve an item by ID."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            if self.db_type == "sqlite":
-                cursor.execute("SELECT data FROM items WHERE id = ?", (item_id,))
-            else:
-                cursor.execute("SELECT data FROM items WHERE id = %s", (item_id,))
+            flora_ids = self._dialect.insert_many(cursor, "flora", rows)
 
-            row = cursor.fetchone()
-            if row:
-                return json.loads(row[0] if self.db_type == "sqlite" else row["data"])
-            return None
+            # Save to history
+            self._save_history_bulk(conn, "flora", flora_ids, None, None, seed)
 
-    def get_npc(self, npc_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieve an NPC by ID."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+            self._commit(conn)
+            return flora_ids
 
-            if self.db_type == "sqlite":
-                cursor.execute("SELECT data FROM npcs WHERE id = ?", (npc_id,))
-            else:
-                cursor.execute("SELECT data FROM npcs WHERE id = %s", (npc_id,))
+    @staticmethod
+    def _history_values(content_type: str, template_name: Optional[str], constraints: Optional[Dict],
+                        seed: Optional[int]) -> tuple:
+        """Build the history values that accompany a saved row (all but content_id)."""
+        return (content_type, template_name, _dumps(constraints) if constraints else None, seed)
 
-            row = cursor.fetchone()
-            if row:
-                return json.loads(row[0] if self.db_type == "sqlite" else row["data"])
-            return None
+    def _save_history_bulk(self, conn, content_type: str, content_ids: List[int], template_name: Optional[str],
+                           constraints: Optional[Dict], seed: Optional[int]):
+        """Save generation history records for a batch of content in one statement."""
+        cursor = conn.cursor()
 
-    def get_location(self, location_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieve a location by ID."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        constraints_str = _dumps(constraints) if constraints else None
+        rows = [(content_type, content_id, template_name, constraints_str, seed) for content_id in content_ids]
 
-            if self.db_type == "sqlite":
-                cursor.execute("SELECT data FROM locations WHERE id = ?", (location_id,))
-            else:
-                cursor.execute("SELECT data FROM locations WHERE id = %s", (location_id,))
+        self._dialect.execute_many(cursor, "generation_history", rows)
 
+    def _dedupe_key(self, table: str, row: tuple, history: tuple) -> Optional[Tuple[str, bytes]]:
+        """Digest of a save's bind values, or None when deduplication is off."""
+        if not self._dedupe_cache_size:
+            return None
+        digest = hashlib.blake2b(repr((row, history)).encode(), digest_size=16).digest()
+        return (table, digest)
+
+    def _recall_save(self, key: Tuple[str, bytes]) -> Optional[int]:
+        """ID an identical earlier save was stored under, if still cached."""
+        with self._dedupe_lock:
+            row_id = self._dedupe_cache.get(key)
+            if row_id is not None:
+                self._dedupe_cache.move_to_end(key)
+            return row_id
+
+    def _remember_save(self, key: Optional[Tuple[str, bytes]], row_id: int):
+        """Record a committed save for _recall_save."""
+        # Inside transaction() the row may still be rolled back
+        if key is None or getattr(self._local, "txn_conn", None) is not None:
+            return
+        with self._dedupe_lock:
+            self._dedupe_cache[key] = row_id
+            if len(self._dedupe_cache) > self._dedupe_cache_size:
+                self._dedupe_cache.popitem(last=False)
+
+    def _get_data(self, table: str, row_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Load one row's data, keeping recently read JSON in an LRU cache.
+
+        The cache holds the JSON text, so each call still returns a fresh
+        object that the caller can modify.
+        """
+        cache = self._get_cache[table]
+        with self._get_cache_lock:
+            text = cache.get(row_id)
+            if text is not None:
+                cache.move_to_end(row_id)
+                return _loads(text)
+
+        with self._get_connection(readonly=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._dialect.select_data_sql[table], (row_id,))
             row = cursor.fetchone()
-            if row:
-                return json.loads(row[0] if self.db_type == "sqlite" else row["data"])
+
+        if row is None:
             return None
 
+        text = row[0]
+        # Rows read inside transaction() may still be rolled back
+        if getattr(self._local, "txn_conn", None) is None:
+            with self._get_cache_lock:
+                cache[row_id] = text
+                if len(cache) > GET_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return _loads(text)
+
+    def _forget(self, table: str, row_ids):
+        """Drop cached reads for IDs just written (a rolled-back ID can be reused)."""
+        cache = self._get_cache[table]
+        with self._get_cache_lock:
+            for row_id in row_ids:
+                cache.pop(row_id, None)
+
+    def get_item(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Retrieve an item by ID."""
+        return self._get_data("items", item_id)
+
+    def get_npc(self, npc_id: int) -> Optional[Dict[str, Any]]:
+        """Retrieve an NPC by ID."""
+        return self._get_data("npcs", npc_id)
+
+    def get_location(self, location_id: int) -> Optional[Dict[str, Any]]:
+        """Retrieve a location by ID."""
+        return self._get_data("locations", location_id)
+
     def get_world(self, world_id: int) -> Optional[Dict[str, Any]]:
         """Retrieve a world by ID."""
-        with self._get_connection() as conn:
+        return self._get_data("worlds", world_id)
+
+    def iter_world_locations(self, world_id: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over a world's locations without loading the whole world.
+
+        On SQLite with Python 3.11+ and ijson installed, the stored JSON text
+        is read through incremental blob I/O and parsed as a stream, so
+        memory use is bounded by one location rather than the whole world.
+        The pooled read connection stays checked out until the iterator is
+        exhausted or closed. Otherwise (PostgreSQL, JSONB rows, no ijson, or
+        SQLite's shared writer connection) this falls back to get_world().
+
+        Args:
+            world_id: Database ID of the world
+
+        Yields:
+            (location_id, location) pairs, in stored order
+        """
+        if ijson is not None and self._is_sqlite and hasattr(sqlite3.Connection, "blobopen"):
+            with self._get_connection(readonly=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT typeof(data) FROM worlds WHERE id = ?", (world_id,))
+                row = cursor.fetchone()
+                if row is None:
+                    return
+                # JSONB rows are binary, not JSON text, so they can't be stream-parsed.
+                # The writer connection (an in-memory database or inside transaction())
+                # is shared under a lock, which must not be held while yielding.
+                if row[0] == "text" and conn is not self._writer_conn:
+                    with conn.blobopen("worlds", "data", world_id, readonly=True) as blob:
+                        yield from ijson.kvitems(blob, "locations", use_float=True)
+                    return
+
+        world = self.get_world(world_id)
+        if world is not None:
+            yield from world.get("locations", {}).items()
+
+    def get_item_field(self, item_id: int, json_path: str) -> Any:
+        """Retrieve one field of an item; see get_world_field()."""
+        return self._get_field("items", item_id, json_path)
+
+    def get_npc_field(self, npc_id: int, json_path: str) -> Any:
+        """Retrieve one field of an NPC; see get_world_field()."""
+        return self._get_field("npcs", npc_id, json_path)
+
+    def get_location_field(self, location_id: int, json_path: str) -> Any:
+        """Retrieve one field of a location; see get_world_field()."""
+        return self._get_field("locations", location_id, json_path)
+
+    def get_world_field(self, world_id: int, json_path: str) -> Any:
+        """
+        Retrieve one field of a world without loading the whole document.
+
+        The database extracts the value, so only that part is transferred
+        and decoded. Prefer this over get_world(world_id)[...] for large
+        worlds.
+
+        Args:
+            world_id: Database ID of the world
+            json_path: Dotted path to the field, e.g. "name" or "locations.0"
+
+        Returns:
+            Value at json_path, or None if the world or the field doesn't exist
+        """
+        return self._get_field("worlds", world_id, json_path)
+
+    def _get_field(self, table: str, row_id: int, json_path: str) -> Any:
+        """Fetch the value at json_path from one row's data column."""
+        with self._get_connection(readonly=True) as conn:
             cursor = conn.cursor()
 
-            if self.db_type == "sqlite":
-                cursor.execute("SELECT data FROM worlds WHERE id = ?", (world_id,))
-            else:
-                cursor.execute("SELECT data FROM worlds WHERE id = %s", (world_id,))
+            cursor.execute(self._dialect.select_field_sql[table],
+                           (self._dialect.field_path(json_path), row_id))
 
             row = cursor.fetchone()
-            if row:
-                return json.loads(row[0] if self.db_type == "sqlite" else row["data"])
+            if row and row[0] is not None:
+                return self._dialect.load_data(row[0])
             return None
 
-    def search_items(self, filters: Optional[Dict[str, Any]] = None, limit: int = 100) -> List[Dict[str, Any]]:
+    def search_items(self, filters: Optional[Dict[str, Any]] = None, limit: int = 100,
+                     data_filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Search for items with optional filters.
 
@@ -654,53 +1599,74 @@ class DatabaseManager:
                 - max_value: Maximum value
                 - material: Material type
             limit: Maximum number of results
+            data_filters: Filters on fields inside the item JSON, keyed by
+                dotted path ("stats.damage"). A plain path matches equal
+                values; a "__gte" or "__lte" suffix compares. The database
+                evaluates them, so non-matching items are never decoded.
 
         Returns:
             List of matching items
         """
-        filters = filters or {}
+        return list(self.iter_search_items(filters, limit, data_filters))
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            where_clauses = []
-            params = []
-
-            if "type" in filters:
-                where_clauses.append("type = ?" if self.db_type == "sqlite" else "type = %s")
-                params.append(filters["type"])
-
-            if "quality" in filters:
-                where_clauses.append("quality = ?" if self.db_type == "sqlite" else "quality = %s")
-                params.append(filters["quality"])
-
-            if "rarity" in filters:
-                where_clauses.append("rarity = ?" if self.db_type == "sqlite" else "rarity = %s")
-                params.append(filters["rarity"])
+    def iter_search_items(self, filters: Optional[Dict[str, Any]] = None,
+                          limit: int = 100,
+                          data_filters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Search for items, yielding them one at a time.
 
-            if "min_value" in filters:
-                where_clauses.append("value >= ?" if self.db_type == "sqlite" else "value >= %s")
-                params.append(filters["min_value"])
+        Rows are decoded as they are fetched instead of all at once. On
+        PostgreSQL a server-side cursor streams them in batches of
+        PG_SEARCH_ITERSIZE. The connection stays checked out until the
+        iterator is exhausted or closed, except for SQLite's shared writer
+        connection (an in-memory database or inside transaction()): its rows
+        are all read up front so the lock is released while the caller works.
 
-            if "max_value" in filters:
-                where_clauses.append("value <= ?" if self.db_type == "sqlite" else "value <= %s")
-                params.append(filters["max_value"])
+        Args:
+            filters: Filter criteria, as for search_items()
+            limit: Maximum number of results
+            data_filters: Filters on the item JSON, as for search_items()
 
-            if "material" in filters:
-                where_clauses.append("material = ?" if self.db_type == "sqlite" else "material = %s")
-                params.append(filters["material"])
+        Yields:
+            Matching items
+        """
+        filters = filters or {}
 
-            where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+        with self._get_connection(readonly=True) as conn:
+            if self._is_sqlite:
+                cursor = conn.cursor()
+            else:
+                cursor = conn.cursor(name=f"rg_search_{next(self._search_cursor_ids)}")
+                cursor.itersize = PG_SEARCH_ITERSIZE
+
+            keys = tuple(key for key, _ in ITEM_SEARCH_FILTERS if key in filters)
+            params = [filters[key] for key in keys]
+
+            data_operators = []
+            for key, value in (data_filters or {}).items():
+                path, operator = _data_filter(key)
+                params.append(self._dialect.field_path(path))
+                params.append(self._dialect.json_value(value))
+                data_operators.append(operator)
             params.append(limit)
 
-            query = f"SELECT data FROM items WHERE {where_sql} LIMIT {'?' if self.db_type == 'sqlite' else '%s'}"
-            cursor.execute(query, params)
+            sql = _item_search_sql(keys, self._dialect.placeholder, self._dialect.data_column,
+                                   tuple(data_operators), self._dialect.data_filter_sql)
+            cursor.execute(sql, params)
 
-            results = []
-            for row in cursor.fetchall():
-                results.append(json.loads(row[0] if self.db_type == "sqlite" else row["data"]))
+            if conn is not self._writer_conn:
+                try:
+                    for row in cursor:
+                        yield self._dialect.load_data(row[0])
+                finally:
+                    cursor.close()
+                return
 
-            return results
+            rows = cursor.fetchall()
+            cursor.close()
+
+        for row in rows:
+            yield self._dialect.load_data(row[0])
 
     def get_history(self, content_type: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -713,64 +1679,26 @@ class DatabaseManager:
         Returns:
             List of history records
         """
-        with self._get_connection() as conn:
+        with self._get_connection(readonly=True) as conn:
             cursor = conn.cursor()
 
             if content_type:
-                if self.db_type == "sqlite":
-                    cursor.execute("""
-                        SELECT id, content_type, content_id, template_name, constraints, created_at, seed
-                        FROM generation_history
-                        WHERE content_type = ?
-                        ORDER BY created_at DESC
-                        LIMIT ?
-                    """, (content_type, limit))
-                else:
-                    cursor.execute("""
-                        SELECT id, content_type, content_id, template_name, constraints, created_at, seed
-                        FROM generation_history
-                        WHERE content_type = %s
-                        ORDER BY created_at DESC
-                        LIMIT %s
-                    """, (content_type, limit))
+                cursor.execute(self._dialect.select_history_by_type_sql, (content_type, limit))
             else:
-                if self.db_type == "sqlite":
-                    cursor.execute("""
-                        SELECT id, content_type, content_id, template_name, constraints, created_at, seed
-                        FROM generation_history
-                        ORDER BY created_at DESC
-                        LIMIT ?
-                    """, (limit,))
-                else:
-                    cursor.execute("""
-                        SELECT id, content_type, content_id, template_name, constraints, created_at, seed
-                        FROM generation_history
-                        ORDER BY created_at DESC
-                        LIMIT %s
-                    """, (limit,))
+                cursor.execute(self._dialect.select_history_sql, (limit,))
 
+            load_data = self._dialect.load_data
             results = []
-            for row in cursor.fetchall():
-                if self.db_type == "sqlite":
-                    results.append({
-                        "id": row[0],
-                        "content_type": row[1],
-                        "content_id": row[2],
-                        "template_name": row[3],
-                        "constraints": json.loads(row[4]) if row[4] else None,
-                        "created_at": row[5],
-                        "seed": row[6]
-                    })
-                else:
-                    results.append({
-                        "id": row["id"],
-                        "content_type": row["content_type"],
-                        "content_id": row["content_id"],
-                        "template_name": row["template_name"],
-                        "constraints": row["constraints"],
-                        "created_at": row["created_at"],
-                        "seed": row["seed"]
-                    })
+            for history_id, ctype, content_id, template_name, constraints, created_at, seed in cursor:
+                results.append({
+                    "id": history_id,
+                    "content_type": ctype,
+                    "content_id": content_id,
+                    "template_name": template_name,
+                    "constraints": load_data(constraints) if constraints else None,
+                    "created_at": created_at,
+                    "seed": seed
+                })
 
             return results
 
@@ -785,17 +1713,10 @@ class DatabaseManager:
             cursor = conn.cursor()
 
             if older_than_days:
-                if self.db_type == "sqlite":
-                    cursor.execute("""
-                        DELETE FROM generation_history
-                        WHERE created_at < datetime('now', '-' || ? || ' days')
-                    """, (older_than_days,))
-                else:
-                    cursor.execute("""
-                        DELETE FROM generation_history
-                        WHERE created_at < NOW() - INTERVAL '%s days'
-                    """, (older_than_days,))
+                # A constant bound against the indexed created_at column
+                cursor.execute(self._dialect.delete_history_sql,
+                               (self._dialect.history_cutoff(older_than_days),))
             else:
                 cursor.execute("DELETE FROM generation_history")
 
-            conn.commit()
+            self._commit(conn)
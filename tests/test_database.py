@@ -0,0 +1,492 @@
+"""
+Tests for the database integration layer (src/database.py).
+
+SQLite tests always run. PostgreSQL tests need psycopg2 and a server:
+point RGEN_TEST_POSTGRES_DSN at a database the tests may create a
+scratch schema in.
+"""
+
+import json
+import os
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from database import DatabaseManager, PG_COPY_MIN_ROWS, SQLITE_READER_POOL_SIZE
+
+POSTGRES_DSN = os.environ.get("RGEN_TEST_POSTGRES_DSN")
+
+
+def make_item(name="Sword", value=10, **fields):
+    """Build the smallest item save_item accepts."""
+    item = {"name": name, "type": "weapon", "subtype": "sword", "quality": "Fine",
+            "rarity": "Common", "value": value, "material": "Iron"}
+    item.update(fields)
+    return item
+
+
+def make_npc(name="Alda"):
+    """Build the smallest NPC save_npc accepts."""
+    return {"name": name, "title": "Smith"}
+
+
+def make_location(location_id="loc_1", name="Oakvale"):
+    """Build the smallest location save_location accepts."""
+    return {"id": location_id, "name": name, "type": "village"}
+
+
+def run_with_timeout(func, timeout=10):
+    """Run func on a worker thread, failing instead of hanging if it deadlocks."""
+    result = {}
+
+    def target():
+        result["value"] = func()
+
+    worker = threading.Thread(target=target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive(), "deadlocked"
+    return result["value"]
+
+
+@pytest.fixture
+def postgres_dsn():
+    """DSN whose search_path is a scratch PostgreSQL schema, dropped afterwards."""
+    psycopg2 = pytest.importorskip("psycopg2")
+    import psycopg2.extensions
+    if not POSTGRES_DSN:
+        pytest.skip("set RGEN_TEST_POSTGRES_DSN to run PostgreSQL tests")
+
+    schema = f"rg_test_{uuid.uuid4().hex[:12]}"
+    admin = psycopg2.connect(POSTGRES_DSN)
+    admin.autocommit = True
+    admin.cursor().execute(f"CREATE SCHEMA {schema}")
+    try:
+        yield psycopg2.extensions.make_dsn(POSTGRES_DSN, options=f"-c search_path={schema}")
+    finally:
+        admin.cursor().execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+@pytest.fixture
+def pg_db(postgres_dsn):
+    """DatabaseManager on a scratch PostgreSQL schema."""
+    db = DatabaseManager(postgres_dsn, "postgresql")
+    yield db
+    db.close()
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def open_db(request, tmp_path):
+    """Factory for DatabaseManagers on one fresh database, for each backend."""
+    if request.param == "sqlite":
+        db_path = str(tmp_path / "r_gen.db")
+    else:
+        db_path = request.getfixturevalue("postgres_dsn")
+
+    managers = []
+
+    def open_db(**kwargs):
+        db = DatabaseManager(db_path, request.param, **kwargs)
+        managers.append(db)
+        return db
+
+    yield open_db
+    for db in managers:
+        db.close()
+
+
+@pytest.fixture
+def db(open_db):
+    """DatabaseManager on a fresh database, for each backend."""
+    return open_db()
+
+
+def index_names(db):
+    """Names of the secondary indices that currently exist."""
+    with db._get_connection() as conn:
+        cursor = conn.cursor()
+        if db.db_type == "sqlite":
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+        else:
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()")
+        return {row[0] for row in cursor.fetchall()}
+
+
+class TestPostgreSQLPreparedSaves:
+    """Single-row saves on PostgreSQL go through per-connection prepared statements."""
+
+    def test_first_save_of_each_type(self, pg_db):
+        item_id = pg_db.save_item(make_item(), seed=1)
+        npc_id = pg_db.save_npc(make_npc(), archetype="smith", seed=2)
+        loc_id = pg_db.save_location(make_location(), seed=3)
+        world_id = pg_db.save_world({"locations": {}}, name="Realm", seed=4)
+
+        assert pg_db.get_item(item_id)["name"] == "Sword"
+        assert pg_db.get_npc(npc_id)["name"] == "Alda"
+        assert pg_db.get_location(loc_id)["name"] == "Oakvale"
+        assert pg_db.get_world(world_id) == {"locations": {}}
+        assert len(pg_db.get_history()) == 4
+
+    def test_repeated_saves_reuse_statement(self, pg_db):
+        ids = [pg_db.save_item(make_item(name=f"Sword {i}")) for i in range(3)]
+        assert len(set(ids)) == 3
+        assert [pg_db.get_item(i)["name"] for i in ids] == ["Sword 0", "Sword 1", "Sword 2"]
+
+    def test_failed_save_keeps_connection_usable(self, pg_db):
+        pg_db.save_location(make_location())
+        with pytest.raises(Exception):
+            # location_id is UNIQUE
+            pg_db.save_location(make_location())
+        loc_id = pg_db.save_location(make_location(location_id="loc_2"))
+        assert pg_db.get_location(loc_id)["id"] == "loc_2"
+
+
+class TestIterSearchItems:
+    """iter_search_items must not hold a shared connection while the caller works."""
+
+    def test_memory_database_allows_calls_while_iterating(self):
+        # Not closed: after a deadlock close() would wait on the same lock
+        db = DatabaseManager(":memory:", "sqlite")
+        item_ids = [db.save_item(make_item(name=f"Sword {i}")) for i in range(3)]
+
+        def iterate():
+            names = []
+            for item in db.iter_search_items():
+                names.append(item["name"])
+                db.get_item(item_ids[0])
+                db.save_item(make_item(name="Copy"))
+            return names
+
+        assert run_with_timeout(iterate) == ["Sword 0", "Sword 1", "Sword 2"]
+        assert len(db.search_items()) == 6
+
+    def test_reads_while_reader_pool_checked_out(self, tmp_path):
+        db = DatabaseManager(str(tmp_path / "pool.db"), "sqlite")
+        item_id = db.save_item(make_item())
+
+        def read():
+            # Each open generator holds a pooled connection; later ones overflow
+            iterators = [db.iter_search_items() for _ in range(SQLITE_READER_POOL_SIZE + 1)]
+            names = [next(iterator)["name"] for iterator in iterators]
+            item = db.get_item(item_id)
+            for iterator in iterators:
+                iterator.close()
+            return names, item
+
+        names, item = run_with_timeout(read)
+        assert names == ["Sword"] * (SQLITE_READER_POOL_SIZE + 1)
+        assert item == make_item()
+        assert db._readers.qsize() == SQLITE_READER_POOL_SIZE
+        db.close()
+
+    def test_postgresql_iterators_open_together(self, pg_db):
+        pg_db.save_items_bulk([make_item(name="A"), make_item(name="B")])
+
+        with pg_db.transaction():
+            outer = pg_db.iter_search_items()
+            inner = pg_db.iter_search_items()
+            outer_names = [next(outer)["name"]]
+            inner_names = [item["name"] for item in inner]
+            outer_names += [item["name"] for item in outer]
+
+        assert sorted(outer_names) == ["A", "B"]
+        assert sorted(inner_names) == ["A", "B"]
+
+
+class TestBulkSaves:
+    """The save_*_bulk methods write one transaction and return IDs in input order."""
+
+    @pytest.mark.parametrize("count", [3, PG_COPY_MIN_ROWS])
+    def test_items_in_input_order(self, db, count):
+        items = [make_item(name=f"Item {i}", value=i) for i in range(count)]
+        item_ids = db.save_items_bulk(items, template_name="weapon_melee", seed=7)
+
+        assert len(set(item_ids)) == count
+        for i in (0, count // 2, count - 1):
+            assert db.get_item(item_ids[i]) == items[i]
+        history = db.get_history(content_type="item", limit=count + 1)
+        assert sorted(record["content_id"] for record in history) == sorted(item_ids)
+        assert {record["template_name"] for record in history} == {"weapon_melee"}
+
+    def test_npcs_locations_and_worlds(self, db):
+        npc_ids = db.save_npcs_bulk([make_npc("A"), make_npc("B")], archetype="smith")
+        loc_ids = db.save_locations_bulk([make_location("l1", "One"), make_location("l2", "Two")])
+        world_ids = db.save_worlds_bulk([{"locations": {}}, {"locations": {"l1": {}}}], names=["W1", None])
+
+        assert [db.get_npc(i)["name"] for i in npc_ids] == ["A", "B"]
+        assert [db.get_location(i)["name"] for i in loc_ids] == ["One", "Two"]
+        assert [db.get_world(i)["locations"] for i in world_ids] == [{}, {"l1": {}}]
+
+    def test_empty_batches(self, db):
+        assert db.save_items_bulk([]) == []
+        assert db.save_worlds_bulk([]) == []
+        assert db.get_history() == []
+
+    def test_animals_and_flora(self, tmp_path):
+        # Only the SQLite schema has these tables
+        db = DatabaseManager(str(tmp_path / "r_gen.db"), "sqlite")
+        animal_ids = db.save_animals_bulk([
+            {"name": f"Wolf {i}", "species": "wolf", "category": "predator"} for i in range(3)
+        ])
+        flora_ids = db.save_flora_bulk([
+            {"name": "Fern", "species": "fern", "category": "plant", "magical": True}
+        ])
+        db.close()
+
+        assert len(set(animal_ids)) == 3
+        assert len(flora_ids) == 1
+
+
+class TestRawItems:
+    """save_item_raw stores JSON text and lets the database fill the columns."""
+
+    @pytest.mark.parametrize("encode", [False, True])
+    def test_round_trip(self, db, encode):
+        item = make_item(name="Raw", value=42, stats={"damage": 5})
+        data_json = json.dumps(item)
+        item_id = db.save_item_raw(data_json.encode() if encode else data_json, seed=3)
+
+        assert db.get_item(item_id) == item
+        assert db.search_items({"type": "weapon", "min_value": 42}) == [item]
+
+
+class TestTransaction:
+    """transaction() commits its saves together or not at all."""
+
+    def test_commit(self, db):
+        with db.transaction():
+            item_id = db.save_item(make_item())
+            npc_id = db.save_npc(make_npc(), archetype="smith")
+            # Reads inside the block see its uncommitted saves
+            assert db.get_item(item_id)["name"] == "Sword"
+
+        assert db.get_item(item_id)["name"] == "Sword"
+        assert db.get_npc(npc_id)["name"] == "Alda"
+        assert len(db.get_history()) == 2
+
+    def test_rollback(self, db):
+        kept_id = db.save_item(make_item(name="Kept"))
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                item_id = db.save_item(make_item(name="Lost"))
+                db.save_items_bulk([make_item(name="Lost too")])
+                assert db.get_item(item_id)["name"] == "Lost"
+                raise RuntimeError("abort")
+
+        assert [item["name"] for item in db.search_items()] == ["Kept"]
+        assert len(db.get_history()) == 1
+        # The read inside the block must not have been cached
+        assert db.get_item(item_id) is None
+
+    def test_nested_blocks_join_outer(self, db):
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.save_item(make_item(name="Outer"))
+                with db.transaction():
+                    db.save_item(make_item(name="Inner"))
+                raise RuntimeError("abort")
+
+        assert db.search_items() == []
+
+
+class TestBulkLoad:
+    """bulk_load() drops the secondary indices and always recreates them."""
+
+    def test_indices_restored(self, db):
+        expected = set(db._dialect.index_sql)
+        assert expected <= index_names(db)
+
+        with db.bulk_load():
+            assert not expected & index_names(db)
+            db.save_items_bulk([make_item(name=f"Item {i}") for i in range(10)])
+
+        assert expected <= index_names(db)
+        assert len(db.search_items({"type": "weapon"})) == 10
+
+    def test_indices_restored_after_error(self, db):
+        with pytest.raises(RuntimeError):
+            with db.bulk_load():
+                raise RuntimeError("abort")
+
+        assert set(db._dialect.index_sql) <= index_names(db)
+
+
+class TestDedupe:
+    """dedupe_cache_size makes identical saves return the earlier ID."""
+
+    def test_disabled_by_default(self, db):
+        assert db.save_item(make_item()) != db.save_item(make_item())
+
+    def test_identical_saves(self, open_db):
+        db = open_db(dedupe_cache_size=8)
+        item_id = db.save_item(make_item(), seed=1)
+
+        assert db.save_item(make_item(), seed=1) == item_id
+        assert db.save_item(make_item(), seed=2) != item_id
+        assert db.save_item(make_item(value=11), seed=1) != item_id
+        npc_id = db.save_npc(make_npc(), archetype="smith")
+        assert db.save_npc(make_npc(), archetype="smith") == npc_id
+        assert len(db.search_items()) == 3
+
+    def test_cache_size_bound(self, open_db):
+        db = open_db(dedupe_cache_size=2)
+        first_id = db.save_item(make_item(name="First"))
+        db.save_item(make_item(name="Second"))
+        db.save_item(make_item(name="Third"))
+
+        # Evicted, so saved again
+        assert db.save_item(make_item(name="First")) != first_id
+
+    def test_rolled_back_save_not_remembered(self, open_db):
+        db = open_db(dedupe_cache_size=8)
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.save_item(make_item())
+                raise RuntimeError("abort")
+
+        item_id = db.save_item(make_item())
+        assert db.get_item(item_id)["name"] == "Sword"
+
+
+class TestDataFilters:
+    """data_filters compare fields inside the item JSON."""
+
+    @pytest.fixture
+    def items(self, db):
+        items = [
+            make_item(name="Dagger", value=5, stats={"damage": 4}, tags=["light"]),
+            make_item(name="Sword", value=10, stats={"damage": 9}),
+            make_item(name="Axe", value=20, stats={"damage": 12}, material="Steel"),
+        ]
+        db.save_items_bulk(items)
+        return items
+
+    def names(self, db, **kwargs):
+        return sorted(item["name"] for item in db.search_items(**kwargs))
+
+    def test_equal(self, db, items):
+        assert self.names(db, data_filters={"stats.damage": 9}) == ["Sword"]
+        assert self.names(db, data_filters={"name": "Axe"}) == ["Axe"]
+
+    def test_range(self, db, items):
+        # Compared as numbers: 12 >= 9 even though "12" < "9" as text
+        assert self.names(db, data_filters={"stats.damage__gte": 9}) == ["Axe", "Sword"]
+        assert self.names(db, data_filters={"stats.damage__lte": 9}) == ["Dagger", "Sword"]
+        assert self.names(db, data_filters={"stats.damage__gte": 5, "stats.damage__lte": 10}) == ["Sword"]
+
+    def test_with_column_filters(self, db, items):
+        assert self.names(db, filters={"material": "Iron"}, data_filters={"stats.damage__gte": 4}) == [
+            "Dagger", "Sword"]
+        assert self.names(db, filters={"min_value": 10}, data_filters={"stats.damage__lte": 9}) == ["Sword"]
+
+    def test_missing_field_never_matches(self, db, items):
+        assert self.names(db, data_filters={"stats.speed__gte": 0}) == []
+
+    def test_limit_and_iterator(self, db, items):
+        assert len(db.search_items(limit=2)) == 2
+        assert sorted(item["name"] for item in db.iter_search_items(data_filters={"stats.damage__gte": 9})) == [
+            "Axe", "Sword"]
+
+
+class TestFieldAccess:
+    """get_*_field extracts one value without loading the whole document."""
+
+    def test_fields(self, db):
+        item_id = db.save_item(make_item(stats={"damage": 9}, tags=["sharp", "iron"]))
+        world_id = db.save_world({"name": "Realm", "locations": {"l1": {"name": "One"}}}, name="Realm")
+
+        assert db.get_item_field(item_id, "stats.damage") == 9
+        assert db.get_item_field(item_id, "stats") == {"damage": 9}
+        assert db.get_item_field(item_id, "tags.1") == "iron"
+        assert db.get_world_field(world_id, "locations.l1.name") == "One"
+
+    def test_missing(self, db):
+        item_id = db.save_item(make_item())
+
+        assert db.get_item_field(item_id, "stats.damage") is None
+        assert db.get_item_field(item_id + 1000, "name") is None
+        assert db.get_npc_field(1, "name") is None
+
+
+class TestReads:
+    """Getters return fresh objects and see every save."""
+
+    def test_returned_objects_are_independent(self, db):
+        item_id = db.save_item(make_item(stats={"damage": 9}))
+
+        first = db.get_item(item_id)
+        first["stats"]["damage"] = 0
+        assert db.get_item(item_id)["stats"]["damage"] == 9
+
+    def test_missing_rows(self, db):
+        assert db.get_item(1) is None
+        assert db.get_world(1) is None
+
+    def test_iter_world_locations(self, db):
+        locations = {"l1": {"name": "One"}, "l2": {"name": "Two"}, "l3": {"name": "Three"}}
+        world_id = db.save_world({"name": "Realm", "locations": locations})
+
+        assert list(db.iter_world_locations(world_id)) == list(locations.items())
+        assert list(db.iter_world_locations(world_id + 1)) == []
+
+
+class TestIterWorldLocations:
+    """iter_world_locations must not hold a shared connection while the caller works."""
+
+    LOCATIONS = {"l1": {"name": "One"}, "l2": {"name": "Two"}, "l3": {"name": "Three"}}
+
+    def iterate(self, db):
+        item_id = db.save_item(make_item())
+        world_id = db.save_world({"name": "Realm", "locations": self.LOCATIONS})
+
+        def iterate():
+            pairs = []
+            for location_id, location in db.iter_world_locations(world_id):
+                pairs.append((location_id, location))
+                assert db.get_item(item_id)["name"] == "Sword"
+            return pairs
+
+        assert run_with_timeout(iterate) == list(self.LOCATIONS.items())
+
+    def test_streamed_from_file_database(self, tmp_path):
+        pytest.importorskip("ijson")
+        db = DatabaseManager(str(tmp_path / "r_gen.db"), "sqlite")
+        self.iterate(db)
+        db.close()
+
+    def test_memory_database_allows_calls_while_iterating(self):
+        pytest.importorskip("ijson")
+        # Not closed: after a deadlock close() would wait on the same lock
+        self.iterate(DatabaseManager(":memory:", "sqlite"))
+
+
+class TestHistory:
+    """Every save records generation history."""
+
+    def test_records(self, db):
+        item_id = db.save_item(make_item(), template_name="weapon_melee", constraints={"rarity": "Rare"}, seed=5)
+        db.save_npc(make_npc(), archetype="smith")
+
+        item_history = db.get_history(content_type="item")
+        assert len(item_history) == 1
+        assert item_history[0]["content_id"] == item_id
+        assert item_history[0]["constraints"] == {"rarity": "Rare"}
+        assert item_history[0]["seed"] == 5
+        assert len(db.get_history()) == 2
+        assert len(db.get_history(limit=1)) == 1
+
+    def test_clear(self, db):
+        db.save_item(make_item())
+
+        db.clear_history(older_than_days=1)
+        assert len(db.get_history()) == 1
+        db.clear_history()
+        assert db.get_history() == []
@@ -0,0 +1,163 @@
+"""
+Tests for the game server database (Game/game_database.py).
+"""
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add Game directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Game"))
+
+from game_database import GameDatabase, SQLITE_POOL_SIZE
+
+
+@pytest.fixture
+def game_db(tmp_path, monkeypatch):
+    # The migrations expect tables from an older schema
+    monkeypatch.setattr(GameDatabase, "_migrate_database", lambda self, cursor: None)
+    database = GameDatabase(str(tmp_path / "game.db"))
+    yield database
+    database.close()
+
+
+class TestSession:
+    """session() shares one connection across the calls made inside it."""
+
+    def test_calls_share_connection(self, game_db):
+        with game_db.session():
+            with game_db._get_connection() as first, game_db._get_connection() as second:
+                assert first is second
+            game_db.set_setting("motd", "hello")
+            assert game_db.get_setting("motd") == "hello"
+
+        assert game_db.get_setting("motd") == "hello"
+
+    def test_failed_call_rolled_back(self, game_db):
+        with game_db.session():
+            with pytest.raises(RuntimeError):
+                with game_db._get_connection() as conn:
+                    conn.execute("INSERT INTO settings (key, value) VALUES ('partial', '1')")
+                    raise RuntimeError("failed half way")
+            # Must not commit the failed call's insert along with its own
+            game_db.set_setting("motd", "hello")
+
+        assert game_db.get_setting("partial") is None
+        assert game_db.get_setting("motd") == "hello"
+
+
+class TestConnectionPool:
+    """Connections are returned to a bounded pool and reused."""
+
+    def test_connection_reused(self, game_db):
+        with game_db._get_connection() as first:
+            pass
+        with game_db._get_connection() as second:
+            assert second is first
+
+    def test_pool_size_bound(self, game_db):
+        def hold(depth):
+            if depth == 0:
+                return
+            with game_db._get_connection():
+                hold(depth - 1)
+
+        hold(SQLITE_POOL_SIZE + 2)
+        assert game_db._pool.qsize() == SQLITE_POOL_SIZE
+
+    def test_failed_write_rolled_back(self, game_db):
+        with pytest.raises(RuntimeError):
+            with game_db._get_connection() as conn:
+                conn.execute("INSERT INTO settings (key, value) VALUES ('partial', '1')")
+                raise RuntimeError("failed half way")
+
+        with game_db._get_connection() as conn:
+            assert not conn.in_transaction
+        assert game_db.get_setting("partial") is None
+
+    def test_threads(self, game_db):
+        errors = []
+
+        def create(n):
+            try:
+                game_db.create_player(f"player{n}", "hash", f"Hero {n}")
+            except sqlite3.Error as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=create, args=(n,)) for n in range(SQLITE_POOL_SIZE * 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert game_db.get_player_by_username("player3")["character_name"] == "Hero 3"
+
+    def test_close(self, game_db):
+        game_db.get_setting("motd")
+        game_db.close()
+        assert game_db._pool.qsize() == 0
+
+
+class TestGeneratedItemsBulk:
+    """save_generated_items_bulk inserts in one transaction and returns IDs in input order."""
+
+    def test_ids_in_input_order(self, game_db):
+        existing_id = game_db.save_generated_item("Old Axe", "weapon", {"damage": 1})
+        items = [(f"Sword {n}", "weapon", {"damage": n, "tags": ["sharp"]}) for n in range(5)]
+
+        item_ids = game_db.save_generated_items_bulk(items)
+
+        assert len(item_ids) == 5 and existing_id not in item_ids
+        saved = {item["id"]: item for item in game_db.get_all_generated_items()}
+        for item_id, (name, item_type, data) in zip(item_ids, items):
+            assert (saved[item_id]["item_name"], saved[item_id]["item_type"], saved[item_id]["data"]) == (
+                name, item_type, data)
+
+    def test_empty(self, game_db):
+        assert game_db.save_generated_items_bulk([]) == []
+        assert game_db.get_all_generated_items() == []
+
+
+class TestRemoveFromInventory:
+    """remove_from_inventory reduces a stack, or deletes it when the whole stack is taken."""
+
+    @pytest.fixture
+    def stack(self, game_db):
+        player_id = game_db.create_player("alda", "hash", "Alda")
+        inventory_id = game_db.add_to_inventory(player_id, "Arrow", "ammo", {}, quantity=10)
+        return player_id, inventory_id
+
+    @staticmethod
+    def quantities(game_db, player_id):
+        return [item["quantity"] for item in game_db.get_player_inventory(player_id)]
+
+    def test_partial(self, game_db, stack):
+        player_id, inventory_id = stack
+        assert game_db.remove_from_inventory(player_id, inventory_id, 3)
+        assert self.quantities(game_db, player_id) == [7]
+
+    def test_whole_stack_by_quantity(self, game_db, stack):
+        player_id, inventory_id = stack
+        assert game_db.remove_from_inventory(player_id, inventory_id, 10)
+        assert self.quantities(game_db, player_id) == []
+
+    def test_whole_stack(self, game_db, stack):
+        player_id, inventory_id = stack
+        assert game_db.remove_from_inventory(player_id, inventory_id)
+        assert self.quantities(game_db, player_id) == []
+
+    def test_more_than_stack(self, game_db, stack):
+        player_id, inventory_id = stack
+        assert not game_db.remove_from_inventory(player_id, inventory_id, 11)
+        assert self.quantities(game_db, player_id) == [10]
+
+    def test_other_players_stack(self, game_db, stack):
+        player_id, inventory_id = stack
+        other_id = game_db.create_player("brom", "hash", "Brom")
+        assert not game_db.remove_from_inventory(other_id, inventory_id, 1)
+        assert not game_db.remove_from_inventory(other_id, inventory_id)
+        assert self.quantities(game_db, player_id) == [10]